@@ -0,0 +1,146 @@
+"""Benchmark cache value encodings on realistic search-result payloads.
+
+Compares the previous on-disk formats (pretty-printed JSON as written by the
+legacy JSON-dir backend, plain JSON text as written to SQLite) with the
+compact encodings from `cache_store.encode_value`, reporting bytes per entry
+and encode/decode latency, plus end-to-end SQLite write/read latency.
+
+Usage:
+    python benchmarks/cache_encoding.py [--entries 500] > bench_output.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from mcp_search_server import cache_store
+
+WORDS = (
+    "python asyncio cache latency search engine results news feed release "
+    "performance Überblick données 検索 análisis research article guide tutorial "
+    "benchmark compression sqlite server protocol model context tooling"
+).split()
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+def search_results(rng: random.Random, count: int = 20) -> list[dict[str, Any]]:
+    """A result list shaped like `search_with_fallback` output."""
+    results = []
+    for i in range(count):
+        domain = rng.choice(
+            ["example.com", "docs.python.org", "news.ycombinator.com", "lemonde.fr"]
+        )
+        results.append(
+            {
+                "title": _sentence(rng, rng.randint(5, 12)),
+                "url": f"https://{domain}/{rng.choice(WORDS)}/{i}-{rng.randint(1000, 9999)}",
+                "snippet": " ".join(_sentence(rng, rng.randint(8, 16)) for _ in range(2)),
+                "source": "duckduckgo",
+            }
+        )
+    return results
+
+
+def enrich_preview(rng: random.Random) -> str:
+    """A ~600 character preview like `enrich._fetch_preview` stores."""
+    text = ""
+    while len(text) < 600:
+        text += _sentence(rng, rng.randint(8, 20)) + " "
+    return text[:600]
+
+
+FORMATS: dict[str, tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    "legacy-json-indent": (
+        lambda d: json.dumps(d, ensure_ascii=False, indent=2).encode("utf-8"),
+        lambda v: json.loads(v),
+    ),
+    "legacy-json-text": (
+        lambda d: json.dumps(d, ensure_ascii=False).encode("utf-8"),
+        lambda v: json.loads(v),
+    ),
+    "compact-none": (
+        lambda d: cache_store.encode_value(d, "none"),
+        cache_store.decode_value,
+    ),
+    "compact-zlib": (
+        lambda d: cache_store.encode_value(d, "zlib"),
+        cache_store.decode_value,
+    ),
+}
+if cache_store.ZSTD_AVAILABLE:
+    FORMATS["compact-zstd"] = (
+        lambda d: cache_store.encode_value(d, "zstd"),
+        cache_store.decode_value,
+    )
+
+
+def _us(samples: list[float]) -> str:
+    return f"{statistics.median(samples) * 1e6:9.1f}"
+
+
+def bench_codecs(name: str, payloads: list[Any]) -> None:
+    print(f"\n## {name} ({len(payloads)} entries)")
+    print(f"{'format':<20} {'bytes/entry':>12} {'enc us':>9} {'dec us':>9}")
+    for fmt, (encode, decode) in FORMATS.items():
+        sizes, enc, dec = [], [], []
+        for payload in payloads:
+            started = time.perf_counter()
+            blob = encode(payload)
+            enc.append(time.perf_counter() - started)
+            started = time.perf_counter()
+            decode(blob)
+            dec.append(time.perf_counter() - started)
+            sizes.append(len(blob))
+        print(f"{fmt:<20} {statistics.mean(sizes):12.0f} {_us(enc)} {_us(dec)}")
+
+
+def bench_sqlite(payloads: list[Any]) -> None:
+    print(f"\n## SqliteBackend end-to-end ({len(payloads)} result lists)")
+    print(f"{'codec':<20} {'file bytes':>12} {'write us':>9} {'read us':>9}")
+    codecs = ["none", "zlib"] + (["zstd"] if cache_store.ZSTD_AVAILABLE else [])
+    for codec in codecs:
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = cache_store.SqliteBackend(Path(tmp) / "bench.sqlite3", codec=codec)
+            writes, reads = [], []
+            for i, payload in enumerate(payloads):
+                started = time.perf_counter()
+                backend.set_many([(f"k{i}", time.time(), payload, "web")])
+                writes.append(time.perf_counter() - started)
+            for i in range(len(payloads)):
+                started = time.perf_counter()
+                backend.get(f"k{i}")
+                reads.append(time.perf_counter() - started)
+            backend._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            backend.close()
+            size = (Path(tmp) / "bench.sqlite3").stat().st_size
+        print(f"{codec:<20} {size:12d} {_us(writes)} {_us(reads)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = [search_results(rng) for _ in range(args.entries)]
+    previews = [enrich_preview(rng) for _ in range(args.entries)]
+
+    print(f"zstandard available: {cache_store.ZSTD_AVAILABLE}")
+    bench_codecs("search results (20 per entry)", results)
+    bench_codecs("enrich previews", previews)
+    bench_sqlite(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Benchmark one shared lxml parse against per-extractor parsing of a page.
+
+Previously every HTML extractor received the decoded page text and built its
+own document: trafilatura once per pass, readability and newspaper once each,
+and the bs4 method with BeautifulSoup's pure-Python `html.parser`. Now
+`HtmlDocument` parses the response bytes once and the extractors share (or
+copy) that tree. This runs the four extractors over synthetic article pages
+of increasing size both ways, and reports the median time per extractor and
+per page, plus the characters each extractor returned so the outputs can be
+compared.
+
+Usage:
+    python benchmarks/html_parsing.py [--sizes 50,500,3000] [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from typing import Any, Callable
+
+import lxml.html
+from bs4 import BeautifulSoup
+
+from mcp_search_server.tools.web import link_parser
+from mcp_search_server.tools.web.html_document import HtmlDocument
+
+URL = "https://example.com/news/2024/benchmark-article"
+
+WORDS = (
+    "python asyncio extraction latency parser document article paragraph "
+    "performance Überblick données 検索 análisis research release server model "
+    "benchmark browser content tree token encoding library network "
+    "the of and to in is that with for this was on are by"
+).split()
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+def article_page(rng: random.Random, size_kb: int) -> bytes:
+    """A news-style page: head metadata, navigation, article, sidebar and scripts."""
+    head = (
+        "<!DOCTYPE html><html lang='en'><head><meta charset='utf-8'>"
+        "<title>Benchmark article</title>"
+        "<meta name='description' content='A synthetic article for parser benchmarks.'>"
+        "<meta name='author' content='Jane Doe'>"
+        "<meta property='article:published_time' content='2024-05-01T10:00:00Z'>"
+        "<script>window.dataLayer = [];</script><style>body { margin: 0 }</style></head>"
+    )
+    nav = (
+        "<header><nav>"
+        + "".join(f"<a href='/s/{w}'>{w}</a>" for w in WORDS[:12])
+        + "</nav></header>"
+    )
+    parts = [head, "<body>", nav, "<main><article><h1>Benchmark article</h1>"]
+    size = sum(len(p) for p in parts)
+    section = 0
+    while size < size_kb * 1024:
+        section += 1
+        block = [f"<h2>Section {section}</h2>"]
+        for _ in range(rng.randint(3, 6)):
+            text = " ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(2, 5)))
+            block.append(f"<p>{text} <a href='/ref/{section}'>{rng.choice(WORDS)}</a></p>")
+        if section % 4 == 0:
+            block.append("<div class='ad-slot'><p>Advertisement</p></div>")
+            block.append(f"<ul>{''.join(f'<li>{_sentence(rng, 6)}</li>' for _ in range(4))}</ul>")
+        chunk = "".join(block)
+        parts.append(chunk)
+        size += len(chunk)
+    parts.append(
+        "</article></main><aside class='sidebar'><p>Related stories</p></aside>"
+        "<footer><p>Copyright</p></footer><script>track();</script></body></html>"
+    )
+    return "".join(parts).encode("utf-8")
+
+
+class PerMethodDocument(HtmlDocument):
+    """The previous behaviour: each extractor builds its own tree from the decoded text."""
+
+    @property
+    def tree(self) -> lxml.html.HtmlElement:
+        return lxml.html.document_fromstring(self.text)
+
+    def copy_tree(self) -> lxml.html.HtmlElement:
+        return self.tree
+
+
+def _legacy_bs4(document: HtmlDocument, url: str) -> str:
+    """The previous bs4 method (its article and main steps): `html.parser` on the text."""
+    soup = BeautifulSoup(document.text, "html.parser")
+    for tag in soup.find_all(list(link_parser.BS4_UNWANTED_TAGS)):
+        tag.decompose()
+    ads = link_parser.BS4_AD_CLASSES
+    for element in soup.find_all(class_=lambda c: c and any(ad in c.lower() for ad in ads)):
+        element.decompose()
+    content = ""
+    for name in ("article", "main"):
+        tag = soup.find(name)
+        if tag:
+            for p in tag.find_all("p"):
+                content += p.get_text(separator="\n", strip=True) + "\n\n"
+            if content.strip():
+                return content.strip()
+    return content.strip()
+
+
+def _trafilatura(document: HtmlDocument, url: str) -> str:
+    return link_parser._trafilatura_parse(document, url)[0]
+
+
+def _readability(document: HtmlDocument, url: str) -> str:
+    return link_parser._readability_parse(document)
+
+
+EXTRACTORS: dict[str, tuple[Callable[..., str], Callable[..., str]]] = {
+    # name: (per-method, shared)
+    "trafilatura": (_trafilatura, _trafilatura),
+    "readability": (_readability, _readability),
+    "newspaper": (link_parser._newspaper_parse_html, link_parser._newspaper_parse_html),
+    "bs4": (_legacy_bs4, link_parser._parse_bs4),
+}
+
+
+def run_chain(document: HtmlDocument, shared: bool) -> dict[str, Any]:
+    """Run every extractor over `document`; returns seconds and output length per method."""
+    timings: dict[str, Any] = {}
+    started = time.perf_counter()
+    if shared:
+        document.tree  # noqa: B018 - the single parse, counted in the page total
+    for name, (per_method, shared_fn) in EXTRACTORS.items():
+        fn = shared_fn if shared else per_method
+        method_started = time.perf_counter()
+        output = fn(document, URL)
+        timings[name] = (time.perf_counter() - method_started, len(output))
+    timings["page"] = (time.perf_counter() - started, 0)
+    return timings
+
+
+def bench(size_kb: int, body: bytes, rounds: int) -> None:
+    print(f"\n## {size_kb} KB page ({len(body)} bytes), median of {rounds} rounds")
+    print(f"{'step':<14} {'per-method ms':>14} {'shared ms':>10} {'chars':>14}")
+    samples: dict[bool, dict[str, list]] = {False: {}, True: {}}
+    for _ in range(rounds):
+        for shared in (False, True):
+            cls = HtmlDocument if shared else PerMethodDocument
+            for name, value in run_chain(cls(body, "utf-8"), shared).items():
+                samples[shared].setdefault(name, []).append(value)
+    for name in [*EXTRACTORS, "page"]:
+        before = statistics.median(s for s, _ in samples[False][name]) * 1000
+        after = statistics.median(s for s, _ in samples[True][name]) * 1000
+        chars = (
+            f"{samples[False][name][0][1]}/{samples[True][name][0][1]}" if name != "page" else ""
+        )
+        print(f"{name:<14} {before:14.1f} {after:10.1f} {chars:>14}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="50,500,3000", help="Page sizes in KB")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for size_kb in (int(s) for s in args.sizes.split(",")):
+        bench(size_kb, article_page(rng, size_kb), args.rounds)
+
+
+if __name__ == "__main__":
+    main()
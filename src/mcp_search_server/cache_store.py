@@ -1,81 +1,948 @@
-"""Simple JSON file cache with TTL."""
+"""JSON cache with TTL on top of a pluggable disk backend.
+
+Two backends are available (`cache.backend` in `search_config.json`):
+
+- ``sqlite`` (default): one WAL-mode SQLite file with an index on the write
+  timestamp. Lookups are a single keyed read and expired rows can be purged
+  by timestamp. Values are minified JSON compressed with zstd (if installed)
+  or zlib behind a small version header (`encode_value`); rows written as
+  plain JSON text by older versions are still read.
+- ``json``: the legacy layout, one JSON file per key named by MD5. It does
+  not record entry kinds, so the janitor below does not clean it up.
+
+Entries written by the legacy backend are imported into SQLite the first time
+the SQLite store is opened on the same cache directory.
+
+Every entry carries a kind ('web', 'news', 'rss', 'enrich', 'maps', ...). A
+background `CacheJanitor` purges entries past their kind's TTL and evicts the
+least recently (LRU) or least frequently (LFU) used entries of kinds that are
+over their byte quota (`cache.max_bytes`).
+
+Reads go through an in-process L1 `MemoryTier` first (`cache.memory.max_bytes`),
+then the disk backend. Writes populate both tiers; disk hits are promoted to
+L1. Hit/miss counters per tier are available from `get_cache_stats()`.
+
+Async handlers use `aget_cached_json`/`aset_cached_json`: L1 is consulted
+inline, disk reads run on a small dedicated executor and disk writes are
+coalesced into batches by `CacheWriter`.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import json
 import logging
+import sqlite3
+import threading
 import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
-from .config_loader import get_cache_dir
+from .config_loader import (
+    get_cache_backend_name,
+    get_cache_compression,
+    get_cache_dir,
+    get_cache_eviction_policy,
+    get_cache_io_config,
+    get_cache_janitor_interval_seconds,
+    get_cache_memory_max_bytes,
+    get_cache_quota_bytes,
+    get_cache_stale_grace_seconds,
+    get_cache_ttl_seconds,
+    get_negative_cache_ttl_seconds,
+)
 
 logger = logging.getLogger(__name__)
 
+SQLITE_FILENAME = "cache.sqlite3"
 
-def _cache_path(cache_dir: Path, cache_key: str) -> Path:
-    key_hash = hashlib.md5(cache_key.encode("utf-8")).hexdigest()
-    return cache_dir / f"{key_hash}.json"
 
+try:
+    import zstandard
 
-def get_cached_json(cache_key: str, ttl_seconds: int, *, no_cache: bool = False) -> Optional[Any]:
-    """Get cached JSON data if present and not expired.
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Encoded values: magic, format version, codec id, then the (compressed) payload.
+ENCODING_MAGIC = b"MSC"
+ENCODING_VERSION = 1
+CODECS = {"none": 0, "zlib": 1, "zstd": 2}
+COMPRESS_MIN_BYTES = 256
+
+
+def resolve_codec(name: str = "auto") -> str:
+    """Map a configured codec name to one usable in this process."""
+    if name == "auto" or (name == "zstd" and not ZSTD_AVAILABLE):
+        return "zstd" if ZSTD_AVAILABLE else "zlib"
+    return name if name in CODECS else "zlib"
+
+
+def encode_value(data: Any, codec: str = "zlib") -> bytes:
+    """Serialize `data` as minified UTF-8 JSON, compressed with `codec`.
+
+    Payloads under `COMPRESS_MIN_BYTES` are stored uncompressed.
+    """
+    raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if codec == "none" or len(raw) < COMPRESS_MIN_BYTES:
+        codec, payload = "none", raw
+    elif codec == "zstd":
+        payload = zstandard.ZstdCompressor(level=3).compress(raw)
+    else:
+        codec, payload = "zlib", zlib.compress(raw, 6)
+    return ENCODING_MAGIC + bytes((ENCODING_VERSION, CODECS[codec])) + payload
+
+
+def decode_value(value: Any) -> Any:
+    """Decode a value written by `encode_value` or a legacy plain JSON string."""
+    if isinstance(value, memoryview):
+        value = value.tobytes()
+    if isinstance(value, bytes) and value[:3] == ENCODING_MAGIC:
+        version, codec_id, payload = value[3], value[4], value[5:]
+        if version != ENCODING_VERSION:
+            raise ValueError(f"Unsupported cache encoding version {version}")
+        if codec_id == CODECS["zlib"]:
+            payload = zlib.decompress(payload)
+        elif codec_id == CODECS["zstd"]:
+            if not ZSTD_AVAILABLE:
+                raise ValueError("Cache entry is zstd-compressed but zstandard is not installed")
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        return json.loads(payload)
+    return json.loads(value)
+
+
+def _key_hash(cache_key: str) -> str:
+    return hashlib.md5(cache_key.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """Storage for cache entries addressed by key hash.
+
+    Entries are stored as ``(timestamp, data)``; TTL is applied by the caller.
+    Backends that cannot account for size or usage keep the default no-op
+    eviction methods.
+    """
+
+    @abstractmethod
+    def get(self, key_hash: str) -> Optional[tuple[float, Any]]:
+        """Return ``(timestamp, data)`` or None if the key is absent."""
+
+    @abstractmethod
+    def set_many(self, items: Iterable[tuple[str, float, Any, str]]) -> None:
+        """Store ``(key_hash, timestamp, data, kind)`` entries in one batch."""
+
+    @abstractmethod
+    def purge_older_than(
+        self, cutoff: float, *, kind: Optional[str] = None, limit: Optional[int] = None
+    ) -> int:
+        """Delete entries written before `cutoff`; return how many were removed."""
+
+    def kinds(self) -> list[str]:
+        """Return the kinds present in the store."""
+        return []
+
+    def usage_bytes(self, kind: str) -> int:
+        """Return stored bytes for `kind`."""
+        return 0
+
+    def evict(self, kind: str, *, policy: str = "lru", limit: int = 100) -> int:
+        """Remove up to `limit` entries of `kind` chosen by `policy`."""
+        return 0
+
+    def flush(self) -> None:
+        """Persist buffered bookkeeping (e.g. access statistics); a no-op unless overridden."""
+        return None
+
+    def close(self) -> None:
+        """Release backend resources; a no-op unless overridden."""
+        return None
+
+
+class JsonDirBackend(CacheBackend):
+    """Legacy backend: one compact JSON file per key.
+
+    Entry kinds are not recorded in this layout, so `kinds()` stays empty and
+    the `CacheJanitor` neither purges nor evicts here: expired entries are only
+    ignored on read, and the directory is not bounded by `cache.max_bytes`.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key_hash: str) -> Optional[tuple[float, Any]]:
+        path = self.cache_dir / f"{key_hash}.json"
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        return float(payload.get("timestamp", 0)), payload.get("data")
+
+    def set_many(self, items: Iterable[tuple[str, float, Any, str]]) -> None:
+        for key_hash, timestamp, data, _kind in items:
+            path = self.cache_dir / f"{key_hash}.json"
+            payload = {"timestamp": timestamp, "data": data}
+            path.write_text(
+                json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+            )
+
+    def purge_older_than(
+        self, cutoff: float, *, kind: Optional[str] = None, limit: Optional[int] = None
+    ) -> int:
+        # Kind is not recorded in this layout; age is taken from the file mtime.
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            if limit is not None and removed >= limit:
+                break
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+class SqliteBackend(CacheBackend):
+    """Single-file WAL SQLite store with timestamp, kind and usage indexes.
+
+    Reads do not write: access times and hit counts are buffered in memory
+    and persisted by `flush()` (called by the janitor and on writes).
+    """
+
+    _COLUMNS = {
+        "kind": "TEXT NOT NULL DEFAULT ''",
+        "size": "INTEGER NOT NULL DEFAULT 0",
+        "last_access": "REAL NOT NULL DEFAULT 0",
+        "hits": "INTEGER NOT NULL DEFAULT 0",
+    }
+
+    def __init__(self, db_path: Path, codec: str = "auto"):
+        self.db_path = db_path
+        self.codec = resolve_codec(codec)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._touches: dict[str, tuple[float, int]] = {}
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=10)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, ts REAL NOT NULL, value TEXT NOT NULL)"
+            )
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+            for column, ddl in self._COLUMNS.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE entries ADD COLUMN {column} {ddl}")
+            self._conn.execute(
+                "UPDATE entries SET size = length(value), last_access = ts WHERE size = 0"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS entries_ts ON entries (ts)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_kind_access ON entries (kind, last_access)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_kind_hits ON entries (kind, hits)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key_hash: str) -> Optional[tuple[float, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT ts, value FROM entries WHERE key = ?", (key_hash,)
+            ).fetchone()
+            if row is not None:
+                _, hits = self._touches.get(key_hash, (0.0, 0))
+                self._touches[key_hash] = (time.time(), hits + 1)
+        if row is None:
+            return None
+        return float(row[0]), decode_value(row[1])
+
+    def set_many(self, items: Iterable[tuple[str, float, Any, str]]) -> None:
+        rows = []
+        for key_hash, timestamp, data, kind in items:
+            value = encode_value(data, self.codec)
+            rows.append((key_hash, timestamp, value, kind or "", len(value), timestamp))
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (key, ts, value, kind, size, last_access, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                rows,
+            )
+            self._flush_touches_locked()
+            self._conn.commit()
+
+    def _flush_touches_locked(self) -> None:
+        if not self._touches:
+            return
+        updates = [(ts, hits, key) for key, (ts, hits) in self._touches.items()]
+        self._touches.clear()
+        self._conn.executemany(
+            "UPDATE entries SET last_access = ?, hits = hits + ? WHERE key = ?", updates
+        )
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_touches_locked()
+            self._conn.commit()
+
+    def purge_older_than(
+        self, cutoff: float, *, kind: Optional[str] = None, limit: Optional[int] = None
+    ) -> int:
+        where = "ts < ?"
+        params: list[Any] = [cutoff]
+        if kind is not None:
+            where += " AND kind = ?"
+            params.append(kind)
+        if limit is not None:
+            sql = (
+                f"DELETE FROM entries WHERE key IN (SELECT key FROM entries WHERE {where} LIMIT ?)"
+            )
+            params.append(limit)
+        else:
+            sql = f"DELETE FROM entries WHERE {where}"
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            self._conn.commit()
+        return cursor.rowcount
+
+    def kinds(self) -> list[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT DISTINCT kind FROM entries")]
+
+    def usage_bytes(self, kind: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries WHERE kind = ?", (kind,)
+            ).fetchone()
+        return int(row[0])
+
+    def evict(self, kind: str, *, policy: str = "lru", limit: int = 100) -> int:
+        order = "hits ASC, last_access ASC" if policy == "lfu" else "last_access ASC"
+        with self._lock:
+            self._flush_touches_locked()
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                f"(SELECT key FROM entries WHERE kind = ? ORDER BY {order} LIMIT ?)",
+                (kind, limit),
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def get_meta(self, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches_locked()
+            self._conn.commit()
+            self._conn.close()
+
+
+def migrate_json_dir(
+    cache_dir: Path, backend: CacheBackend, *, remove: bool = True, batch_size: int = 500
+) -> int:
+    """Import legacy ``<md5>.json`` entries from `cache_dir` into `backend`.
 
     Args:
-        cache_key: Unique key for cache entry.
-        ttl_seconds: Time-to-live for this entry.
-        no_cache: If true, bypass cache.
+        cache_dir: Directory written by the legacy JSON backend.
+        backend: Destination backend.
+        remove: Delete each legacy file once it has been imported.
+        batch_size: Number of entries written per transaction.
 
     Returns:
-        Cached data or None.
+        Number of imported entries.
     """
-    if no_cache:
-        return None
+    imported = 0
+    batch: list[tuple[str, float, Any, str]] = []
+    done: list[Path] = []
+
+    def flush() -> None:
+        backend.set_many(batch)
+        if remove:
+            for path in done:
+                path.unlink(missing_ok=True)
+        batch.clear()
+        done.clear()
+
+    for path in cache_dir.glob("*.json"):
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            timestamp = float(payload.get("timestamp", 0))
+            batch.append((path.stem, timestamp, payload.get("data"), ""))
+            done.append(path)
+        except Exception as exc:
+            logger.debug(f"Skipping unreadable cache file {path}: {exc}")
+            continue
+        if len(batch) >= batch_size:
+            imported += len(batch)
+            flush()
+
+    imported += len(batch)
+    flush()
+    return imported
+
+
+class MemoryTier:
+    """In-process LRU tier holding decoded values under a byte budget.
+
+    Values are returned as stored (no copy, no JSON parsing); callers must treat
+    cached results as read-only. Expiry uses the TTL passed on read, the same
+    one applied to the disk tier.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: OrderedDict[str, tuple[float, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key_hash: str, ttl_seconds: int) -> Optional[Any]:
+        entry = self.get_entry(key_hash, ttl_seconds)
+        return entry[1] if entry else None
+
+    def get_entry(self, key_hash: str, max_age_seconds: int) -> Optional[tuple[float, Any]]:
+        """Return ``(timestamp, data)`` if stored and not older than `max_age_seconds`."""
+        with self._lock:
+            entry = self._entries.get(key_hash)
+            # Expired entries are left for LRU eviction: a reader with a longer
+            # window (stale-while-revalidate) may still use them.
+            if entry is None or (time.time() - entry[0]) > max_age_seconds:
+                return None
+            self._entries.move_to_end(key_hash)
+            return entry[0], entry[1]
+
+    def set(self, key_hash: str, ts: float, data: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove_locked(key_hash)
+            self._entries[key_hash] = (ts, data, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted
+
+    def _remove_locked(self, key_hash: str) -> None:
+        entry = self._entries.pop(key_hash, None)
+        if entry is not None:
+            self.current_bytes -= entry[2]
 
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+def _estimate_size(data: Any) -> int:
+    try:
+        return len(json.dumps(data, ensure_ascii=False))
+    except (TypeError, ValueError):
+        return len(repr(data))
+
+
+_backend: Optional[CacheBackend] = None
+_backend_lock = threading.Lock()
+
+
+_memory_tier: Optional[MemoryTier] = None
+_stats_lock = threading.Lock()
+_stats = {"memory": {"hits": 0, "misses": 0}, "disk": {"hits": 0, "misses": 0}}
+
+
+def _count(tier: str, outcome: str) -> None:
+    with _stats_lock:
+        _stats[tier][outcome] += 1
+
+
+def get_memory_tier() -> Optional[MemoryTier]:
+    """Return the L1 memory tier, or None if `cache.memory.max_bytes` is 0."""
+    global _memory_tier
+    if _memory_tier is None:
+        max_bytes = get_cache_memory_max_bytes()
+        if max_bytes <= 0:
+            return None
+        _memory_tier = MemoryTier(max_bytes)
+    return _memory_tier
+
+
+def get_cache_stats() -> dict[str, dict[str, int]]:
+    """Return hit/miss counters per tier and the L1 occupancy."""
+    with _stats_lock:
+        stats = {tier: dict(counts) for tier, counts in _stats.items()}
+    memory = _memory_tier
+    stats["memory"]["entries"] = len(memory) if memory else 0
+    stats["memory"]["bytes"] = memory.current_bytes if memory else 0
+    return stats
+
+
+def _open_backend() -> CacheBackend:
     cache_dir = get_cache_dir()
+    if get_cache_backend_name() == "json":
+        return JsonDirBackend(cache_dir)
+
+    backend = SqliteBackend(cache_dir / SQLITE_FILENAME, codec=get_cache_compression())
+    if backend.get_meta("legacy_json_migrated") is None:
+        try:
+            imported = migrate_json_dir(cache_dir, backend)
+            if imported:
+                logger.info(f"Migrated {imported} legacy cache entries from {cache_dir}")
+            backend.set_meta("legacy_json_migrated", str(time.time()))
+        except Exception as exc:
+            logger.warning(f"Legacy cache migration failed: {exc}")
+    return backend
+
+
+def get_cache_backend() -> Optional[CacheBackend]:
+    """Return the configured disk backend, opening it on first use.
+
+    Returns:
+        Backend instance, or None if the cache directory is unusable.
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                try:
+                    _backend = _open_backend()
+                except Exception as exc:
+                    logger.debug(f"Failed to open cache backend in {get_cache_dir()}: {exc}")
+                    return None
+    return _backend
+
+
+def reset_cache_backend() -> None:
+    """Close the current backend and drop L1 so both are rebuilt from config.
+
+    Writes the batched writer has not flushed yet are discarded, so they are
+    neither served nor written into the next backend.
+    """
+    global _backend, _memory_tier, _writer
+    writer, _writer = _writer, None
+    if writer is not None:
+        writer.discard()
+    with _backend_lock:
+        if _backend is not None:
+            _backend.close()
+        _backend = None
+        _memory_tier = None
+    with _stats_lock:
+        for counts in _stats.values():
+            counts.update(hits=0, misses=0)
+
+
+def _read_memory(key_hash: str, max_age_seconds: int) -> Optional[tuple[float, Any]]:
+    memory = get_memory_tier()
+    if memory is None:
+        return None
+    entry = memory.get_entry(key_hash, max_age_seconds)
+    _count("memory", "misses" if entry is None else "hits")
+    return entry
+
+
+def _read_disk(
+    cache_key: str, key_hash: str, max_age_seconds: int, promote: bool = True
+) -> Optional[tuple[float, Any]]:
+    backend = get_cache_backend()
+    if backend is None:
+        return None
+
     try:
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = backend.get(key_hash)
     except Exception as exc:
-        logger.debug(f"Failed to create cache dir {cache_dir}: {exc}")
-        return None
+        logger.debug(f"Failed to read cache entry {cache_key}: {exc}")
+        entry = None
 
-    path = _cache_path(cache_dir, cache_key)
-    if not path.exists():
+    if entry is None or (time.time() - entry[0]) > max_age_seconds:
+        _count("disk", "misses")
         return None
+    _count("disk", "hits")
+    memory = get_memory_tier() if promote else None
+    if memory is not None:
+        memory.set(key_hash, entry[0], entry[1], _estimate_size(entry[1]))
+    return entry
 
+
+def _write_memory(key_hash: str, ts: float, data: Any) -> None:
+    memory = get_memory_tier()
+    if memory is not None:
+        memory.set(key_hash, ts, data, _estimate_size(data))
+
+
+def _write_disk(items: list[tuple[str, float, Any, str]]) -> None:
+    backend = get_cache_backend()
+    if backend is None:
+        return
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        ts = float(payload.get("timestamp", 0))
-        if (time.time() - ts) > ttl_seconds:
-            return None
-        return payload.get("data")
+        backend.set_many(items)
     except Exception as exc:
-        logger.debug(f"Failed to read cache entry {path}: {exc}")
+        logger.debug(f"Failed to write {len(items)} cache entries: {exc}")
+
+
+def get_cached_json(cache_key: str, ttl_seconds: int, *, no_cache: bool = False) -> Optional[Any]:
+    """Get cached JSON data if present and not expired.
+
+    Blocks on disk I/O; async code should use `aget_cached_json`.
+
+    Args:
+        cache_key: Unique key for cache entry.
+        ttl_seconds: Time-to-live for this entry.
+        no_cache: If true, bypass cache.
+
+    Returns:
+        Cached data or None.
+    """
+    if no_cache:
         return None
 
+    key_hash = _key_hash(cache_key)
+    entry = _read_memory(key_hash, ttl_seconds) or _read_disk(cache_key, key_hash, ttl_seconds)
+    return entry[1] if entry else None
 
-def set_cached_json(cache_key: str, data: Any, *, no_cache: bool = False) -> None:
+
+def set_cached_json(cache_key: str, data: Any, *, kind: str = "", no_cache: bool = False) -> None:
     """Save JSON-serializable data to cache.
 
+    Blocks on disk I/O; async code should use `aset_cached_json`.
+
     Args:
         cache_key: Unique key for cache entry.
         data: JSON-serializable value.
+        kind: Cache kind used for expiry and quota accounting ('web', 'rss', ...).
         no_cache: If true, don't write cache.
     """
     if no_cache:
         return
 
-    cache_dir = get_cache_dir()
-    try:
-        cache_dir.mkdir(parents=True, exist_ok=True)
-    except Exception as exc:
-        logger.debug(f"Failed to create cache dir {cache_dir}: {exc}")
+    key_hash = _key_hash(cache_key)
+    now = time.time()
+    _write_memory(key_hash, now, data)
+    _write_disk([(key_hash, now, data, kind)])
+
+
+_io_executor: Optional[ThreadPoolExecutor] = None
+_io_executor_lock = threading.Lock()
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    global _io_executor
+    if _io_executor is None:
+        with _io_executor_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(
+                    max_workers=get_cache_io_config()["workers"],
+                    thread_name_prefix="cache-io",
+                )
+    return _io_executor
+
+
+async def run_cache_io(func, *args, **kwargs) -> Any:
+    """Run blocking cache work on the dedicated cache I/O executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_io_executor(), functools.partial(func, *args, **kwargs))
+
+
+class CacheWriter:
+    """Coalesces async cache writes into batched backend calls.
+
+    Writes issued within `delay_seconds` of each other are flushed with one
+    `set_many` call on the cache I/O executor. Entries stay visible to readers
+    until they have reached the backend.
+    """
+
+    def __init__(self, delay_seconds: float = 0.02):
+        self.delay_seconds = delay_seconds
+        self._pending: dict[str, tuple[str, float, Any, str]] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def pending(self, key_hash: str) -> Optional[tuple[float, Any]]:
+        """Return ``(timestamp, data)`` of a not yet flushed write."""
+        with self._lock:
+            item = self._pending.get(key_hash)
+        return (item[1], item[2]) if item else None
+
+    def add(self, item: tuple[str, float, Any, str]) -> None:
+        """Queue ``(key_hash, timestamp, data, kind)``; must be called on the loop."""
+        with self._lock:
+            self._pending[item[0]] = item
+        loop = asyncio.get_running_loop()
+        task = self._task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._task = loop.create_task(self._flush_soon())
+
+    def discard(self) -> None:
+        """Drop pending entries and stop the scheduled flush."""
+        with self._lock:
+            self._pending.clear()
+        task, self._task = self._task, None
+        if task is not None and not task.done() and not task.get_loop().is_closed():
+            task.cancel()
+
+    async def _flush_soon(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.delay_seconds)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all pending entries to the backend."""
+        with self._lock:
+            items = list(self._pending.values())
+        if not items:
+            return
+        await run_cache_io(_write_disk, items)
+        with self._lock:
+            for item in items:
+                if self._pending.get(item[0]) is item:
+                    del self._pending[item[0]]
+
+
+_writer: Optional[CacheWriter] = None
+
+
+def get_cache_writer() -> CacheWriter:
+    """Return the process-wide batched cache writer."""
+    global _writer
+    if _writer is None:
+        _writer = CacheWriter(delay_seconds=get_cache_io_config()["write_batch_ms"] / 1000)
+    return _writer
+
+
+async def _aget_entry(
+    cache_key: str, max_age_seconds: int, memory: bool = True
+) -> Optional[tuple[float, Any]]:
+    key_hash = _key_hash(cache_key)
+    entry = _read_memory(key_hash, max_age_seconds) if memory else None
+    if entry is not None:
+        return entry
+    pending = get_cache_writer().pending(key_hash)
+    if pending is not None and (time.time() - pending[0]) <= max_age_seconds:
+        return pending
+    return await run_cache_io(_read_disk, cache_key, key_hash, max_age_seconds, memory)
+
+
+async def aget_cached_json(
+    cache_key: str, ttl_seconds: int, *, no_cache: bool = False, memory: bool = True
+) -> Optional[Any]:
+    """Async variant of `get_cached_json` that keeps disk reads off the event loop.
+
+    Callers that keep their own in-process cache pass ``memory=False`` to
+    bypass the shared L1 tier.
+    """
+    if no_cache:
+        return None
+    entry = await _aget_entry(cache_key, ttl_seconds, memory)
+    return entry[1] if entry else None
+
+
+async def aget_cached_json_swr(
+    cache_key: str, ttl_seconds: int, grace_seconds: int, *, no_cache: bool = False
+) -> tuple[Optional[Any], bool]:
+    """Stale-while-revalidate read.
+
+    Args:
+        cache_key: Unique key for cache entry.
+        ttl_seconds: Age up to which the entry is fresh.
+        grace_seconds: Extra age during which an expired entry is still served.
+        no_cache: If true, bypass cache.
+
+    Returns:
+        ``(data, stale)``; data is None on a miss. When `stale` is true the
+        caller should serve `data` and refresh the entry in the background.
+    """
+    if no_cache:
+        return None, False
+    entry = await _aget_entry(cache_key, ttl_seconds + max(0, grace_seconds))
+    if entry is None:
+        return None, False
+    return entry[1], (time.time() - entry[0]) > ttl_seconds
+
+
+async def aset_cached_json(
+    cache_key: str, data: Any, *, kind: str = "", no_cache: bool = False, memory: bool = True
+) -> None:
+    """Async variant of `set_cached_json`; the disk write is batched in the background."""
+    if no_cache:
+        return
+
+    key_hash = _key_hash(cache_key)
+    now = time.time()
+    if memory:
+        _write_memory(key_hash, now, data)
+    get_cache_writer().add((key_hash, now, data, kind))
+
+
+async def aget_negative(subject: str) -> Optional[dict[str, Any]]:
+    """Return the remembered failure for `subject` (e.g. a URL) if it has not expired.
+
+    Returns:
+        Dict with ``class``, ``error`` and ``expires``, or None.
+    """
+    entry = await aget_cached_json(f"negative|{subject}", get_cache_ttl_seconds("negative"))
+    if isinstance(entry, dict) and float(entry.get("expires", 0)) > time.time():
+        return entry
+    return None
+
+
+async def aset_negative(subject: str, failure_class: str, error: str) -> None:
+    """Remember a failure for the TTL configured for its class (0 disables)."""
+    ttl = get_negative_cache_ttl_seconds(failure_class)
+    if ttl <= 0:
         return
+    entry = {"class": failure_class, "error": error, "expires": time.time() + ttl}
+    await aset_cached_json(f"negative|{subject}", entry, kind="negative")
+
+
+async def shutdown_cache_io() -> None:
+    """Flush pending writes and stop the cache I/O executor."""
+    global _io_executor
+    if _writer is not None:
+        await _writer.flush()
+    with _io_executor_lock:
+        executor, _io_executor = _io_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
 
-    path = _cache_path(cache_dir, cache_key)
+def purge_expired(max_age_seconds: int) -> int:
+    """Delete entries older than `max_age_seconds` using the timestamp index.
+
+    Returns:
+        Number of removed entries.
+    """
+    backend = get_cache_backend()
+    if backend is None:
+        return 0
     try:
-        payload = {"timestamp": time.time(), "data": data}
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        return backend.purge_older_than(time.time() - max_age_seconds)
     except Exception as exc:
-        logger.debug(f"Failed to write cache entry {path}: {exc}")
+        logger.debug(f"Failed to purge cache: {exc}")
+        return 0
+
+
+def _retention_seconds(kind: str) -> int:
+    return get_cache_ttl_seconds(kind) + get_cache_stale_grace_seconds(kind)
+
+
+class CacheJanitor:
+    """Background task that reclaims disk space incrementally.
+
+    Each pass purges entries past their kind's TTL plus stale grace, then evicts entries of any
+    kind that is over its byte quota. Work is done in small batches on a worker
+    thread with a yield to the event loop between batches.
+    """
+
+    def __init__(self, interval_seconds: int = 300, batch_size: int = 200):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> dict[str, int]:
+        """Run a single purge/evict pass.
+
+        Returns:
+            Counts of ``expired`` and ``evicted`` entries.
+        """
+        stats = {"expired": 0, "evicted": 0}
+        backend = get_cache_backend()
+        if backend is None:
+            return stats
+
+        await run_cache_io(backend.flush)
+        kinds = await run_cache_io(backend.kinds)
+        known_ttls = [_retention_seconds(k) for k in kinds if k]
+        now = time.time()
+
+        for kind in kinds:
+            # Untyped (e.g. migrated) entries are kept as long as the longest TTL.
+            ttl = _retention_seconds(kind) if kind else max(known_ttls or [3600])
+            while True:
+                removed = await run_cache_io(
+                    backend.purge_older_than, now - ttl, kind=kind, limit=self.batch_size
+                )
+                stats["expired"] += removed
+                if removed < self.batch_size:
+                    break
+                await asyncio.sleep(0)
+
+            quota = get_cache_quota_bytes(kind or "default")
+            policy = get_cache_eviction_policy()
+            while await run_cache_io(backend.usage_bytes, kind) > quota:
+                removed = await run_cache_io(
+                    backend.evict, kind, policy=policy, limit=self.batch_size
+                )
+                stats["evicted"] += removed
+                if removed == 0:
+                    break
+                await asyncio.sleep(0)
+
+        if stats["expired"] or stats["evicted"]:
+            logger.info(
+                f"Cache janitor removed {stats['expired']} expired and "
+                f"{stats['evicted']} over-quota entries"
+            )
+        return stats
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(f"Cache janitor pass failed: {exc}")
+
+    def start(self) -> None:
+        """Start the periodic task on the running loop (idempotent)."""
+        if self.interval_seconds <= 0 or (self._task and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """Cancel the periodic task and persist buffered bookkeeping."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        backend = get_cache_backend()
+        if backend is not None:
+            await run_cache_io(backend.flush)
+
+
+_janitor: Optional[CacheJanitor] = None
+
+
+def get_cache_janitor() -> CacheJanitor:
+    """Return the process-wide cache janitor."""
+    global _janitor
+    if _janitor is None:
+        _janitor = CacheJanitor(interval_seconds=get_cache_janitor_interval_seconds())
+    return _janitor
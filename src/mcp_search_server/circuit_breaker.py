@@ -0,0 +1,209 @@
+"""Per-upstream circuit breakers with fast-fail and half-open probing."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .config_loader import get_circuit_breaker_config
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit open for {name}, retry in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker for one upstream.
+
+    Outcomes are kept for `window_seconds`. Once at least `min_calls` were
+    seen and the share of failures reaches `failure_rate`, the circuit opens
+    and calls fail fast for `open_seconds`. After that up to
+    `half_open_probes` calls are let through: a success closes the circuit,
+    a failure opens it again. A probe that never reports (its task finished
+    without an outcome, or it has been out for `open_seconds`) gives its slot
+    back. Outcomes may be recorded from executor threads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window_seconds: float = 60.0,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, int(min_calls))
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_probes = max(1, int(half_open_probes))
+        self.state = CLOSED
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        # (admitted at, claiming task) per outstanding half-open probe
+        self._probes: List[Tuple[float, Optional[asyncio.Task]]] = []
+        self._lock = threading.Lock()
+        self.stats = {"opened": 0, "rejected": 0}
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit (or one with every probe out) lets a probe through."""
+        now = time.monotonic()
+        if self.state == OPEN:
+            return max(0.0, self._opened_at + self.open_seconds - now)
+        if self.state == HALF_OPEN and len(self._probes) >= self.half_open_probes:
+            oldest = min(started for started, _ in self._probes)
+            return max(0.0, oldest + self.open_seconds - now)
+        return 0.0
+
+    def is_open(self) -> bool:
+        """True while calls would be rejected; does not use up a probe."""
+        with self._lock:
+            if self.state == OPEN:
+                return self.retry_in() > 0
+            self._reclaim_probes()
+            return self.state == HALF_OPEN and len(self._probes) >= self.half_open_probes
+
+    def allow(self) -> bool:
+        """Return whether a call may go out now, claiming a probe when half-open."""
+        with self._lock:
+            if self.state == OPEN and self.retry_in() <= 0:
+                self.state = HALF_OPEN
+                self._probes = []
+                logger.info(f"Circuit {self.name} half-open, probing")
+            if self.state == HALF_OPEN:
+                self._reclaim_probes()
+                if len(self._probes) < self.half_open_probes:
+                    self._probes.append((time.monotonic(), _current_task()))
+                    return True
+            elif self.state == CLOSED:
+                return True
+            self.stats["rejected"] += 1
+            return False
+
+    def check(self) -> None:
+        """Raise `CircuitOpenError` unless a call may go out now."""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+
+    def release(self) -> None:
+        """Give back a probe the current task claimed but never sent (e.g. cancelled)."""
+        with self._lock:
+            task = _current_task()
+            for index, (_, owner) in enumerate(self._probes):
+                if owner is task:
+                    del self._probes[index]
+                    return
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN:
+                logger.info(f"Circuit {self.name} closed after successful probe")
+                self.state = CLOSED
+                self._outcomes.clear()
+            elif self.state == CLOSED:
+                self._add(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._open()
+            elif self.state == CLOSED:
+                self._add(False)
+                failures = sum(1 for _, ok in self._outcomes if not ok)
+                if (
+                    len(self._outcomes) >= self.min_calls
+                    and failures / len(self._outcomes) >= self.failure_rate
+                ):
+                    self._open()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the state, recent error rate and counters for inspection."""
+        with self._lock:
+            self._trim(time.monotonic())
+            calls = len(self._outcomes)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            return {
+                "state": self.state,
+                "recent_calls": calls,
+                "recent_failures": failures,
+                "error_rate": round(failures / calls, 3) if calls else 0.0,
+                "retry_in_seconds": round(self.retry_in(), 1),
+                **self.stats,
+            }
+
+    def _add(self, ok: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+    def _reclaim_probes(self) -> None:
+        now = time.monotonic()
+        live = [
+            (started, task)
+            for started, task in self._probes
+            if now - started < self.open_seconds and not (task is not None and task.done())
+        ]
+        if len(live) < len(self._probes):
+            logger.info(f"Circuit {self.name}: reclaimed {len(self._probes) - len(live)} probe(s)")
+            self._probes = live
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self.stats["opened"] += 1
+        logger.warning(f"Circuit {self.name} opened for {self.open_seconds:.0f}s")
+
+
+def _current_task() -> Optional[asyncio.Task]:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:  # no running loop (executor thread)
+        return None
+
+
+# Breakers by upstream (service name or host), created on first use
+_breakers: Dict[str, CircuitBreaker] = {}
+
+# Closed breakers with no recent calls are dropped past this many upstreams.
+MAX_BREAKERS = 1024
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Return the shared breaker for an upstream, configured from `circuit_breakers`."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        if len(_breakers) >= MAX_BREAKERS:
+            for key, idle in list(_breakers.items()):
+                if idle.state == CLOSED and not idle.snapshot()["recent_calls"]:
+                    del _breakers[key]
+        breaker = _breakers[name] = CircuitBreaker(name, **get_circuit_breaker_config(name))
+    return breaker
+
+
+def get_circuit_breaker_states(name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Return snapshots of all breakers, or of the one named."""
+    if name is not None:
+        return {name: get_circuit_breaker(name).snapshot()}
+    return {key: breaker.snapshot() for key, breaker in sorted(_breakers.items())}
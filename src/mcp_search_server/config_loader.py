@@ -36,7 +36,40 @@ def load_search_config() -> dict[str, Any]:
     default_config: dict[str, Any] = {
         "cache": {
             "dir": "~/.mcp-search-cache",
-            "ttl_seconds": {"web": 21600, "news": 1200, "rss": 900, "enrich": 86400},
+            "backend": "sqlite",
+            "compression": "auto",
+            "ttl_seconds": {
+                "web": 21600,
+                "news": 1200,
+                "rss": 900,
+                "enrich": 86400,
+                "maps": 86400,
+                "negative": 21600,
+                "extract": 86400,
+                "http": 604800,
+                "scoreboard": 2592000,
+            },
+            "negative_ttl_seconds": {
+                "not_found": 3600,
+                "blocked": 900,
+                "timeout": 120,
+                "non_html": 21600,
+            },
+            "stale_grace_seconds": {"web": 86400, "news": 1800, "rss": 1800},
+            "max_bytes": {
+                "web": 64 * 1024 * 1024,
+                "news": 16 * 1024 * 1024,
+                "rss": 16 * 1024 * 1024,
+                "enrich": 64 * 1024 * 1024,
+                "maps": 16 * 1024 * 1024,
+                "extract": 128 * 1024 * 1024,
+                "http": 128 * 1024 * 1024,
+                "default": 32 * 1024 * 1024,
+            },
+            "eviction": "lru",
+            "janitor_interval_seconds": 300,
+            "memory": {"max_bytes": 16 * 1024 * 1024, "extract_max_bytes": 32 * 1024 * 1024},
+            "io": {"workers": 2, "write_batch_ms": 20},
         },
         "results": {
             "max_per_domain": 3,
@@ -46,11 +79,79 @@ def load_search_config() -> dict[str, Any]:
                 "normalize_urls": True,
             },
         },
-        "enrich": {"default_enabled": False, "top_k": 3, "max_chars": 600},
+        "enrich": {
+            "default_enabled": False,
+            "top_k": 3,
+            "max_chars": 600,
+            "preview_max_bytes": 131072,
+        },
         "maps": {
             "nominatim_endpoint": "https://nominatim.openstreetmap.org/search",
             "user_agent": f"mcp-search-server/{__version__} (+https://localhost)",
         },
+        "http": {
+            "limit": 100,
+            "limit_per_host": 10,
+            "ttl_dns_cache": 300,
+            "keepalive_timeout": 30,
+            "validator_max_body_bytes": 5 * 1024 * 1024,
+        },
+        "rate_limits": {
+            "duckduckgo": {"rate": 1.0, "burst": 2},
+            "wikipedia": {"rate": 2.0, "burst": 4},
+            "reddit": {"rate": 0.5, "burst": 1},
+            "github": {"rate": 0.5, "burst": 2},
+            "arxiv": {"rate": 0.34, "burst": 1},
+            "entrez": {"rate": 3.0, "burst": 1},
+            "nominatim": {"rate": 1.0, "burst": 1},
+            "ip_api": {"rate": 0.75, "burst": 5},
+            "web_parser": {"rate": 3.0, "burst": 3},
+            "pdf": {"rate": 1.0, "burst": 1},
+            "default": {"rate": 1.0, "burst": 1},
+        },
+        "rate_control": {
+            "decrease_factor": 0.5,
+            "increase_step": 0.05,
+            "min_factor": 0.05,
+            "max_pause": 60,
+        },
+        "browser_pool": {
+            "size": 2,
+            "max_pages": 50,
+            "max_memory_mb": 1024,
+            "max_queue": 8,
+            "acquire_timeout": 30,
+        },
+        "batch_extraction": {"max_urls": 20, "concurrency": 8, "per_host": 2},
+        "extractor_scoreboard": {
+            "enabled": True,
+            "half_life_seconds": 604800,
+            "min_samples": 3,
+            "block_threshold": 0.8,
+        },
+        "extraction": {"executor": "auto", "workers": 0, "process_min_cpus": 4},
+        "browser_render": {
+            "lightweight": True,
+            "block": ["image", "font", "media", "tracker"],
+            "max_render_seconds": 20,
+            "quiet_seconds": 0.5,
+        },
+        "tool_timeouts": {
+            "default": 60,
+            "extract_webpage_content": 90,
+            "extract_webpages": 180,
+            "parse_pdf": 90,
+        },
+        "circuit_breakers": {
+            "default": {
+                "failure_rate": 0.5,
+                "min_calls": 5,
+                "window_seconds": 60,
+                "open_seconds": 30,
+                "half_open_probes": 1,
+            },
+            "duckduckgo": {"min_calls": 3, "open_seconds": 60},
+        },
         "rss_sources": [],
     }
 
@@ -63,20 +164,43 @@ def load_search_config() -> dict[str, Any]:
         if not isinstance(raw, dict):
             logger.warning("search_config.json root is not an object; using defaults")
             return default_config
-        return {**default_config, **raw}
+        return _deep_merge(default_config, raw)
     except Exception as exc:
         logger.warning(f"Failed to read config at {config_path}: {exc}. Using defaults.")
         return default_config
 
 
+def _deep_merge(defaults: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    """Overlay `override` on `defaults`, merging nested sections key by key."""
+    merged = dict(defaults)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
 def get_cache_dir() -> Path:
     """Return expanded cache directory path."""
     cache_dir = str(load_search_config().get("cache", {}).get("dir", "~/.mcp-search-cache"))
     return Path(cache_dir).expanduser()
 
 
+def get_cache_backend_name() -> str:
+    """Return disk cache backend name ('sqlite'|'json')."""
+    name = str(load_search_config().get("cache", {}).get("backend", "sqlite")).lower()
+    return name if name in ("sqlite", "json") else "sqlite"
+
+
+def get_cache_compression() -> str:
+    """Return cache value codec ('auto'|'zstd'|'zlib'|'none')."""
+    name = str(load_search_config().get("cache", {}).get("compression", "auto")).lower()
+    return name if name in ("auto", "zstd", "zlib", "none") else "auto"
+
+
 def get_cache_ttl_seconds(kind: str) -> int:
-    """Return TTL for cache kind ('web'|'news'|'rss'|'enrich')."""
+    """Return TTL for cache kind ('web'|'news'|'rss'|'extract'|'http'|'scoreboard'|...)."""
     ttl = load_search_config().get("cache", {}).get("ttl_seconds", {}).get(kind, 3600)
     try:
         return int(ttl)
@@ -84,6 +208,84 @@ def get_cache_ttl_seconds(kind: str) -> int:
         return 3600
 
 
+def get_negative_cache_ttl_seconds(failure_class: str) -> int:
+    """Return how long a failure is remembered ('not_found'|'blocked'|'timeout'|'non_html')."""
+    defaults = {"not_found": 3600, "blocked": 900, "timeout": 120, "non_html": 21600}
+    ttls = load_search_config().get("cache", {}).get("negative_ttl_seconds", {})
+    try:
+        return max(0, int(ttls.get(failure_class, defaults.get(failure_class, 0))))
+    except Exception:
+        return defaults.get(failure_class, 0)
+
+
+def get_cache_stale_grace_seconds(kind: str) -> int:
+    """Return stale-while-revalidate grace past the TTL for cache kind (0 disables it)."""
+    grace = load_search_config().get("cache", {}).get("stale_grace_seconds", {}).get(kind, 0)
+    try:
+        return max(0, int(grace))
+    except Exception:
+        return 0
+
+
+def get_cache_quota_bytes(kind: str) -> int:
+    """Return the disk byte quota for cache kind (falls back to the 'default' quota)."""
+    quotas = load_search_config().get("cache", {}).get("max_bytes", {})
+    if not isinstance(quotas, dict):
+        quotas = {}
+    value = quotas.get(kind, quotas.get("default", 32 * 1024 * 1024))
+    try:
+        return int(value)
+    except Exception:
+        return 32 * 1024 * 1024
+
+
+def get_cache_memory_max_bytes(tier: str = "max_bytes") -> int:
+    """Return the byte budget of an in-process cache tier (0 disables it).
+
+    Args:
+        tier: 'max_bytes' for the shared L1 tier, 'extract_max_bytes' for
+            link_parser's extracted-article cache.
+    """
+    defaults = {"max_bytes": 16 * 1024 * 1024, "extract_max_bytes": 32 * 1024 * 1024}
+    default = defaults.get(tier, 16 * 1024 * 1024)
+    value = load_search_config().get("cache", {}).get("memory", {}).get(tier, default)
+    try:
+        return max(0, int(value))
+    except Exception:
+        return default
+
+
+def get_cache_eviction_policy() -> str:
+    """Return cache eviction policy ('lru'|'lfu')."""
+    policy = str(load_search_config().get("cache", {}).get("eviction", "lru")).lower()
+    return policy if policy in ("lru", "lfu") else "lru"
+
+
+def get_cache_janitor_interval_seconds() -> int:
+    """Return how often the cache janitor runs (0 disables it)."""
+    value = load_search_config().get("cache", {}).get("janitor_interval_seconds", 300)
+    try:
+        return int(value)
+    except Exception:
+        return 300
+
+
+def get_cache_io_config() -> dict[str, int]:
+    """Return worker count and write batching window for async cache I/O."""
+    defaults = {"workers": 2, "write_batch_ms": 20}
+    io_cfg = load_search_config().get("cache", {}).get("io", {})
+    if not isinstance(io_cfg, dict):
+        return defaults
+    output: dict[str, int] = {}
+    for key, default in defaults.items():
+        try:
+            output[key] = max(0, int(io_cfg.get(key, default)))
+        except Exception:
+            output[key] = default
+    output["workers"] = max(1, output["workers"])
+    return output
+
+
 def get_results_max_per_domain() -> int:
     """Return maximum number of results per domain."""
     value = load_search_config().get("results", {}).get("max_per_domain", 3)
@@ -126,6 +328,7 @@ def get_enrich_defaults() -> dict[str, int | bool]:
         "enabled": bool(enrich.get("default_enabled", False)),
         "top_k": int(enrich.get("top_k", 3)),
         "max_chars": int(enrich.get("max_chars", 600)),
+        "preview_max_bytes": int(enrich.get("preview_max_bytes", 131072)),
     }
 
 
@@ -146,3 +349,192 @@ def get_maps_config() -> dict[str, str]:
         ),
         "user_agent": str(maps_cfg.get("user_agent", f"mcp-search-server/{__version__}")),
     }
+
+
+def get_http_validator_max_body_bytes() -> int:
+    """Return the largest body kept for ETag/Last-Modified revalidation (0 disables it)."""
+    value = load_search_config().get("http", {}).get("validator_max_body_bytes", 5 * 1024 * 1024)
+    try:
+        return max(0, int(value))
+    except Exception:
+        return 5 * 1024 * 1024
+
+
+def get_rate_limit(service: str) -> dict[str, float]:
+    """Return the token-bucket `rate` (calls/second) and `burst` for an upstream service."""
+    limits = load_search_config().get("rate_limits", {})
+    if not isinstance(limits, dict):
+        limits = {}
+    entry = limits.get(service, limits.get("default", {}))
+    if not isinstance(entry, dict):
+        entry = {}
+    try:
+        rate = float(entry.get("rate", 1.0))
+        burst = int(entry.get("burst", 1))
+    except Exception:
+        return {"rate": 1.0, "burst": 1}
+    return {"rate": rate if rate > 0 else 1.0, "burst": max(1, burst)}
+
+
+def get_rate_control_config() -> dict[str, float]:
+    """Return AIMD settings for adapting rate limits to 429/503 responses."""
+    defaults = {
+        "decrease_factor": 0.5,
+        "increase_step": 0.05,
+        "min_factor": 0.05,
+        "max_pause": 60.0,
+    }
+    control_cfg = load_search_config().get("rate_control", {})
+    if not isinstance(control_cfg, dict):
+        return defaults
+    output: dict[str, float] = {}
+    for key, default in defaults.items():
+        try:
+            output[key] = float(control_cfg.get(key, default))
+        except Exception:
+            output[key] = default
+    return output
+
+
+def get_circuit_breaker_config(name: str) -> dict[str, float]:
+    """Return circuit breaker settings for an upstream (its entry over `default`)."""
+    defaults = {
+        "failure_rate": 0.5,
+        "min_calls": 5,
+        "window_seconds": 60.0,
+        "open_seconds": 30.0,
+        "half_open_probes": 1,
+    }
+    breakers_cfg = load_search_config().get("circuit_breakers", {})
+    if not isinstance(breakers_cfg, dict):
+        return defaults
+    merged: dict[str, Any] = {}
+    for section in (breakers_cfg.get("default"), breakers_cfg.get(name)):
+        if isinstance(section, dict):
+            merged.update(section)
+    output: dict[str, float] = {}
+    for key, default in defaults.items():
+        try:
+            output[key] = type(default)(merged.get(key, default))
+        except Exception:
+            output[key] = default
+    return output
+
+
+def get_browser_pool_config() -> dict[str, float]:
+    """Return sizing and recycling limits for the pooled headless browsers."""
+    defaults = {
+        "size": 2,
+        "max_pages": 50,
+        "max_memory_mb": 1024,
+        "max_queue": 8,
+        "acquire_timeout": 30.0,
+    }
+    pool_cfg = load_search_config().get("browser_pool", {})
+    if not isinstance(pool_cfg, dict):
+        return defaults
+    output: dict[str, float] = {}
+    for key, default in defaults.items():
+        try:
+            output[key] = type(default)(pool_cfg.get(key, default))
+        except Exception:
+            output[key] = default
+    return output
+
+
+def get_batch_extraction_config() -> dict[str, int]:
+    """Return URL count and concurrency limits for batch extraction."""
+    defaults = {"max_urls": 20, "concurrency": 8, "per_host": 2}
+    batch = load_search_config().get("batch_extraction", {})
+    if not isinstance(batch, dict):
+        return defaults
+    output: dict[str, int] = {}
+    for key, default in defaults.items():
+        try:
+            output[key] = max(1, int(batch.get(key, default)))
+        except Exception:
+            output[key] = default
+    return output
+
+
+def get_extractor_scoreboard_config() -> dict[str, Any]:
+    """Return settings of the per-domain extractor scoreboard."""
+    defaults: dict[str, Any] = {
+        "enabled": True,
+        "half_life_seconds": 604800.0,
+        "min_samples": 3.0,
+        "block_threshold": 0.8,
+    }
+    board = load_search_config().get("extractor_scoreboard", {})
+    if not isinstance(board, dict):
+        return defaults
+    output = {"enabled": bool(board.get("enabled", True))}
+    for key in ("half_life_seconds", "min_samples", "block_threshold"):
+        try:
+            output[key] = max(0.0, float(board.get(key, defaults[key])))
+        except Exception:
+            output[key] = defaults[key]
+    return output
+
+
+def get_extraction_executor_config() -> dict[str, Any]:
+    """Return how CPU-bound HTML extraction is executed.
+
+    `executor` is `process`, `thread` or `auto` (processes when the machine has
+    at least `process_min_cpus` cores); `workers` 0 means one per core minus one.
+    """
+    extraction = load_search_config().get("extraction", {})
+    if not isinstance(extraction, dict):
+        extraction = {}
+    mode = str(extraction.get("executor", "auto")).lower()
+    output: dict[str, Any] = {"executor": mode if mode in ("auto", "process", "thread") else "auto"}
+    for key, default in (("workers", 0), ("process_min_cpus", 4)):
+        try:
+            output[key] = max(0, int(extraction.get(key, default)))
+        except Exception:
+            output[key] = default
+    return output
+
+
+def get_browser_render_config() -> dict[str, Any]:
+    """Return the lightweight render settings for the browser fallback."""
+    render_cfg = load_search_config().get("browser_render", {})
+    if not isinstance(render_cfg, dict):
+        render_cfg = {}
+    block = render_cfg.get("block", ["image", "font", "media", "tracker"])
+    output: dict[str, Any] = {
+        "lightweight": bool(render_cfg.get("lightweight", True)),
+        "block": [str(kind) for kind in block] if isinstance(block, list) else [],
+    }
+    for key, default in (("max_render_seconds", 20.0), ("quiet_seconds", 0.5)):
+        try:
+            output[key] = max(0.0, float(render_cfg.get(key, default)))
+        except Exception:
+            output[key] = default
+    return output
+
+
+def get_tool_timeout_seconds(tool_name: str) -> float:
+    """Return the overall time budget for one call of `tool_name` (0 disables it)."""
+    timeouts = load_search_config().get("tool_timeouts", {})
+    if not isinstance(timeouts, dict):
+        return 60.0
+    try:
+        return max(0.0, float(timeouts.get(tool_name, timeouts.get("default", 60))))
+    except Exception:
+        return 60.0
+
+
+def get_http_client_config() -> dict[str, int]:
+    """Return connection pool settings for the shared HTTP client."""
+    defaults = {"limit": 100, "limit_per_host": 10, "ttl_dns_cache": 300, "keepalive_timeout": 30}
+    http_cfg = load_search_config().get("http", {})
+    if not isinstance(http_cfg, dict):
+        return defaults
+    output: dict[str, int] = {}
+    for key, default in defaults.items():
+        try:
+            output[key] = int(http_cfg.get(key, default))
+        except Exception:
+            output[key] = default
+    return output
@@ -0,0 +1,148 @@
+"""Per-call deadline budgets, propagated through contextvars.
+
+`server.call_tool` opens a `deadline_scope` for every tool call. Code below it
+asks how much time is left before starting an expensive step, clamps its own
+timeouts to the budget, and offers partial results that the server returns if
+the call runs out of time. The budget follows the call into tasks it starts
+and, through `run_in_executor`, into worker threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """The tool call ran out of time (or was cancelled) before a step could start."""
+
+
+class Budget:
+    """Deadline and partial results of one tool call."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.partial: Dict[str, Any] = {}
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+
+_budget: contextvars.ContextVar[Optional[Budget]] = contextvars.ContextVar(
+    "tool_call_budget", default=None
+)
+# Set in worker threads started by run_in_executor; set() once the caller is cancelled.
+_cancelled: contextvars.ContextVar[Optional[threading.Event]] = contextvars.ContextVar(
+    "executor_cancelled", default=None
+)
+
+
+@contextlib.contextmanager
+def deadline_scope(seconds: float) -> Iterator[Budget]:
+    """Run the enclosed code under a budget of `seconds`.
+
+    A nested scope never extends the deadline of the one around it and
+    shares its partial results.
+    """
+    budget = Budget(seconds)
+    outer = _budget.get()
+    if outer is not None:
+        budget.expires_at = min(budget.expires_at, outer.expires_at)
+        budget.partial = outer.partial
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget.reset(token)
+
+
+def current_budget() -> Optional[Budget]:
+    return _budget.get()
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current call, or None outside a deadline scope."""
+    budget = _budget.get()
+    return None if budget is None else budget.remaining()
+
+
+def cancelled() -> bool:
+    """True in an executor thread whose awaiting caller was cancelled."""
+    event = _cancelled.get()
+    return event is not None and event.is_set()
+
+
+def has_time_for(seconds: float) -> bool:
+    """Whether a step expected to take `seconds` can still finish in time."""
+    left = remaining()
+    return not cancelled() and (left is None or left >= seconds)
+
+
+def check(step: str = "") -> None:
+    """Raise `DeadlineExceeded` if the budget is used up or the caller was cancelled."""
+    if cancelled():
+        raise DeadlineExceeded(f"Cancelled before {step or 'next step'}")
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(f"Deadline reached before {step or 'next step'}")
+
+
+def clamp(timeout: float) -> float:
+    """Return `timeout`, shortened to the time left in the current call."""
+    left = remaining()
+    if left is None:
+        return timeout
+    return max(0.01, min(timeout, left))
+
+
+def add_partial(key: str, value: Any) -> None:
+    """Offer a partial result for the current call, returned if it times out."""
+    budget = _budget.get()
+    if budget is not None:
+        budget.partial[key] = value
+
+
+def detached_context() -> contextvars.Context:
+    """Return a copy of the current context without the call's budget or cancel flag.
+
+    For work shared by several calls, which must not inherit the deadline of
+    whichever call happened to start it.
+    """
+    context = contextvars.copy_context()
+    context.run(_budget.set, None)
+    context.run(_cancelled.set, None)
+    return context
+
+
+def executor_context() -> Tuple[contextvars.Context, threading.Event]:
+    """Return a copy of the current context for a worker thread and its cancel flag.
+
+    Run the thread's work with `context.run(...)`; setting the event makes
+    `cancelled()` true inside it.
+    """
+    event = threading.Event()
+    context = contextvars.copy_context()
+    context.run(_cancelled.set, event)
+    return context, event
+
+
+async def run_in_executor(func: Callable[..., T], *args: Any) -> T:
+    """Run `func` in the default executor with the caller's deadline.
+
+    If the caller is cancelled, `cancelled()` becomes true inside the
+    thread so blocking code can stop at its next `check()`.
+    """
+    context, event = executor_context()
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(None, context.run, func, *args)
+    except asyncio.CancelledError:
+        event.set()
+        raise
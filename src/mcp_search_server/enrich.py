@@ -4,43 +4,42 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from .cache_store import get_cached_json, set_cached_json
-from .config_loader import get_cache_ttl_seconds
-from .tools.link_parser import extract_content_from_url
-from .utils import with_rate_limit
+from .cache_store import aget_cached_json, aset_cached_json
+from .config_loader import get_cache_ttl_seconds, get_enrich_defaults
+from .tools.web.link_parser import get_cached_failure
+from .tools.web.page_preview import fetch_preview
 
 logger = logging.getLogger(__name__)
 
 
-def _preview_text(text: str, max_chars: int) -> str:
-    if not text:
-        return ""
-    trimmed = text.strip()
-    if len(trimmed) <= max_chars:
-        return trimmed
-    return trimmed[:max_chars].rstrip() + "..."
-
-
-@with_rate_limit("web_parser")
 async def _fetch_preview(url: str, *, max_chars: int, no_cache: bool) -> str:
     ttl = get_cache_ttl_seconds("enrich")
     cache_key = f"enrich|url={url}|max_chars={max_chars}"
-    cached = get_cached_json(cache_key, ttl_seconds=ttl, no_cache=no_cache)
+    cached = await aget_cached_json(cache_key, ttl_seconds=ttl, no_cache=no_cache)
     if isinstance(cached, str) and cached:
         return cached
 
-    content = await extract_content_from_url(url)
-    if not content or content.startswith("Error"):
+    # Skip URLs that failed recently without waiting for a rate-limit slot
+    if not no_cache and await get_cached_failure(url):
         return ""
 
-    preview = _preview_text(content, max_chars=max_chars)
+    preview = await _extract_preview(url, max_chars=max_chars)
     if preview:
-        set_cached_json(cache_key, preview, no_cache=no_cache)
+        await aset_cached_json(cache_key, preview, kind="enrich", no_cache=no_cache)
     return preview
 
 
+async def _extract_preview(url: str, *, max_chars: int) -> str:
+    # Reads only the head and lead paragraphs; no extractor chain or browser
+    preview, error = await fetch_preview(url, max_chars=max_chars)
+    if preview is None:
+        logger.debug(f"No preview for {url}: {error}")
+        return ""
+    return preview.text(max_chars)
+
+
 async def enrich_results(
     results: List[Dict[str, Any]],
     *,
@@ -90,3 +89,19 @@ async def enrich_results(
             out[idx]["preview"] = preview
 
     return out
+
+
+async def enrich_if_requested(
+    results: List[Dict[str, Any]], enrich: Optional[bool], *, no_cache: bool = False
+) -> List[Dict[str, Any]]:
+    """Apply `enrich_results` with the configured defaults if `enrich` (or
+    `enrich.default_enabled` when it is None) asks for it."""
+    defaults = get_enrich_defaults()
+    if not (defaults["enabled"] if enrich is None else enrich):
+        return results
+    return await enrich_results(
+        results,
+        top_k=int(defaults["top_k"]),
+        max_chars=int(defaults["max_chars"]),
+        no_cache=no_cache,
+    )
@@ -0,0 +1,272 @@
+"""Shared pooled aiohttp client used by all tools.
+
+Also provides HTTP conditional revalidation: bodies served with an ETag or
+Last-Modified validator are kept in the disk cache (kind 'http'), later
+requests send If-None-Match / If-Modified-Since, and a 304 is answered from
+the stored body without downloading it again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import logging
+import ssl
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import aiohttp
+import certifi
+from multidict import CIMultiDict
+
+from . import deadline
+from .cache_store import aget_cached_json, aset_cached_json
+from .config_loader import (
+    get_cache_ttl_seconds,
+    get_http_client_config,
+    get_http_validator_max_body_bytes,
+)
+from .utils import rate_feedback, upstream_error
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the process-wide SSL context (certifi bundle is loaded once)."""
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+class HttpClientManager:
+    """Owns one pooled `aiohttp.ClientSession` for the whole process.
+
+    The session keeps connections alive between tool calls, caps connections per
+    host and shares a DNS cache. Tools must not close the session they receive.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        ttl_dns_cache: int = 300,
+        keepalive_timeout: int = 30,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def started(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            ssl=get_ssl_context(),
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30),
+            # Shared by every tool and upstream: don't carry cookies from one request to the next
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+
+    async def start(self) -> None:
+        """Create the pooled session (idempotent)."""
+        await self.get_session()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it lazily on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A session is bound to the loop it was created on (e.g. tests that
+            # run several event loops); start over on a new loop.
+            self._session = None
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        if self.started:
+            return self._session
+
+        async with self._lock:
+            if not self.started:
+                self._session = self._create_session()
+                logger.info(
+                    f"HTTP client started (limit={self.limit}, "
+                    f"limit_per_host={self.limit_per_host})"
+                )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled session and release all connections."""
+        session = self._session
+        self._session = None
+        if session is None or session.closed:
+            return
+        if self._loop is not asyncio.get_running_loop():
+            logger.debug("HTTP client belongs to another event loop; dropping it")
+            return
+        await session.close()
+        logger.info("HTTP client closed")
+
+
+_http_client: Optional[HttpClientManager] = None
+
+
+def get_http_client() -> HttpClientManager:
+    """Return the process-wide HTTP client manager."""
+    global _http_client
+    if _http_client is None:
+        _http_client = HttpClientManager(**get_http_client_config())
+    return _http_client
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared pooled session. Do not close it."""
+    return await get_http_client().get_session()
+
+
+@dataclass
+class HttpResponse:
+    """A fully read response, possibly served from the revalidation cache."""
+
+    url: str
+    status: int
+    body: bytes
+    headers: CIMultiDict = field(default_factory=CIMultiDict)
+    charset: Optional[str] = None
+    from_cache: bool = False
+
+    @property
+    def validator(self) -> Optional[str]:
+        """ETag or Last-Modified identifying this version of the body."""
+        return self.headers.get("ETag") or self.headers.get("Last-Modified")
+
+    def text(self) -> str:
+        return self.body.decode(self.charset or "utf-8", errors="replace")
+
+
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def _validated_key(url: str) -> str:
+    return f"http|url={url}"
+
+
+async def get_validated_response(url: str) -> Optional[Dict[str, Any]]:
+    """Return the stored validators and body for `url`, if any."""
+    entry = await aget_cached_json(_validated_key(url), get_cache_ttl_seconds("http"), memory=False)
+    return entry if isinstance(entry, dict) and "body" in entry else None
+
+
+def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a stored entry."""
+    if not entry:
+        return {}
+    headers = {}
+    stored = entry.get("headers", {})
+    if stored.get("ETag"):
+        headers["If-None-Match"] = stored["ETag"]
+    if stored.get("Last-Modified"):
+        headers["If-Modified-Since"] = stored["Last-Modified"]
+    return headers
+
+
+async def save_validated_response(
+    url: str, headers: Any, body: bytes, charset: Optional[str]
+) -> None:
+    """Store a 200 response body if it carries a validator and is small enough."""
+    headers = CIMultiDict(headers)
+    kept = {name: headers[name] for name in _KEPT_HEADERS if headers.get(name)}
+    if not (kept.get("ETag") or kept.get("Last-Modified")):
+        return
+    if len(body) > get_http_validator_max_body_bytes():
+        return
+    entry = {
+        "headers": kept,
+        "charset": charset,
+        "body": base64.b64encode(body).decode("ascii"),
+        "validated": time.time(),
+    }
+    await aset_cached_json(_validated_key(url), entry, kind="http", memory=False)
+
+
+async def refresh_validated_response(url: str, entry: Dict[str, Any]) -> HttpResponse:
+    """Record a 304 for a stored entry and return its body as a 200 response."""
+    entry["validated"] = time.time()
+    await aset_cached_json(_validated_key(url), entry, kind="http", memory=False)
+    return _response_from_entry(url, entry)
+
+
+def _response_from_entry(url: str, entry: Dict[str, Any]) -> HttpResponse:
+    return HttpResponse(
+        url=url,
+        status=200,
+        body=base64.b64decode(entry["body"]),
+        headers=CIMultiDict(entry.get("headers", {})),
+        charset=entry.get("charset"),
+        from_cache=True,
+    )
+
+
+async def conditional_get(
+    url: str,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 30,
+    max_age: float = 0,
+) -> HttpResponse:
+    """GET `url` on the shared session, revalidating a stored copy when there is one.
+
+    Args:
+        url: URL to fetch.
+        headers: Extra request headers.
+        timeout: Total request timeout in seconds.
+        max_age: Serve the stored copy without any request if it was
+            validated less than this many seconds ago.
+
+    Returns:
+        The response; on a 304 the stored body with status 200 and
+        ``from_cache=True``.
+    """
+    entry = await get_validated_response(url)
+    if entry and time.time() - float(entry.get("validated", 0)) < max_age:
+        return _response_from_entry(url, entry)
+
+    request_headers = {**(headers or {}), **conditional_headers(entry)}
+    session = await get_session()
+    try:
+        async with session.get(
+            url,
+            headers=request_headers,
+            timeout=aiohttp.ClientTimeout(total=deadline.clamp(timeout)),
+        ) as response:
+            rate_feedback(url, response.status, response.headers)
+            if response.status == 304 and entry:
+                logger.debug(f"Not modified: {url}")
+                return await refresh_validated_response(url, entry)
+            body = await response.read()
+            result = HttpResponse(
+                url=str(response.url),
+                status=response.status,
+                body=body,
+                headers=CIMultiDict(response.headers),
+                charset=response.charset,
+            )
+    except Exception as e:
+        upstream_error(url, e)
+        raise
+    if result.status == 200:
+        await save_validated_response(url, result.headers, body, result.charset)
+    return result
@@ -19,6 +19,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.routing import Mount, Route
 
+from .lifecycle import lifespan as shared_resources
 from .registry import register_all_tools, get_tool_list
 from . import server as stdio_server
 
@@ -100,7 +101,7 @@ def create_http_app():
 
     @contextlib.asynccontextmanager
     async def lifespan(_: Starlette):
-        async with session_manager.run():
+        async with shared_resources(), session_manager.run():
             yield
 
     # Create main Starlette app with:
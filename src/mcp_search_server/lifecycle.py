@@ -0,0 +1,55 @@
+"""Startup and shutdown of process-wide resources shared by the tools."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import AsyncIterator
+
+from .cache_store import get_cache_janitor, shutdown_cache_io
+from .http_client import get_http_client
+from .tools.web.browser_pool import close_browser_pools
+from .tools.web.extraction_pool import get_extraction_executor, shutdown_extraction_executor
+
+logger = logging.getLogger(__name__)
+
+
+async def startup() -> None:
+    """Start shared resources. Called once by each server entry point."""
+    await get_http_client().start()
+    get_cache_janitor().start()
+    get_extraction_executor().start()
+
+
+async def shutdown() -> None:
+    """Release shared resources. Errors are logged, never raised."""
+    try:
+        await get_cache_janitor().stop()
+    except Exception as exc:
+        logger.warning(f"Failed to stop cache janitor: {exc}")
+    try:
+        await shutdown_cache_io()
+    except Exception as exc:
+        logger.warning(f"Failed to flush cache writes: {exc}")
+    try:
+        await get_http_client().close()
+    except Exception as exc:
+        logger.warning(f"Failed to close HTTP client: {exc}")
+    try:
+        await close_browser_pools()
+    except Exception as exc:
+        logger.warning(f"Failed to close browser pools: {exc}")
+    try:
+        shutdown_extraction_executor()
+    except Exception as exc:
+        logger.warning(f"Failed to stop extraction workers: {exc}")
+
+
+@contextlib.asynccontextmanager
+async def lifespan() -> AsyncIterator[None]:
+    """Run shared resources for the duration of the block."""
+    await startup()
+    try:
+        yield
+    finally:
+        await shutdown()
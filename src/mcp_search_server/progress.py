@@ -0,0 +1,56 @@
+"""MCP progress notifications for long-running tool calls."""
+
+from __future__ import annotations
+
+import inspect
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+
+from mcp.server.lowlevel.server import request_ctx
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _supported_options(session_type: type) -> frozenset[str]:
+    """Optional keyword arguments this session's `send_progress_notification` accepts.
+
+    `message` and `related_request_id` were added in later mcp releases than
+    the minimum we support; older sessions only take the token and counts.
+    """
+    try:
+        parameters = inspect.signature(session_type.send_progress_notification).parameters
+    except (TypeError, ValueError):
+        return frozenset()
+    return frozenset({"message", "related_request_id"} & parameters.keys())
+
+
+async def report_progress(
+    progress: float, total: Optional[float] = None, message: str = ""
+) -> bool:
+    """Send a progress notification for the current tool call.
+
+    Does nothing (and returns False) outside an MCP request or when the client
+    did not ask for progress by sending a progress token.
+    """
+    try:
+        ctx = request_ctx.get()
+    except LookupError:
+        return False
+    token = ctx.meta.progressToken if ctx.meta is not None else None
+    if token is None:
+        return False
+    options: dict[str, Any] = {
+        "message": message or None,
+        "related_request_id": str(ctx.request_id),
+    }
+    supported = _supported_options(type(ctx.session))
+    try:
+        await ctx.session.send_progress_notification(
+            token, progress, total, **{k: v for k, v in options.items() if k in supported}
+        )
+    except Exception as exc:
+        logger.debug(f"Failed to send progress notification: {exc}")
+        return False
+    return True
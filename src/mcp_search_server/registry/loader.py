@@ -54,6 +54,7 @@ def _get_module_path(tool_name: str, config: Dict[str, Any]) -> str:
         "search_web": "unified_search",
         "search_duckduckgo": "duckduckgo",
         "extract_webpage_content": "link_parser",
+        "extract_webpages": "link_parser",
         "assess_source_credibility": "credibility",
     }
 
@@ -163,7 +164,7 @@ def _import_and_get_tool(tool_name: str, tool_conf: Dict[str, Any]) -> BaseTool:
     module_name = tool_name
     if tool_name == "search_web":
         module_name = "unified_search"
-    elif tool_name == "extract_webpage_content":
+    elif tool_name in ("extract_webpage_content", "extract_webpages"):
         module_name = "link_parser"
     elif tool_name == "assess_source_credibility":
         module_name = "credibility"
@@ -212,6 +213,8 @@ def _import_and_get_tool(tool_name: str, tool_conf: Dict[str, Any]) -> BaseTool:
             func = getattr(module, "get_reddit_post_comments", None)
         elif tool_name == "extract_webpage_content":
             func = getattr(module, "extract_content_from_url", None)
+        elif tool_name == "extract_webpages":
+            func = getattr(module, "extract_contents_from_urls", None)
         elif tool_name == "parse_rss":
             func = getattr(module, "search_rss", None)
 
@@ -250,12 +253,13 @@ def register_all_tools(server: Server) -> ToolRegistry:
     tools_conf = config.get("tools", {})
 
     # Always register meta tools immediately
-    from ..tools.meta import search_tools, list_tool_categories, get_tool_info
+    from ..tools.meta import search_tools, list_tool_categories, get_tool_info, get_upstream_status
 
     meta_tools = [
         ("search_tools", search_tools, "Search available tools"),
         ("list_tool_categories", list_tool_categories, "List tool categories"),
         ("get_tool_info", get_tool_info, "Get detailed tool info"),
+        ("get_upstream_status", get_upstream_status, "Get upstream circuit breaker state"),
     ]
 
     for name, func, desc in meta_tools:
@@ -62,6 +62,10 @@ def generate_input_schema(func: Any) -> Dict[str, Any]:
             json_type = get_json_type(param_type)
 
             prop_def = {"type": json_type}
+            item_types = typing.get_args(param_type)
+            if json_type == "array" and len(item_types) == 1:
+                # e.g. List[str]; clients validate array items against this
+                prop_def["items"] = {"type": get_json_type(item_types[0])}
 
             # Add description if we parsed docstrings (omitted for brevity, can add later)
 
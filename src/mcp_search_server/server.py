@@ -21,6 +21,9 @@ from mcp.types import (
 )
 import mcp.server.stdio
 
+from .config_loader import get_tool_timeout_seconds
+from .deadline import deadline_scope
+from .lifecycle import lifespan
 from .registry import register_all_tools, get_tool_list, get_global_registry
 
 # Configure logging
@@ -49,6 +52,28 @@ async def list_tools() -> List[Tool]:
     return get_tool_list(registry)
 
 
+async def _execute_with_deadline(tool: Any, name: str, arguments: dict) -> Any:
+    """
+    Run a tool under its time budget (`tool_timeouts` in search_config.json).
+
+    On timeout the call is cancelled, which also cancels its in-flight HTTP
+    requests and signals executor work to stop. Partial results the tool
+    offered via `deadline.add_partial` are returned instead of an error.
+    """
+    timeout = get_tool_timeout_seconds(name)
+    if not timeout:
+        return await tool.execute(**arguments)
+
+    with deadline_scope(timeout) as budget:
+        try:
+            return await asyncio.wait_for(tool.execute(**arguments), timeout)
+        except asyncio.TimeoutError as exc:
+            logger.warning(f"Tool {name} timed out after {timeout:.0f}s")
+            if not budget.partial:
+                raise TimeoutError(f"Timed out after {timeout:.0f}s") from exc
+            return {"partial": True, "timed_out_after_seconds": timeout, "results": budget.partial}
+
+
 @app.call_tool()
 async def call_tool(
     name: str, arguments: Any
@@ -75,9 +100,9 @@ async def call_tool(
         if not tool:
             raise ValueError(f"Tool not found: {name}")
 
-        # 2. Execute the tool
+        # 2. Execute the tool under its deadline budget
         # BaseTool/FunctionTool handles execution logic
-        result = await tool.execute(**arguments)
+        result = await _execute_with_deadline(tool, name, arguments or {})
 
         # 3. Format the output
         # Simple text representation for now, can be improved to support structured data
@@ -127,9 +152,10 @@ async def main():
         logger.error(f"Failed to initialize registry: {e}")
         # Continue anyway, list_tools might retry or show empty
 
-    # Run server
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    # Run server (shared HTTP pool lives as long as the server)
+    async with lifespan():
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
 
 
 def run():
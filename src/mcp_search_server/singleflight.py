@@ -0,0 +1,91 @@
+"""Single-flight request coalescing for identical concurrent tool calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, TypeVar
+
+from . import deadline
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs at most one upstream call per key at a time.
+
+    Callers that arrive while a call for the same key is in flight await its
+    result instead of starting their own. The shared call runs as its own task,
+    so a cancelled caller does not cancel it for the others. It runs without
+    the starting caller's deadline budget; every caller waits for it only as
+    long as its own budget allows. Results are shared objects and must be
+    treated as read-only.
+    """
+
+    def __init__(self, name: str = "default"):
+        self.name = name
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.stats = {"leaders": 0, "shared": 0, "refreshes": 0}
+
+    def in_flight(self, key: str) -> bool:
+        task = self._calls.get(key)
+        return (
+            task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
+        )
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of `factory()`, sharing it with concurrent callers of `key`.
+
+        Args:
+            key: Coalescing key, normally the cache key of the request.
+            factory: Zero-argument callable returning the awaitable to run.
+
+        Returns:
+            The result of the shared call; its exception is raised to every caller.
+
+        Raises:
+            asyncio.TimeoutError: The caller's deadline ran out before the call finished.
+        """
+        if self.in_flight(key):
+            task = self._calls[key]
+            self.stats["shared"] += 1
+            logger.debug(f"Joining in-flight {self.name} call for '{key}'")
+        else:
+            task = self._start(key, factory)
+        left = deadline.remaining()
+        if left is None:
+            return await asyncio.shield(task)
+        return await asyncio.wait_for(asyncio.shield(task), left)
+
+    def refresh(self, key: str, factory: Callable[[], Awaitable[T]]) -> None:
+        """Start `factory()` in the background unless a call for `key` is in flight.
+
+        Used for stale-while-revalidate: the caller does not wait, and failures
+        are logged rather than raised.
+        """
+        if self.in_flight(key):
+            return
+        self.stats["refreshes"] += 1
+        self._start(key, factory).add_done_callback(lambda done: self._log_refresh(key, done))
+
+    def _start(self, key: str, factory: Callable[[], Awaitable[T]]) -> asyncio.Task:
+        # The task copies the context it is created in: start it in one without
+        # the leader's budget, or every follower gets the leader's truncated result
+        task = deadline.detached_context().run(asyncio.get_running_loop().create_task, factory())
+        self._calls[key] = task
+        self.stats["leaders"] += 1
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return task
+
+    def _log_refresh(self, key: str, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background {self.name} refresh for '{key}' failed: {task.exception()}")
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller went away.
+            task.exception()
@@ -21,11 +21,12 @@ from .base import (
     ToolPriority,
 )
 
-# Web Search & Content (6 tools)
+# Web Search & Content (7 tools)
 from .web import (
     search_web,
     search_duckduckgo,
     extract_webpage_content,
+    extract_webpages,
     parse_pdf,
     search_maps,
     parse_rss,
@@ -72,6 +73,7 @@ from .meta import (
     search_tools,
     list_tool_categories,
     get_tool_info,
+    get_upstream_status,
 )
 
 __all__ = [
@@ -85,6 +87,7 @@ __all__ = [
     "search_web",
     "search_duckduckgo",
     "extract_webpage_content",
+    "extract_webpages",
     "parse_pdf",
     "search_maps",
     "parse_rss",
@@ -113,4 +116,5 @@ __all__ = [
     "search_tools",
     "list_tool_categories",
     "get_tool_info",
+    "get_upstream_status",
 ]
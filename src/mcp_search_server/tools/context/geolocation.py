@@ -4,6 +4,9 @@ import asyncio
 from typing import Dict, Any, Optional
 import aiohttp
 
+from ...http_client import get_session
+from ...utils import rate_feedback, rate_limit
+
 
 async def get_location_by_ip(ip_address: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -23,36 +26,38 @@ async def get_location_by_ip(ip_address: Optional[str] = None) -> Dict[str, Any]
             # Get own public IP location
             url = "http://ip-api.com/json/"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status == 200:
-                    data = await response.json()
-
-                    if data.get("status") == "success":
-                        return {
-                            "ip": data.get("query"),
-                            "country": data.get("country"),
-                            "country_code": data.get("countryCode"),
-                            "region": data.get("regionName"),
-                            "region_code": data.get("region"),
-                            "city": data.get("city"),
-                            "zip": data.get("zip"),
-                            "latitude": data.get("lat"),
-                            "longitude": data.get("lon"),
-                            "timezone": data.get("timezone"),
-                            "isp": data.get("isp"),
-                            "organization": data.get("org"),
-                            "as_number": data.get("as"),
-                            "coordinates": {"lat": data.get("lat"), "lon": data.get("lon")},
-                        }
-                    else:
-                        # API returned error status
-                        return {
-                            "error": data.get("message", "IP lookup failed"),
-                            "ip": ip_address or "auto",
-                        }
+        await rate_limit("ip_api", url)
+        session = await get_session()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            rate_feedback(url, response.status, response.headers)
+            if response.status == 200:
+                data = await response.json()
+
+                if data.get("status") == "success":
+                    return {
+                        "ip": data.get("query"),
+                        "country": data.get("country"),
+                        "country_code": data.get("countryCode"),
+                        "region": data.get("regionName"),
+                        "region_code": data.get("region"),
+                        "city": data.get("city"),
+                        "zip": data.get("zip"),
+                        "latitude": data.get("lat"),
+                        "longitude": data.get("lon"),
+                        "timezone": data.get("timezone"),
+                        "isp": data.get("isp"),
+                        "organization": data.get("org"),
+                        "as_number": data.get("as"),
+                        "coordinates": {"lat": data.get("lat"), "lon": data.get("lon")},
+                    }
                 else:
-                    return {"error": f"HTTP error: {response.status}", "ip": ip_address or "auto"}
+                    # API returned error status
+                    return {
+                        "error": data.get("message", "IP lookup failed"),
+                        "ip": ip_address or "auto",
+                    }
+            else:
+                return {"error": f"HTTP error: {response.status}", "ip": ip_address or "auto"}
 
     except asyncio.TimeoutError:
         return {"error": "Request timed out", "ip": ip_address or "auto"}
@@ -4,7 +4,9 @@ import logging
 from typing import List, Dict, Optional
 from datetime import datetime
 import xml.etree.ElementTree as ET
-import aiohttp
+
+from ...http_client import get_session
+from ...utils import rate_feedback, rate_limit
 
 logger = logging.getLogger(__name__)
 
@@ -40,12 +42,14 @@ class ArxivSearchTool:
 
         try:
             logger.info(f"Searching arXiv for: {query}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.base_url, params=params, headers=self.headers, timeout=15
-                ) as response:
-                    response.raise_for_status()
-                    text = await response.text()
+            await rate_limit("arxiv", self.base_url)
+            session = await get_session()
+            async with session.get(
+                self.base_url, params=params, headers=self.headers, timeout=15
+            ) as response:
+                rate_feedback(self.base_url, response.status, response.headers)
+                response.raise_for_status()
+                text = await response.text()
 
             papers = self._parse_response(text)
 
@@ -114,12 +118,14 @@ class ArxivSearchTool:
 
         try:
             logger.info(f"Fetching arXiv paper: {arxiv_id}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.base_url, params=params, headers=self.headers, timeout=10
-                ) as response:
-                    response.raise_for_status()
-                    text = await response.text()
+            await rate_limit("arxiv", self.base_url)
+            session = await get_session()
+            async with session.get(
+                self.base_url, params=params, headers=self.headers, timeout=10
+            ) as response:
+                rate_feedback(self.base_url, response.status, response.headers)
+                response.raise_for_status()
+                text = await response.text()
 
             papers = self._parse_response(text)
 
@@ -3,9 +3,11 @@
 import asyncio
 import logging
 from typing import List, Dict, Optional
-import aiohttp
+
 from bs4 import BeautifulSoup
 
+from ...http_client import get_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -142,10 +144,10 @@ class GdeltNewsSearchTool:
         try:
             logger.info(f"Extracting content from: {url}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    response.raise_for_status()
-                    html = await response.text()
+            session = await get_session()
+            async with session.get(url, timeout=10) as response:
+                response.raise_for_status()
+                html = await response.text()
 
             # Parse with BeautifulSoup
             soup = BeautifulSoup(html, "html.parser")
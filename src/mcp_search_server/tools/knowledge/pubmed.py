@@ -4,6 +4,8 @@ import asyncio
 import logging
 from typing import List, Dict, Optional
 
+from ...utils import rate_limit
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +26,6 @@ class PubMedSearchTool:
             self.Medline = Medline
             self.email = email
             Entrez.email = email
-            self.request_delay = 0.5  # NCBI limit: 3 req/sec, we use 0.5s to be safe
             self.available = True
         except ImportError:
             logger.warning("Biopython not installed. PubMed tool disabled.")
@@ -48,7 +49,7 @@ class PubMedSearchTool:
             logger.error("PubMed tool not available (Biopython not installed)")
             return None
 
-        await asyncio.sleep(self.request_delay)
+        await rate_limit("entrez")
 
         try:
             logger.info(f"Searching PubMed: {query}")
@@ -88,7 +89,7 @@ class PubMedSearchTool:
         if not self.available:
             return None
 
-        await asyncio.sleep(self.request_delay)
+        await rate_limit("entrez")
 
         try:
             logger.info(f"Fetching details for {len(id_list)} articles")
@@ -4,9 +4,12 @@ import logging
 import re
 from typing import Dict, List, Any, Optional
 from urllib.parse import quote
-import aiohttp
+
 from bs4 import BeautifulSoup
 
+from ...http_client import get_session
+from ...utils import rate_feedback, rate_limit
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,12 +63,14 @@ class WikipediaSearchTool:
         try:
             logger.info(f"Searching Wikipedia for: {query} (lang: {lang})")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    search_url, params=params, headers=self.headers, timeout=10
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            await rate_limit("wikipedia", search_url)
+            session = await get_session()
+            async with session.get(
+                search_url, params=params, headers=self.headers, timeout=10
+            ) as response:
+                rate_feedback(search_url, response.status, response.headers)
+                response.raise_for_status()
+                data = await response.json()
 
             pages = data.get("query", {}).get("pages", {})
             if not pages:
@@ -118,10 +123,12 @@ class WikipediaSearchTool:
         try:
             logger.info(f"Fetching Wikipedia article: {title}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, timeout=10) as response:
-                    response.raise_for_status()
-                    html = await response.text()
+            await rate_limit("wikipedia", url)
+            session = await get_session()
+            async with session.get(url, headers=self.headers, timeout=10) as response:
+                rate_feedback(url, response.status, response.headers)
+                response.raise_for_status()
+                html = await response.text()
 
             soup = BeautifulSoup(html, "html.parser")
 
@@ -204,12 +211,14 @@ class WikipediaSearchTool:
             "rvlimit": "1",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                api_url, params=params, headers=self.headers, timeout=10
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
+        await rate_limit("wikipedia", api_url)
+        session = await get_session()
+        async with session.get(
+            api_url, params=params, headers=self.headers, timeout=10
+        ) as response:
+            rate_feedback(api_url, response.status, response.headers)
+            response.raise_for_status()
+            data = await response.json()
 
         pages = data.get("query", {}).get("pages", {})
 
@@ -279,12 +288,14 @@ class WikipediaSearchTool:
             "format": "json",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                api_url, params=params, headers=self.headers, timeout=10
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
+        await rate_limit("wikipedia", api_url)
+        session = await get_session()
+        async with session.get(
+            api_url, params=params, headers=self.headers, timeout=10
+        ) as response:
+            rate_feedback(api_url, response.status, response.headers)
+            response.raise_for_status()
+            data = await response.json()
 
         raw_sections = data.get("parse", {}).get("sections", [])
         sections: List[Dict[str, Any]] = []
@@ -385,12 +396,14 @@ class WikipediaSearchTool:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    api_url, params=params, headers=self.headers, timeout=10
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            await rate_limit("wikipedia", api_url)
+            session = await get_session()
+            async with session.get(
+                api_url, params=params, headers=self.headers, timeout=10
+            ) as response:
+                rate_feedback(api_url, response.status, response.headers)
+                response.raise_for_status()
+                data = await response.json()
 
             pages = data.get("query", {}).get("pages", {})
             links = []
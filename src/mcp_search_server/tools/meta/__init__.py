@@ -1,9 +1,10 @@
 """Tool discovery and meta tools."""
 
-from .search_tools import search_tools, list_tool_categories, get_tool_info
+from .search_tools import search_tools, list_tool_categories, get_tool_info, get_upstream_status
 
 __all__ = [
     "search_tools",
     "list_tool_categories",
     "get_tool_info",
+    "get_upstream_status",
 ]
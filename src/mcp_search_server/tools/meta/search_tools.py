@@ -136,3 +136,36 @@ async def get_tool_info(tool_name: str) -> Optional[Dict[str, Any]]:
         "defer_loading": tool.metadata.defer_loading,
         "statistics": tool.get_statistics(),
     }
+
+
+async def get_upstream_status(upstream: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get the health of upstream services as seen by this server.
+
+    Args:
+        upstream: Optional upstream name (e.g. "duckduckgo") or host to report on
+
+    Returns:
+        Circuit breaker state per upstream, rate limiter wait-time metrics,
+        browser pool occupancy, browser render latency/bytes per mode, the
+        learned extractor scores per domain and cache hits/misses per tier
+    """
+    from ...cache_store import get_cache_stats
+    from ...circuit_breaker import get_circuit_breaker_states
+    from ...utils import get_rate_limit_stats
+    from ..web.browser_pool import get_browser_pool_stats
+    from ..web.browser_render import get_render_stats
+    from ..web.extractor_scoreboard import domain_of, get_extractor_scoreboard
+
+    scoreboard = get_extractor_scoreboard()
+    if upstream:
+        await scoreboard.load(domain_of(upstream))
+
+    return {
+        "circuit_breakers": get_circuit_breaker_states(upstream),
+        "rate_limits": get_rate_limit_stats(),
+        "browser_pools": get_browser_pool_stats(),
+        "browser_renders": get_render_stats(),
+        "extractors": scoreboard.snapshot(upstream),
+        "cache": get_cache_stats(),
+    }
@@ -3,7 +3,8 @@
 import logging
 from typing import List, Dict, Optional
 
-from .web.duckduckgo import DuckDuckGoSearchTool
+from ..circuit_breaker import get_circuit_breaker
+from .web.duckduckgo import DuckDuckGoSearchTool, ddg_results
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,7 @@ class SearchManager:
         max_results: int = 10,
         timelimit: Optional[str] = None,
         mode: str = "web",
+        no_cache: bool = False,
     ) -> Optional[List[Dict]]:
         """
         Search with smart fallback.
@@ -49,6 +51,7 @@ class SearchManager:
             max_results: Maximum number of results
             timelimit: Time filter ('d', 'w', 'm', 'y')
             mode: Search mode ('web' or 'news')
+            no_cache: Bypass the shared DuckDuckGo result cache
 
         Returns:
             List of search results or None if all engines fail
@@ -61,6 +64,9 @@ class SearchManager:
                 engine = self.engines.get(engine_name)
                 if not engine:
                     continue
+                if get_circuit_breaker(engine_name).is_open():
+                    logger.warning(f"Skipping {engine_name}: circuit open")
+                    continue
 
                 logger.info(
                     f"Trying {engine_name} for query: '{query}' (mode={mode}, tried={engines_tried})"
@@ -68,7 +74,12 @@ class SearchManager:
                 engines_tried.append(engine_name)
 
                 # Call appropriate search method
-                if mode == "news":
+                if engine_name == "duckduckgo":
+                    # Shared, limit-aware result cache (also used by search_duckduckgo)
+                    results = await ddg_results(
+                        query, max_results, mode=mode, timelimit=timelimit, no_cache=no_cache
+                    )
+                elif mode == "news":
                     # Check if engine supports news search
                     if hasattr(engine, "search_news"):
                         results = await engine.search_news(
@@ -155,6 +166,7 @@ class SearchManager:
         max_results: int = 10,
         timelimit: Optional[str] = None,
         mode: str = "web",
+        no_cache: bool = False,
     ) -> Optional[List[Dict]]:
         """
         Search using specific engine (no fallback).
@@ -165,6 +177,7 @@ class SearchManager:
             max_results: Maximum number of results
             timelimit: Time filter
             mode: Search mode
+            no_cache: Bypass the shared DuckDuckGo result cache
 
         Returns:
             List of search results or None if error
@@ -174,10 +187,18 @@ class SearchManager:
             logger.error(f"Unknown search engine: {engine}")
             return None
 
+        if get_circuit_breaker(engine).is_open():
+            logger.warning(f"Not searching {engine}: circuit open")
+            return None
+
         logger.info(f"Using {engine} for query: '{query}' (mode={mode})")
 
         try:
-            if mode == "news":
+            if engine == "duckduckgo":
+                return await ddg_results(
+                    query, max_results, mode=mode, timelimit=timelimit, no_cache=no_cache
+                )
+            elif mode == "news":
                 if hasattr(engine_obj, "search_news"):
                     return await engine_obj.search_news(
                         query=query,
@@ -1,10 +1,11 @@
 """GitHub search tool for public repositories and code."""
 
-import asyncio
 import logging
 from typing import List, Dict, Optional
 import base64
-import aiohttp
+
+from ...http_client import conditional_get, get_session
+from ...utils import rate_feedback, rate_limit, upstream_error
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,6 @@ class GitHubSearchTool:
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "MCP-Search-Server/1.0",
         }
-        self.request_delay = 2.0
 
     async def search_repositories(
         self, query: str, sort: str = "stars", max_results: int = 5
@@ -34,26 +34,25 @@ class GitHubSearchTool:
         Returns:
             List of repository metadata
         """
-        # Rate limiting
-        await asyncio.sleep(self.request_delay)
-
         params = {"q": query, "sort": sort, "order": "desc", "per_page": max_results}
 
         try:
             logger.info(f"Searching GitHub repos: {query}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/search/repositories",
-                    params=params,
-                    headers=self.headers,
-                    timeout=10,
-                ) as response:
-                    if response.status == 403:
-                        logger.warning("GitHub API rate limit exceeded")
-                        return None
-
-                    response.raise_for_status()
-                    data = await response.json()
+            await rate_limit("github", self.base_url)
+            session = await get_session()
+            async with session.get(
+                f"{self.base_url}/search/repositories",
+                params=params,
+                headers=self.headers,
+                timeout=10,
+            ) as response:
+                rate_feedback(self.base_url, response.status, response.headers)
+                if response.status == 403:
+                    logger.warning("GitHub API rate limit exceeded")
+                    return None
+
+                response.raise_for_status()
+                data = await response.json()
 
             repos = []
             for item in data.get("items", []):
@@ -74,6 +73,7 @@ class GitHubSearchTool:
             return repos
 
         except Exception as e:
+            upstream_error(self.base_url, e)
             logger.error(f"GitHub repo search error: {e}")
             return None
 
@@ -87,19 +87,19 @@ class GitHubSearchTool:
         Returns:
             README content text
         """
-        await asyncio.sleep(self.request_delay)
-
         try:
             logger.info(f"Fetching README for: {full_name}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/repos/{full_name}/readme", headers=self.headers, timeout=10
-                ) as response:
-                    if response.status == 404:
-                        return None
-
-                    response.raise_for_status()
-                    data = await response.json()
+            await rate_limit("github", self.base_url)
+            session = await get_session()
+            async with session.get(
+                f"{self.base_url}/repos/{full_name}/readme", headers=self.headers, timeout=10
+            ) as response:
+                rate_feedback(self.base_url, response.status, response.headers)
+                if response.status == 404:
+                    return None
+
+                response.raise_for_status()
+                data = await response.json()
 
             # Decode content
             if data.get("encoding") == "base64":
@@ -109,6 +109,7 @@ class GitHubSearchTool:
             return None
 
         except Exception as e:
+            upstream_error(self.base_url, e)
             logger.error(f"Error fetching README: {e}")
             return None
 
@@ -123,22 +124,23 @@ class GitHubSearchTool:
         Returns:
             List of filenames
         """
-        await asyncio.sleep(self.request_delay)
-
         try:
             url = f"{self.base_url}/repos/{full_name}/contents/{path}"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, timeout=10) as response:
-                    if response.status != 200:
-                        return None
+            await rate_limit("github", url)
+            session = await get_session()
+            async with session.get(url, headers=self.headers, timeout=10) as response:
+                rate_feedback(url, response.status, response.headers)
+                if response.status != 200:
+                    return None
 
-                    items = await response.json()
+                items = await response.json()
 
             if isinstance(items, list):
                 return [item["name"] for item in items]
             return []
 
         except Exception as e:
+            upstream_error(self.base_url, e)
             logger.error(f"Error listing files: {e}")
             return None
 
@@ -153,24 +155,24 @@ class GitHubSearchTool:
         Returns:
             File content
         """
-        await asyncio.sleep(self.request_delay)
-
         try:
             # Use raw.githubusercontent.com for better reliability
             url = f"https://raw.githubusercontent.com/{full_name}/master/{path}"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 404:
-                        url = f"https://raw.githubusercontent.com/{full_name}/main/{path}"
-                        async with session.get(url, timeout=10) as response2:
-                            if response2.status == 200:
-                                return await response2.text()
-                            # Fallback to API
-                            return await self._get_file_content_api(full_name, path)
-
-                    if response.status == 200:
-                        return await response.text()
+            # Raw files are revalidated with ETag instead of re-downloaded
+            await rate_limit("github", url)
+            response = await conditional_get(url, timeout=10)
+            if response.status == 404:
+                url = f"https://raw.githubusercontent.com/{full_name}/main/{path}"
+                await rate_limit("github", url)
+                response2 = await conditional_get(url, timeout=10)
+                if response2.status == 200:
+                    return response2.text()
+                # Fallback to API
+                return await self._get_file_content_api(full_name, path)
+
+            if response.status == 200:
+                return response.text()
 
             # Fallback to API
             return await self._get_file_content_api(full_name, path)
@@ -183,16 +185,17 @@ class GitHubSearchTool:
         """Fallback to API if raw content fails"""
         try:
             url = f"{self.base_url}/repos/{full_name}/contents/{path}"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get("encoding") == "base64":
-                            return base64.b64decode(data["content"]).decode(
-                                "utf-8", errors="ignore"
-                            )
+            await rate_limit("github", url)
+            session = await get_session()
+            async with session.get(url, headers=self.headers, timeout=10) as response:
+                rate_feedback(url, response.status, response.headers)
+                if response.status == 200:
+                    data = await response.json()
+                    if data.get("encoding") == "base64":
+                        return base64.b64decode(data["content"]).decode("utf-8", errors="ignore")
             return None
-        except Exception:
+        except Exception as e:
+            upstream_error(url, e)
             return None
 
 
@@ -1,11 +1,12 @@
 """Reddit search tool using public JSON API."""
 
-import asyncio
 import logging
 import random
 from typing import List, Dict, Optional
 from datetime import datetime
-import aiohttp
+
+from ...http_client import get_session
+from ...utils import rate_feedback, rate_limit, upstream_error
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,6 @@ class RedditSearchTool:
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
         ]
-        self.request_delay = 2.0
 
     def _get_headers(self) -> Dict:
         """Get headers with random User-Agent"""
@@ -48,8 +48,6 @@ class RedditSearchTool:
         Returns:
             List of posts metadata
         """
-        await asyncio.sleep(self.request_delay)
-
         try:
             if subreddit:
                 url = f"{self.base_url}/r/{subreddit}/search.json"
@@ -66,16 +64,18 @@ class RedditSearchTool:
 
             logger.info(f"Searching Reddit: {query} (subreddit: {subreddit})")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, params=params, headers=self._get_headers(), timeout=10
-                ) as response:
-                    if response.status == 429:
-                        logger.warning("Reddit API rate limit exceeded")
-                        return None
+            await rate_limit("reddit", url)
+            session = await get_session()
+            async with session.get(
+                url, params=params, headers=self._get_headers(), timeout=10
+            ) as response:
+                rate_feedback(url, response.status, response.headers)
+                if response.status == 429:
+                    logger.warning("Reddit API rate limit exceeded")
+                    return None
 
-                    response.raise_for_status()
-                    data = await response.json()
+                response.raise_for_status()
+                data = await response.json()
 
             posts = []
             for child in data.get("data", {}).get("children", []):
@@ -103,6 +103,7 @@ class RedditSearchTool:
             return posts
 
         except Exception as e:
+            upstream_error(url, e)
             logger.error(f"Reddit search error: {e}")
             return None
 
@@ -117,8 +118,6 @@ class RedditSearchTool:
         Returns:
             List of comments
         """
-        await asyncio.sleep(self.request_delay)
-
         try:
             # Ensure URL ends with .json
             if not url.endswith(".json"):
@@ -135,12 +134,14 @@ class RedditSearchTool:
 
             logger.info(f"Fetching comments from: {url}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self._get_headers(), timeout=10) as response:
-                    if response.status != 200:
-                        return None
+            await rate_limit("reddit", url)
+            session = await get_session()
+            async with session.get(url, headers=self._get_headers(), timeout=10) as response:
+                rate_feedback(url, response.status, response.headers)
+                if response.status != 200:
+                    return None
 
-                    data = await response.json()
+                data = await response.json()
 
             # Reddit returns a list: [post_data, comments_data]
             if not isinstance(data, list) or len(data) < 2:
@@ -169,23 +170,24 @@ class RedditSearchTool:
             return comments
 
         except Exception as e:
+            upstream_error(url, e)
             logger.error(f"Error fetching comments: {e}")
             return None
 
     async def get_subreddit_hot(self, subreddit: str, limit: int = 10) -> Optional[List[Dict]]:
         """Get hot posts from a subreddit"""
-        await asyncio.sleep(self.request_delay)
-
         try:
             url = f"{self.base_url}/r/{subreddit}/hot.json"
             params = {"limit": limit}
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, params=params, headers=self._get_headers(), timeout=10
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            await rate_limit("reddit", url)
+            session = await get_session()
+            async with session.get(
+                url, params=params, headers=self._get_headers(), timeout=10
+            ) as response:
+                rate_feedback(url, response.status, response.headers)
+                response.raise_for_status()
+                data = await response.json()
 
             posts = []
             for child in data.get("data", {}).get("children", []):
@@ -200,7 +202,8 @@ class RedditSearchTool:
                 )
 
             return posts
-        except Exception:
+        except Exception as e:
+            upstream_error(url, e)
             return None
 
 
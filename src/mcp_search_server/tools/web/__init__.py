@@ -2,6 +2,7 @@
 
 from .duckduckgo import search_duckduckgo
 from .link_parser import extract_content_from_url as extract_webpage_content
+from .link_parser import extract_contents_from_urls as extract_webpages
 from .pdf_parser import parse_pdf
 from .maps_tool import search_maps
 from .rss_tool import search_rss as parse_rss
@@ -10,6 +11,7 @@ from .unified_search import search_web
 __all__ = [
     "search_duckduckgo",
     "extract_webpage_content",
+    "extract_webpages",
     "parse_pdf",
     "search_maps",
     "parse_rss",
@@ -0,0 +1,324 @@
+"""Pool of warm headless browser workers for the Selenium/undetected fallbacks.
+
+Starting Chrome (and resolving chromedriver) takes several seconds, so
+drivers are kept alive between pages instead of being launched per URL.
+Workers are health-checked before use, have their tab state reset after
+each page, and are recycled after `max_pages` pages or once the browser
+process tree grows past `max_memory_mb`. Callers beyond `size` wait in a
+bounded queue; when it is full the pool rejects immediately. A waiter is
+woken by a returned worker or, when a worker is retired, by a free slot it
+then fills with a new driver.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from ... import deadline
+from ...config_loader import get_browser_pool_config
+
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BrowserPoolBusy(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+@dataclass
+class BrowserWorker:
+    """One long-lived browser driver and its usage counters."""
+
+    driver: Any
+    worker_id: int
+    created: float = field(default_factory=time.monotonic)
+    pages: int = 0
+    reusable: bool = True
+
+
+class BrowserPool:
+    """Bounded pool of browser drivers created by `driver_factory`.
+
+    `driver_factory` is a blocking zero-argument callable returning a
+    Selenium-compatible driver. All driver calls run on the pool's own
+    threads, so slow renders do not starve the default executor.
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], Any],
+        *,
+        name: str = "browser",
+        size: int = 2,
+        max_pages: int = 50,
+        max_memory_mb: int = 1024,
+        max_queue: int = 8,
+        acquire_timeout: float = 30.0,
+    ):
+        self.driver_factory = driver_factory
+        self.name = name
+        self.size = max(1, int(size))
+        self.max_pages = max(1, int(max_pages))
+        self.max_memory_mb = max_memory_mb
+        self.max_queue = max(0, int(max_queue))
+        self.acquire_timeout = acquire_timeout
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix=name)
+        # Idle workers, plus None for each slot freed while callers were waiting
+        self._idle: Optional[asyncio.Queue] = None
+        self._total = 0
+        self._free_slots = 0
+        self._waiting = 0
+        self._next_id = 0
+        self._closed = False
+        self.stats = {
+            "created": 0,
+            "recycled": 0,
+            "unhealthy": 0,
+            "pages": 0,
+            "rejected": 0,
+            "wait_total": 0.0,
+        }
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Call `fn(driver, *args)` on a pooled worker and return its result.
+
+        The worker goes back to the pool only once `fn` has returned in its
+        thread, even if the caller was cancelled meanwhile; the cancellation
+        is signalled to `fn` through `deadline.cancelled()`.
+
+        Raises:
+            BrowserPoolBusy: All workers are busy and `max_queue` callers wait.
+            asyncio.TimeoutError: No worker became free within the wait limit.
+        """
+        worker = await self._acquire()
+        loop = asyncio.get_running_loop()
+
+        def job() -> T:
+            try:
+                return fn(worker.driver, *args)
+            finally:
+                worker.pages += 1
+                worker.reusable = self._reset(worker) and not self._worn_out(worker)
+                loop.call_soon_threadsafe(self._release, worker)
+
+        context, cancelled = deadline.executor_context()
+        future = asyncio.wrap_future(self._executor.submit(context.run, job))
+        try:
+            # Shielded: the job must run (and release the worker) even if we go away
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            future.add_done_callback(lambda done: done.cancelled() or done.exception())
+            raise
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return pool occupancy and counters for inspection."""
+        idle = self._idle.qsize() - self._free_slots if self._idle is not None else 0
+        return {"workers": self._total, "idle": idle, "waiting": self._waiting, **self.stats}
+
+    async def close(self) -> None:
+        """Quit every idle driver; busy ones are quit when they are released."""
+        self._closed = True
+        while self._idle is not None and not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker is None:
+                self._free_slots -= 1
+            else:
+                await self._retire(worker)
+        self._executor.shutdown(wait=False)
+
+    async def _acquire(self) -> BrowserWorker:
+        if self._closed:
+            raise RuntimeError(f"Browser pool {self.name} is closed")
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+
+        while True:
+            worker = None
+            if not self._idle.empty():
+                worker = self._idle.get_nowait()
+                self._free_slots -= worker is None
+            elif self._total >= self.size:
+                if self._waiting >= self.max_queue:
+                    self.stats["rejected"] += 1
+                    raise BrowserPoolBusy(
+                        f"All {self.size} {self.name} workers busy, {self._waiting} queued"
+                    )
+                self._waiting += 1
+                started = time.monotonic()
+                try:
+                    worker = await asyncio.wait_for(
+                        self._idle.get(), deadline.clamp(self.acquire_timeout)
+                    )
+                    self._free_slots -= worker is None
+                finally:
+                    self._waiting -= 1
+                    self.stats["wait_total"] += time.monotonic() - started
+            if worker is None:
+                if self._total >= self.size:
+                    continue  # A freed slot another caller has already filled
+                worker = await self._spawn()
+
+            check = asyncio.ensure_future(self._call(self._healthy, worker))
+            try:
+                healthy = await asyncio.shield(check)
+            except BaseException:
+                # Cancelled mid-check: the worker goes back (or is retired) once
+                # the check finishes, so its slot is not lost
+                check.add_done_callback(lambda done, w=worker: self._after_check(w, done))
+                raise
+            if healthy:
+                return worker
+            self.stats["unhealthy"] += 1
+            await self._retire(worker)
+
+    async def _spawn(self) -> BrowserWorker:
+        self._total += 1
+        future = asyncio.ensure_future(self._call(self.driver_factory))
+        try:
+            driver = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self._free_slot()
+            # The browser is still starting; quit it once it is up
+            future.add_done_callback(self._quit_orphan)
+            raise
+        except BaseException:
+            self._free_slot()
+            raise
+        self._next_id += 1
+        self.stats["created"] += 1
+        logger.info(f"Started {self.name} worker {self._next_id} ({self._total}/{self.size})")
+        return BrowserWorker(driver=driver, worker_id=self._next_id)
+
+    def _release(self, worker: BrowserWorker) -> None:
+        self.stats["pages"] += 1
+        if worker.reusable and not self._closed and self._idle is not None:
+            self._idle.put_nowait(worker)
+            return
+        self.stats["recycled"] += 1
+        asyncio.get_running_loop().create_task(self._retire(worker))
+
+    async def _retire(self, worker: BrowserWorker) -> None:
+        self._free_slot()
+        logger.debug(f"Retiring {self.name} worker {worker.worker_id} after {worker.pages} pages")
+        try:
+            # Default executor: the pool's own threads may already be shut down
+            await asyncio.get_running_loop().run_in_executor(None, worker.driver.quit)
+        except Exception as exc:
+            logger.warning(f"Error closing {self.name} driver: {exc}")
+
+    def _free_slot(self) -> None:
+        """Give up a worker's slot, waking a waiting caller to start a replacement."""
+        self._total -= 1
+        if self._idle is not None and self._waiting > self._free_slots and not self._closed:
+            self._free_slots += 1
+            self._idle.put_nowait(None)
+
+    def _after_check(self, worker: BrowserWorker, check: asyncio.Future) -> None:
+        healthy = not check.cancelled() and check.exception() is None and check.result()
+        if healthy and not self._closed and self._idle is not None:
+            self._idle.put_nowait(worker)
+        else:
+            asyncio.get_running_loop().create_task(self._retire(worker))
+
+    @staticmethod
+    def _quit_orphan(future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            asyncio.get_running_loop().run_in_executor(None, future.result().quit)
+
+    async def _call(self, fn: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    @staticmethod
+    def _healthy(worker: BrowserWorker) -> bool:
+        try:
+            return worker.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(worker: BrowserWorker) -> bool:
+        """Drop cookies, storage and extra tabs left by the last page."""
+        driver = worker.driver
+        try:
+            handles = list(driver.window_handles)
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            if hasattr(driver, "execute_cdp_cmd"):
+                # delete_all_cookies() only reaches the current origin's cookies
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                origin = driver.execute_script("return window.location.origin")
+                if origin and origin != "null":
+                    driver.execute_cdp_cmd(
+                        "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+                    )
+            else:
+                driver.delete_all_cookies()
+                try:
+                    driver.execute_script(
+                        "window.localStorage.clear(); window.sessionStorage.clear();"
+                    )
+                except Exception:
+                    pass  # Storage is not accessible on every origin
+            driver.get("about:blank")
+            return True
+        except Exception as exc:
+            logger.warning(f"Failed to reset browser worker {worker.worker_id}: {exc}")
+            return False
+
+    def _worn_out(self, worker: BrowserWorker) -> bool:
+        if worker.pages >= self.max_pages:
+            return True
+        memory_mb = _process_tree_memory_mb(worker.driver)
+        return memory_mb is not None and memory_mb > self.max_memory_mb
+
+
+def _process_tree_memory_mb(driver: Any) -> Optional[float]:
+    """Resident memory of the driver and its browser processes, if measurable."""
+    if not PSUTIL_AVAILABLE:
+        return None
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        processes = [process, *process.children(recursive=True)]
+        return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+    except Exception:
+        return None
+
+
+_pools: Dict[str, BrowserPool] = {}
+
+
+def get_browser_pool(name: str, driver_factory: Callable[[], Any]) -> BrowserPool:
+    """Return the shared pool `name`, creating it with `driver_factory` on first use."""
+    pool = _pools.get(name)
+    if pool is None:
+        pool = _pools[name] = BrowserPool(driver_factory, name=name, **get_browser_pool_config())
+    return pool
+
+
+def get_browser_pool_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: pool.snapshot() for name, pool in _pools.items()}
+
+
+async def close_browser_pools() -> None:
+    """Quit all pooled browsers. Called on server shutdown."""
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.close()
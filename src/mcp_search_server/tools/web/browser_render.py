@@ -0,0 +1,289 @@
+"""Lightweight page rendering for the browser fallback.
+
+Text extraction only needs the document and the scripts that build it, so in
+lightweight mode images, fonts, media and third-party trackers are blocked
+through the Chrome DevTools protocol, by URL extension and by host. URL
+patterns cannot tell the type of an extensionless URL, so images are also
+switched off with a Chrome content setting when the driver is created
+(`chrome_prefs()`). Instead of fixed sleeps the page is considered rendered
+once `document.readyState` is complete and no new resources were requested
+for `quiet_seconds`; the whole render is capped at `max_render_seconds`.
+
+Each render records its latency, the bytes the page transferred and the
+requests that were blocked. A blocked request never transfers anything, so
+the bytes it saved are estimated from a typical size for its type.
+`get_render_stats()` reports the averages per engine and mode.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from ... import deadline
+from ...config_loader import get_browser_render_config
+
+logger = logging.getLogger(__name__)
+
+# URL patterns blocked per resource type (Network.setBlockedURLs wildcards)
+BLOCKED_EXTENSIONS: Dict[str, List[str]] = {
+    "image": ["png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"],
+    "font": ["woff", "woff2", "ttf", "otf", "eot"],
+    "media": ["mp4", "webm", "mp3", "m4a", "ogg", "wav", "mov", "m3u8"],
+    "stylesheet": ["css"],
+}
+
+# Hosts blocked per resource type, with their subdomains
+BLOCKED_HOSTS: Dict[str, List[str]] = {
+    "font": ["fonts.googleapis.com", "fonts.gstatic.com", "use.typekit.net", "fonts.bunny.net"],
+    "tracker": [
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "googlesyndication.com",
+        "googleadservices.com",
+        "adservice.google.com",
+        "amazon-adsystem.com",
+        "adnxs.com",
+        "criteo.com",
+        "taboola.com",
+        "outbrain.com",
+        "connect.facebook.net",
+        "scorecardresearch.com",
+        "quantserve.com",
+        "chartbeat.com",
+        "hotjar.com",
+        "clarity.ms",
+        "mixpanel.com",
+        "nr-data.net",
+    ],
+}
+
+# Rough transfer size of one request of each type, for the bytes-saved estimate
+TYPICAL_BYTES: Dict[str, int] = {
+    "image": 40_000,
+    "font": 30_000,
+    "media": 500_000,
+    "stylesheet": 15_000,
+    "tracker": 25_000,
+}
+
+POLL_INTERVAL = 0.1
+
+# Sums what the document and its subresources transferred; blocked requests
+# show up as resource entries without any response bytes.
+_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+const size = e => e.transferSize || e.encodedBodySize || 0;
+return {
+    bytes: resources.reduce((sum, e) => sum + size(e), nav ? size(nav) : 0),
+    requests: resources.length,
+    empty: resources.filter(e => !e.responseEnd || !size(e)).map(e => e.name),
+};
+"""
+
+
+def blocked_url_patterns(kinds: List[str]) -> List[str]:
+    """Return the URL patterns that block the given resource types."""
+    patterns = []
+    for kind in kinds:
+        for ext in BLOCKED_EXTENSIONS.get(kind, []):
+            patterns.extend([f"*.{ext}", f"*.{ext}?*"])
+        for host in BLOCKED_HOSTS.get(kind, []):
+            patterns.extend([f"*://{host}/*", f"*://*.{host}/*"])
+    return patterns
+
+
+def chrome_prefs() -> Dict[str, int]:
+    """Chrome preferences for new drivers: no images at all when lightweight blocks them."""
+    settings = get_browser_render_config()
+    if settings["lightweight"] and "image" in settings["block"]:
+        return {"profile.managed_default_content_settings.images": 2}
+    return {}
+
+
+def prepare(driver: Any) -> bool:
+    """Apply the configured render mode to `driver`; return True if lightweight.
+
+    Pooled drivers are reused, so the block list is set (or cleared) before
+    every page. Drivers without CDP support always render fully.
+    """
+    settings = get_browser_render_config()
+    patterns = blocked_url_patterns(settings["block"]) if settings["lightweight"] else []
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as exc:
+        if patterns:
+            logger.debug(f"Resource blocking unavailable, rendering fully: {exc}")
+        return False
+    return settings["lightweight"]
+
+
+def load(driver: Any, url: str, tag: str) -> None:
+    """Load `url` and wait until it has rendered, within `max_render_seconds`."""
+    settings = get_browser_render_config()
+    budget = deadline.clamp(settings["max_render_seconds"])
+    end = time.monotonic() + budget
+    driver.set_page_load_timeout(budget)
+    driver.set_script_timeout(budget)
+
+    logger.info(f"[{tag}] Loading page (lightweight): {url}")
+    try:
+        driver.get(url)
+    except Exception as e:
+        # A page still loading slow scripts at the cap is usually readable
+        if "timeout" not in str(e).lower():
+            raise
+        logger.warning(f"[{tag}] Render cap reached during page load, continuing: {e}")
+
+    quiet = settings["quiet_seconds"]
+    if _wait_until_quiet(driver, end, quiet):
+        # Trigger lazy-loaded content, then wait for what it requests
+        try:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            driver.execute_script("window.scrollTo(0, 0);")
+            _wait_until_quiet(driver, end, quiet)
+        except Exception as e:
+            logger.warning(f"[{tag}] Scrolling failed: {e}")
+
+
+def _wait_until_quiet(driver: Any, end: float, quiet: float) -> bool:
+    """Poll until the document is complete and no new resources start for `quiet`.
+
+    Returns False if the render cap was reached first.
+    """
+    last_count = -1
+    stable_since = time.monotonic()
+    while time.monotonic() < end:
+        deadline.check("browser render")
+        try:
+            state, count = driver.execute_script(
+                "return [document.readyState, performance.getEntriesByType('resource').length];"
+            )
+        except Exception:
+            state, count = "loading", last_count
+        now = time.monotonic()
+        if state != "complete" or count != last_count:
+            last_count = count
+            stable_since = now
+        elif now - stable_since >= quiet:
+            return True
+        time.sleep(POLL_INTERVAL)
+    return False
+
+
+def record(driver: Any, engine: str, lightweight: bool, seconds: float) -> Dict[str, Any]:
+    """Measure the rendered page and add it to the render statistics."""
+    metrics = page_metrics(driver)
+    blocked = saved = 0
+    empty = metrics.pop("empty")
+    if lightweight:
+        kinds = get_browser_render_config()["block"]
+        for name in empty:
+            kind = blocked_kind(name, kinds)
+            if kind is not None:
+                blocked += 1
+                saved += TYPICAL_BYTES.get(kind, 0)
+    metrics.update({"blocked": blocked, "bytes_saved": saved, "render_ms": round(seconds * 1000)})
+    _stats.add(engine, lightweight, metrics)
+    return metrics
+
+
+def page_metrics(driver: Any) -> Dict[str, Any]:
+    try:
+        metrics = driver.execute_script(_METRICS_SCRIPT) or {}
+    except Exception:
+        metrics = {}
+    return {
+        "bytes": int(metrics.get("bytes") or 0),
+        "requests": int(metrics.get("requests") or 0),
+        "empty": list(metrics.get("empty") or []),
+    }
+
+
+def blocked_kind(url: str, kinds: List[str]) -> Optional[str]:
+    """Return the type under which `url` is blocked, or None if it is not."""
+    parsed = urlparse(url)
+    path = parsed.path.lower()
+    host = (parsed.hostname or "").lower()
+    for kind in kinds:
+        if any(path.endswith(f".{ext}") for ext in BLOCKED_EXTENSIONS.get(kind, [])):
+            return kind
+        if any(host == h or host.endswith(f".{h}") for h in BLOCKED_HOSTS.get(kind, [])):
+            return kind
+    return None
+
+
+class RenderStats:
+    """Render counts, latency and transferred bytes per engine and mode."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._modes: Dict[str, Dict[str, float]] = {}
+
+    def add(self, engine: str, lightweight: bool, metrics: Dict[str, Any]) -> None:
+        key = f"{engine}:{'lightweight' if lightweight else 'full'}"
+        with self._lock:
+            entry = self._modes.setdefault(
+                key,
+                {
+                    "renders": 0,
+                    "render_ms": 0,
+                    "bytes": 0,
+                    "requests": 0,
+                    "blocked": 0,
+                    "bytes_saved": 0,
+                },
+            )
+            entry["renders"] += 1
+            for field in ("render_ms", "bytes", "requests", "blocked", "bytes_saved"):
+                entry[field] += metrics[field]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Averages per engine and mode.
+
+        Lightweight modes report the estimated bytes blocked requests saved
+        per page; when the same engine also rendered fully, the measured
+        difference in bytes and latency is added.
+        """
+        with self._lock:
+            modes = {key: dict(entry) for key, entry in self._modes.items()}
+        output: Dict[str, Dict[str, Any]] = {}
+        for key, entry in sorted(modes.items()):
+            renders = entry["renders"]
+            output[key] = {
+                "renders": renders,
+                "avg_render_ms": round(entry["render_ms"] / renders),
+                "avg_bytes": round(entry["bytes"] / renders),
+                "avg_requests": round(entry["requests"] / renders, 1),
+                "blocked_requests": entry["blocked"],
+            }
+            if key.endswith(":lightweight"):
+                output[key]["avg_bytes_saved_estimate"] = round(entry["bytes_saved"] / renders)
+        for key, light in output.items():
+            engine, _, mode = key.partition(":")
+            full = output.get(f"{engine}:full")
+            if mode == "lightweight" and full is not None:
+                light["avg_bytes_saved"] = full["avg_bytes"] - light["avg_bytes"]
+                light["avg_ms_saved"] = full["avg_render_ms"] - light["avg_render_ms"]
+        return output
+
+    def reset(self) -> None:
+        with self._lock:
+            self._modes.clear()
+
+
+_stats = RenderStats()
+
+
+def get_render_stats() -> Dict[str, Dict[str, Any]]:
+    return _stats.snapshot()
+
+
+def reset_render_stats() -> None:
+    _stats.reset()
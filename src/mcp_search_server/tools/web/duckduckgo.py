@@ -2,14 +2,18 @@
 
 import asyncio
 import logging
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+
+from ...singleflight import SingleFlight
+from ...utils import rate_feedback, rate_limit, upstream_error
 
 logger = logging.getLogger(__name__)
 
 # Import cache and config utilities
 try:
-    from ...cache_store import get_cached_json, set_cached_json
+    from ...cache_store import aget_cached_json_swr, aset_cached_json
     from ...config_loader import (
+        get_cache_stale_grace_seconds,
         get_cache_ttl_seconds,
         get_dedupe_enabled,
         get_normalize_urls_enabled,
@@ -82,6 +86,7 @@ class DuckDuckGoSearchTool:
         try:
             logger.info(f"Searching DuckDuckGo for: {query}")
 
+            await rate_limit("duckduckgo")
             # Run in executor to avoid blocking
             loop = asyncio.get_event_loop()
             results = await loop.run_in_executor(
@@ -125,14 +130,22 @@ class DuckDuckGoSearchTool:
                         max_results=max_results,
                     )
                 )
+            rate_feedback("duckduckgo", 200)
             return results
         except Exception as e:
             logger.error(f"DDG sync search error: {e}")
+            if _is_rate_limited(e):
+                # Retrying straight away would only extend the block
+                rate_feedback("duckduckgo", 429)
+                return []
             # Fallback
             try:
                 with self.DDGS(proxy=self.proxy, timeout=10) as ddgs:
-                    return list(ddgs.text(query, max_results=max_results))
+                    results = list(ddgs.text(query, max_results=max_results))
+                rate_feedback("duckduckgo", 200)
+                return results
             except Exception:
+                upstream_error("duckduckgo")
                 return []
 
     async def search_news(
@@ -155,6 +168,7 @@ class DuckDuckGoSearchTool:
         try:
             logger.info(f"Searching DuckDuckGo News for: {query}")
 
+            await rate_limit("duckduckgo")
             loop = asyncio.get_event_loop()
             results = await loop.run_in_executor(
                 None, self._search_news_sync, query, max_results, timelimit
@@ -190,23 +204,137 @@ class DuckDuckGoSearchTool:
         try:
             with self.DDGS(proxy=self.proxy, timeout=10) as ddgs:
                 results = list(ddgs.news(query, timelimit=timelimit, max_results=max_results))
+            rate_feedback("duckduckgo", 200)
             return results
         except Exception as e:
             logger.error(f"DDG news sync search error: {e}")
+            if _is_rate_limited(e):
+                rate_feedback("duckduckgo", 429)
+            else:
+                upstream_error("duckduckgo")
             return []
 
 
+def _is_rate_limited(error: Exception) -> bool:
+    """True for the ddgs/duckduckgo_search rate limit error (HTTP 202/429 ratelimit)."""
+    return "ratelimit" in type(error).__name__.lower() or "ratelimit" in str(error).lower()
+
+
 # Global instance
 _ddg_tool = DuckDuckGoSearchTool()
 
 
-# Main search function with caching
+_ddg_flight = SingleFlight("ddg")
+
+
+def _covers(entry: Any, count: int) -> bool:
+    """True if a cached result entry can answer a request for `count` results."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("results"), list)
+        and (len(entry["results"]) >= count or bool(entry.get("exhausted")))
+    )
+
+
+async def _fetch_ddg_results(
+    query: str,
+    count: int,
+    mode: str,
+    timelimit: Optional[str],
+    cache_key: str,
+    previous: Optional[Dict[str, Any]],
+    no_cache: bool,
+) -> List[Dict]:
+    if mode == "news":
+        fetched = await _ddg_tool.search_news(query, count, timelimit)
+    else:
+        fetched = await _ddg_tool.search(query, count, timelimit)
+    if not fetched:
+        # Failed or rate limited: leave the cached entry (and its exhausted flag) alone
+        return list(previous.get("results", [])) if previous else []
+
+    # DDG has no offset paging, so a larger request re-fetches from the top;
+    # keep previously cached results the new page did not return.
+    results = list(fetched)
+    if previous:
+        seen = {r.get("url") for r in results}
+        results.extend(r for r in previous.get("results", []) if r.get("url") not in seen)
+
+    if results and HAS_CACHE:
+        entry = {"results": results, "fetched": count, "exhausted": len(fetched) < count}
+        cache_kind = "news" if mode == "news" else "web"
+        await aset_cached_json(cache_key, entry, kind=cache_kind, no_cache=no_cache)
+    return results
+
+
+async def ddg_results(
+    query: str,
+    count: int,
+    *,
+    mode: str = "web",
+    timelimit: Optional[str] = None,
+    no_cache: bool = False,
+) -> List[Dict]:
+    """
+    Fetch raw (not deduplicated) DuckDuckGo results through the shared result cache.
+
+    Entries are keyed by query, mode and time limit only, and record how many
+    results were requested and whether DDG ran out. Any request for up to that
+    many results is served from the entry; larger requests re-fetch and merge.
+    Expired entries within the stale grace window are served while one
+    background refresh runs.
+
+    Args:
+        query: Search query
+        count: Number of results wanted
+        mode: Search mode (web or news)
+        timelimit: Time limit filter ('d', 'w', 'm', 'y'); news defaults to 'm'
+        no_cache: Disable caching
+
+    Returns:
+        List of results, possibly longer than `count`
+    """
+    if mode == "news":
+        timelimit = timelimit or "m"
+    cache_key = f"ddg|mode={mode}|timelimit={timelimit}|q={query}"
+    cache_kind = "news" if mode == "news" else "web"
+
+    entry = None
+    if HAS_CACHE and not no_cache:
+        entry, stale = await aget_cached_json_swr(
+            cache_key,
+            get_cache_ttl_seconds(cache_kind),
+            get_cache_stale_grace_seconds(cache_kind),
+        )
+        if _covers(entry, count):
+            if stale:
+                logger.info(f"Serving stale results for '{cache_key}', refreshing")
+                refresh_count = max(count, int(entry.get("fetched", count)))
+                _ddg_flight.refresh(
+                    f"{cache_key}|count={refresh_count}",
+                    lambda: _fetch_ddg_results(
+                        query, refresh_count, mode, timelimit, cache_key, None, no_cache
+                    ),
+                )
+            else:
+                logger.info(f"Using cached results for '{cache_key}' ({len(entry['results'])})")
+            return entry["results"]
+        if stale or not isinstance(entry, dict):
+            entry = None
+
+    return await _ddg_flight.do(
+        f"{cache_key}|count={count}",
+        lambda: _fetch_ddg_results(query, count, mode, timelimit, cache_key, entry, no_cache),
+    )
+
+
 async def search_duckduckgo(
     query: str,
     limit: int = 10,
     timelimit: Optional[str] = None,
     mode: str = "web",
     no_cache: bool = False,
+    enrich: Optional[bool] = None,
 ) -> List[Dict]:
     """
     Search DuckDuckGo with caching support.
@@ -217,28 +345,13 @@ async def search_duckduckgo(
         timelimit: Time limit filter ('d', 'w', 'm', 'y')
         mode: Search mode (web or news)
         no_cache: Disable caching
+        enrich: Add a `preview` of the top results (default: enrich.default_enabled)
 
     Returns:
         List of search results
     """
-    cache_key = f"mode={mode}|timelimit={timelimit}|q={query}"
-
-    # Check cache first
-    if HAS_CACHE:
-        cache_kind = "news" if mode == "news" else "web"
-        cached_results = get_cached_json(
-            cache_key, get_cache_ttl_seconds(cache_kind), no_cache=no_cache
-        )
-        if cached_results is not None:
-            logger.info(f"Using cached results for '{cache_key}'")
-            return cached_results[:limit]
-
-    # Perform search
-    if mode == "news":
-        results = await _ddg_tool.search_news(query, limit, timelimit or "m")
-    else:
-        results = await _ddg_tool.search(query, limit, timelimit)
-
+    # Request more for deduplication; the raw list is shared with search_web
+    results = await ddg_results(query, limit * 2, mode=mode, timelimit=timelimit, no_cache=no_cache)
     if not results:
         return []
 
@@ -251,8 +364,7 @@ async def search_duckduckgo(
             normalize_urls=get_normalize_urls_enabled(),
         )
 
-    # Cache results
-    if HAS_CACHE:
-        set_cached_json(cache_key, results, no_cache=no_cache)
+    # Imported here: enrich depends on the web tools package
+    from ...enrich import enrich_if_requested
 
-    return results[:limit]
+    return await enrich_if_requested(results[:limit], enrich, no_cache=no_cache)
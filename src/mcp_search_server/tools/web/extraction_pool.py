@@ -0,0 +1,117 @@
+"""Executor for the CPU-bound HTML extractors.
+
+trafilatura, readability, newspaper and BeautifulSoup hold the GIL while they
+parse, so running them on the default thread pool serializes concurrent
+extractions and stalls the event loop's other work. In process mode they run
+in a pool of worker processes that import the extractor libraries up front;
+each job ships the raw response bytes and charset, and the worker parses them
+into an `HtmlDocument`. The extractor chain is therefore submitted as a single
+job, so a page is parsed once per chain. Every other job for the same page
+(such as the metadata passes of `extract_content_from_url`) parses it again in
+its worker, whereas in thread mode all jobs share the page's own document.
+Machines with fewer than `extraction.process_min_cpus` cores (or
+`extraction.executor = "thread"`) keep using threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from ... import deadline
+from ...config_loader import get_extraction_executor_config
+from .html_document import HtmlDocument
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _preload() -> None:
+    """Worker initializer: import the extractors before the first job arrives."""
+    from . import link_parser  # noqa: F401  (imports trafilatura, readability, newspaper, bs4)
+
+
+def _warm() -> int:
+    return os.getpid()
+
+
+def _run_on_bytes(fn: Callable[..., T], body: bytes, charset: Optional[str], *args: Any) -> T:
+    return fn(HtmlDocument(body, charset), *args)
+
+
+class ExtractionExecutor:
+    """Runs `fn(document, *args)` for a fetched page in worker processes or threads."""
+
+    def __init__(self, executor: str = "auto", workers: int = 0, process_min_cpus: int = 4):
+        cpus = os.cpu_count() or 1
+        if executor == "auto":
+            executor = "process" if cpus >= process_min_cpus else "thread"
+        self.mode = executor
+        self.workers = workers or max(1, cpus - 1)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.stats = {"process_jobs": 0, "thread_jobs": 0, "restarts": 0}
+
+    def start(self) -> None:
+        """Start the worker processes and preload them without waiting."""
+        if self.mode != "process" or self._pool is not None:
+            return
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_preload,
+        )
+        for _ in range(self.workers):
+            self._pool.submit(_warm)
+        logger.info(f"Started {self.workers} extraction worker processes")
+
+    async def run(self, fn: Callable[..., T], page: Any, *args: Any) -> T:
+        """Run `fn(document, *args)` over `page` (anything with body, charset and document)."""
+        if self.mode == "process":
+            self.start()
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(
+                    self._pool, _run_on_bytes, fn, page.body, page.charset, *args
+                )
+                self.stats["process_jobs"] += 1
+                return result
+            except BrokenProcessPool as exc:
+                # A worker died (OOM, crash in a C extension); restart on next use
+                logger.warning(f"Extraction process pool broken, using a thread: {exc}")
+                self.stats["restarts"] += 1
+                self.shutdown()
+        self.stats["thread_jobs"] += 1
+        return await deadline.run_in_executor(fn, page.document, *args)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "workers": self.workers, **self.stats}
+
+    def shutdown(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_executor: Optional[ExtractionExecutor] = None
+
+
+def get_extraction_executor() -> ExtractionExecutor:
+    """Return the shared extraction executor configured from `extraction`."""
+    global _executor
+    if _executor is None:
+        _executor = ExtractionExecutor(**get_extraction_executor_config())
+    return _executor
+
+
+def shutdown_extraction_executor() -> None:
+    """Stop the worker processes. Called on server shutdown."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -0,0 +1,267 @@
+"""Per-domain scoreboard of extraction outcomes.
+
+The method that works for a site rarely changes, so every run of the
+extraction chain records, per domain and method, whether the method produced
+usable output, how long it took and how much text it returned. Outcomes are
+exponentially time-weighted (`half_life_seconds`), so old evidence fades.
+The chain asks the scoreboard for its HTML method order, and skips straight
+to the browser for domains whose pages were recently blocked. Scores are
+persisted in the disk cache (kind `scoreboard`) and loaded per domain on
+first use.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set
+from urllib.parse import urlparse
+
+from ...cache_store import aget_cached_json, aset_cached_json
+from ...config_loader import get_cache_ttl_seconds, get_extractor_scoreboard_config
+
+logger = logging.getLogger(__name__)
+
+# Assumed success rate of a method with too few samples on a domain
+PRIOR_SUCCESS = 0.5
+
+# Domains kept in memory; the first loaded are dropped beyond this (they stay on disk)
+MAX_DOMAINS = 2048
+
+
+@dataclass
+class Score:
+    """Time-decayed outcome sums for one method (or the block rate) on a domain."""
+
+    weight: float = 0.0
+    successes: float = 0.0
+    latency_ms: float = 0.0
+    chars: float = 0.0
+    updated: float = 0.0
+
+    def decay(self, now: float, half_life: float) -> None:
+        if self.updated and half_life > 0 and now > self.updated:
+            factor = 0.5 ** ((now - self.updated) / half_life)
+            self.weight *= factor
+            self.successes *= factor
+            self.latency_ms *= factor
+            self.chars *= factor
+        self.updated = now
+
+    def add(self, success: bool, latency_ms: float, chars: int, now: float, half_life: float):
+        self.decay(now, half_life)
+        self.weight += 1
+        self.latency_ms += latency_ms
+        if success:
+            self.successes += 1
+            self.chars += chars
+
+    def merge(self, other: "Score", now: float, half_life: float) -> None:
+        self.decay(now, half_life)
+        other.decay(now, half_life)
+        self.weight += other.weight
+        self.successes += other.successes
+        self.latency_ms += other.latency_ms
+        self.chars += other.chars
+
+    @property
+    def rate(self) -> float:
+        return self.successes / self.weight if self.weight else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "samples": round(self.weight, 2),
+            "success_rate": round(self.rate, 3),
+            "avg_latency_ms": round(self.latency_ms / self.weight) if self.weight else None,
+            "avg_chars": round(self.chars / self.successes) if self.successes else None,
+        }
+
+
+@dataclass
+class DomainScores:
+    methods: Dict[str, Score] = field(default_factory=dict)
+    blocked: Score = field(default_factory=Score)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "methods": {name: asdict(score) for name, score in self.methods.items()},
+            "blocked": asdict(self.blocked),
+        }
+
+    @classmethod
+    def from_json(cls, data: Any) -> "DomainScores":
+        scores = cls()
+        if not isinstance(data, dict):
+            return scores
+        try:
+            for name, values in (data.get("methods") or {}).items():
+                scores.methods[name] = Score(**values)
+            scores.blocked = Score(**(data.get("blocked") or {}))
+        except TypeError:
+            return cls()
+        return scores
+
+    def merge(self, other: "DomainScores", now: float, half_life: float) -> None:
+        """Add the outcomes of `other` to these, both decayed to `now`."""
+        for name, score in other.methods.items():
+            self.methods.setdefault(name, Score()).merge(score, now, half_life)
+        self.blocked.merge(other.blocked, now, half_life)
+
+
+def domain_of(url: str) -> str:
+    """Scoreboard key for a URL or bare host: the lower-case host without `www.`."""
+    host = (urlparse(url if "://" in url else f"http://{url}").hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class ExtractorScoreboard:
+    """Learns, per domain, which extraction methods succeed."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        half_life_seconds: float = 604800.0,
+        min_samples: float = 3.0,
+        block_threshold: float = 0.8,
+    ):
+        self.enabled = enabled
+        self.half_life = half_life_seconds
+        self.min_samples = min_samples
+        self.block_threshold = block_threshold
+        self._domains: Dict[str, DomainScores] = {}
+        # Domains whose persisted scores have been merged into `_domains`
+        self._loaded: Set[str] = set()
+
+    async def load(self, domain: str) -> None:
+        """Read the persisted scores of `domain` unless already loaded.
+
+        Outcomes recorded while the read is pending are merged with the
+        persisted ones rather than replaced by them.
+        """
+        if not self.enabled or not domain or domain in self._loaded:
+            return
+        data = await aget_cached_json(
+            _cache_key(domain), get_cache_ttl_seconds("scoreboard"), memory=False
+        )
+        if domain in self._loaded:
+            return  # A concurrent load finished first
+        scores = DomainScores.from_json(data)
+        recorded = self._domains.pop(domain, None)
+        if recorded is not None:
+            scores.merge(recorded, time.time(), self.half_life)
+        self._domains[domain] = scores
+        self._loaded.add(domain)
+        while len(self._domains) > MAX_DOMAINS:
+            evicted = next(iter(self._domains))
+            del self._domains[evicted]
+            self._loaded.discard(evicted)
+
+    async def save(self, domain: str) -> None:
+        """Persist the scores of `domain` (batched by the cache writer)."""
+        if not self.enabled or domain not in self._domains:
+            return
+        # Evicted mid-chain, the domain holds only the latest outcomes: merge its history back
+        await self.load(domain)
+        scores = self._domains.get(domain)
+        if scores is not None:
+            await aset_cached_json(
+                _cache_key(domain), scores.to_json(), kind="scoreboard", memory=False
+            )
+
+    def record(self, domain: str, method: str, success: bool, latency_ms: float, chars: int):
+        """Record one attempt of `method` on `domain`."""
+        if not self.enabled or not domain:
+            return
+        scores = self._scores(domain)
+        score = scores.methods.setdefault(method, Score())
+        score.add(success, latency_ms, chars, time.time(), self.half_life)
+
+    def record_blocked(self, domain: str, blocked: bool) -> None:
+        """Record whether the plain HTTP download of a page on `domain` was blocked."""
+        if not self.enabled or not domain:
+            return
+        self._scores(domain).blocked.add(blocked, 0.0, 0, time.time(), self.half_life)
+
+    def order(self, domain: str, methods: Sequence[str]) -> List[str]:
+        """Return `methods` ordered by their success rate on `domain`.
+
+        Methods with fewer than `min_samples` (decayed) attempts count as
+        `PRIOR_SUCCESS`. Rates are compared in steps of 0.1; within a step
+        the faster method goes first, then the default order.
+        """
+        scores = self._domains.get(domain) if self.enabled else None
+        if scores is None:
+            return list(methods)
+        now = time.time()
+
+        def key(item):
+            index, name = item
+            score = scores.methods.get(name)
+            if score is None:
+                return (-PRIOR_SUCCESS, math.inf, index)
+            score.decay(now, self.half_life)
+            if not self._enough(score):
+                return (-PRIOR_SUCCESS, math.inf, index)
+            return (-round(score.rate, 1), score.latency_ms / score.weight, index)
+
+        return [name for _, name in sorted(enumerate(methods), key=key)]
+
+    def browser_first(self, domain: str) -> bool:
+        """Whether plain downloads from `domain` are blocked often enough to skip them."""
+        scores = self._domains.get(domain) if self.enabled else None
+        if scores is None:
+            return False
+        blocked = scores.blocked
+        blocked.decay(time.time(), self.half_life)
+        return self._enough(blocked) and blocked.rate >= self.block_threshold
+
+    def snapshot(self, domain: Optional[str] = None) -> Dict[str, Any]:
+        """Return per-domain method scores and block rates for inspection."""
+        if domain is not None:
+            domain = domain_of(domain)
+            domains = [domain] if domain in self._domains else []
+        else:
+            domains = sorted(self._domains)
+        output = {}
+        for name in domains:
+            scores = self._domains[name]
+            output[name] = {
+                "order": self.order(name, list(scores.methods)),
+                "browser_first": self.browser_first(name),
+                "blocked": scores.blocked.summary(),
+                "methods": {m: score.summary() for m, score in scores.methods.items()},
+            }
+        return output
+
+    def _enough(self, score: Score) -> bool:
+        # Rounded: samples a few seconds old have decayed by a negligible amount
+        return round(score.weight, 2) >= self.min_samples
+
+    def _scores(self, domain: str) -> DomainScores:
+        scores = self._domains.get(domain)
+        if scores is None:
+            scores = self._domains[domain] = DomainScores()
+        return scores
+
+
+def _cache_key(domain: str) -> str:
+    return f"scoreboard|{domain}"
+
+
+_scoreboard: Optional[ExtractorScoreboard] = None
+
+
+def get_extractor_scoreboard() -> ExtractorScoreboard:
+    """Return the shared scoreboard configured from `extractor_scoreboard`."""
+    global _scoreboard
+    if _scoreboard is None:
+        _scoreboard = ExtractorScoreboard(**get_extractor_scoreboard_config())
+    return _scoreboard
+
+
+def reset_extractor_scoreboard() -> None:
+    """Drop the in-memory scoreboard (persisted scores are reloaded on use)."""
+    global _scoreboard
+    _scoreboard = None
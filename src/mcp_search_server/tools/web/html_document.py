@@ -0,0 +1,72 @@
+"""A downloaded page parsed once with lxml and shared by the HTML extractors.
+
+trafilatura, readability and newspaper each built their own lxml tree from the
+decoded page, and the bs4 method tokenized it again with BeautifulSoup's
+pure-Python `html.parser`. `HtmlDocument` parses the raw response bytes once,
+with the response charset as the encoding hint, and every extractor reads
+that tree (extractors that modify it get a copy). The body is only decoded to
+a string when something asks for `text`, or when the bytes are not valid in
+the declared charset: lxml stops at the first invalid byte, so such pages are
+parsed from the leniently decoded text instead.
+"""
+
+from __future__ import annotations
+
+import copy
+from functools import cached_property
+from typing import Optional
+
+import lxml.html
+from lxml import etree
+
+# Errors after which libxml2 has stopped reading the rest of the bytes
+_ENCODING_ERRORS = {"ERR_INVALID_ENCODING", "ERR_UNKNOWN_ENCODING", "ERR_UNSUPPORTED_ENCODING"}
+
+
+def decode_body(body: bytes, charset: Optional[str]) -> str:
+    """Decode a response body with its charset, falling back to UTF-8 and latin-1."""
+    try:
+        return body.decode(charset or "utf-8")
+    except (UnicodeDecodeError, LookupError):
+        try:
+            return body.decode("utf-8", errors="replace")
+        except Exception:
+            return body.decode("latin-1", errors="replace")
+
+
+def _parser(encoding: Optional[str] = None) -> lxml.html.HTMLParser:
+    return lxml.html.HTMLParser(encoding=encoding, remove_comments=True, remove_pis=True)
+
+
+class HtmlDocument:
+    """Response bytes with a lazily built, shared lxml tree."""
+
+    def __init__(self, body: bytes, charset: Optional[str] = None):
+        self.body = body
+        self.charset = charset
+
+    @cached_property
+    def text(self) -> str:
+        """Body decoded with the response charset (decoded once, on first access)."""
+        return decode_body(self.body, self.charset)
+
+    @cached_property
+    def tree(self) -> lxml.html.HtmlElement:
+        """The parsed document. Treat it as read-only; use `copy_tree()` to modify."""
+        try:
+            parser = _parser(self.charset or "utf-8")
+            tree = lxml.html.document_fromstring(self.body, parser=parser)
+        except LookupError:
+            # Charset libxml2 does not know but Python might
+            return lxml.html.document_fromstring(self.text, parser=_parser())
+        except etree.ParserError:
+            if self.body.strip():
+                raise
+            return lxml.html.document_fromstring("<html><body></body></html>")
+        if any(error.type_name in _ENCODING_ERRORS for error in parser.error_log):
+            return lxml.html.document_fromstring(self.text, parser=_parser())
+        return tree
+
+    def copy_tree(self) -> lxml.html.HtmlElement:
+        """A private copy of `tree` for extractors that modify the document."""
+        return copy.deepcopy(self.tree)
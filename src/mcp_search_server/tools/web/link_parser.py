@@ -12,17 +12,51 @@ import random
 import re
 import ssl
 import time
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
-from typing import Optional, Tuple, Dict, Any
+from dataclasses import dataclass, asdict, field
+from functools import cached_property, lru_cache
+from typing import Optional, Tuple, Dict, Any, Callable, List
 from urllib.parse import urlparse
 
 import aiohttp
-import certifi
 from bs4 import BeautifulSoup
+from lxml import etree
+from multidict import CIMultiDict
 from newspaper import Article
+from newspaper.configuration import Configuration
+from newspaper.parsers import Parser
 from readability import Document
 
+from ...cache_store import (
+    MemoryTier,
+    aget_cached_json,
+    aget_negative,
+    aset_cached_json,
+    aset_negative,
+)
+from ... import deadline
+from ...circuit_breaker import CircuitOpenError
+from ...config_loader import (
+    get_batch_extraction_config,
+    get_cache_memory_max_bytes,
+    get_cache_ttl_seconds,
+)
+from ...http_client import (
+    conditional_headers,
+    get_session,
+    get_ssl_context,
+    get_validated_response,
+    refresh_validated_response,
+    save_validated_response,
+)
+from ...progress import report_progress
+from ...singleflight import SingleFlight
+from ...utils import THROTTLE_STATUSES, rate_feedback, rate_limit, upstream_error
+from . import browser_render
+from .browser_pool import get_browser_pool
+from .extraction_pool import get_extraction_executor
+from .html_document import HtmlDocument
+from .extractor_scoreboard import domain_of, get_extractor_scoreboard
+
 logger = logging.getLogger(__name__)
 
 # Trafilatura - one of the best content extraction libraries
@@ -71,17 +105,30 @@ MAX_CONTENT_SIZE = 5 * 1024 * 1024
 MAX_RETRIES = 3
 RETRY_DELAY_BASE = 1.0  # Base delay in seconds, will be exponentially increased
 
+# Content types that never contain extractable text
+BINARY_CONTENT_TYPES = (
+    "image/",
+    "audio/",
+    "video/",
+    "font/",
+    "application/octet-stream",
+    "application/zip",
+)
+
 # Selenium configuration
 SELENIUM_TIMEOUT = 30  # Timeout for page load
 USE_SELENIUM_FOR_403 = True  # Try Selenium when getting 403 errors
+BROWSER_MIN_SECONDS = 10  # Don't start a browser with less time left in the tool call
 
-# Cache configuration
+# Cache configuration: an in-process LRU bounded by bytes
+# (cache.memory.extract_max_bytes) that writes through to the disk cache
+# (kind 'extract', TTL cache.ttl_seconds.extract)
 ENABLE_CACHE = True
-CACHE_TTL_HOURS = 24  # Cache results for 24 hours
-_content_cache: Dict[str, Tuple[Any, datetime]] = {}
+_content_cache = MemoryTier(get_cache_memory_max_bytes("extract_max_bytes"))
+_extract_flight = SingleFlight("extract")
 
 
-@dataclass
+@dataclass(slots=True)
 class ArticleMetadata:
     """Structured article metadata."""
 
@@ -97,6 +144,18 @@ class ArticleMetadata:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def to_compact(self) -> Dict[str, Any]:
+        """Dict without empty fields, as stored in the disk cache."""
+        return {k: v for k, v in asdict(self).items() if v not in (None, "")}
+
+    @classmethod
+    def from_compact(cls, data: Dict[str, Any]) -> "ArticleMetadata":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+    def size_bytes(self) -> int:
+        """Approximate memory footprint used for the cache byte budget."""
+        return sum(len(v.encode("utf-8")) for v in asdict(self).values() if isinstance(v, str))
+
     def to_text(self, include_metadata: bool = True) -> str:
         """Format as readable text with optional metadata header."""
         parts = []
@@ -116,40 +175,106 @@ class ArticleMetadata:
         return "\n".join(parts)
 
 
+@dataclass
+class FetchedPage:
+    """Raw HTTP response downloaded once and shared by every extractor."""
+
+    url: str
+    body: bytes
+    headers: CIMultiDict = field(default_factory=CIMultiDict)
+    charset: Optional[str] = None
+    status: int = 200
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("Content-Type", "")
+
+    @cached_property
+    def document(self) -> HtmlDocument:
+        """The body parsed once with lxml, shared by every extractor of the page."""
+        return HtmlDocument(self.body, self.charset)
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the response charset (decoded once, on first access)."""
+        return self.document.text
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
 def _get_cache_key(url: str) -> str:
     """Generate cache key for URL."""
     return hashlib.md5(url.encode()).hexdigest()
 
 
-def _get_from_cache(url: str) -> Optional[ArticleMetadata]:
-    """Get cached result if exists and not expired."""
+async def _get_from_cache(url: str) -> Optional[ArticleMetadata]:
+    """Get a cached article from memory, falling back to the disk cache."""
     if not ENABLE_CACHE:
         return None
 
     cache_key = _get_cache_key(url)
-    if cache_key in _content_cache:
-        result, timestamp = _content_cache[cache_key]
-        if datetime.now() - timestamp < timedelta(hours=CACHE_TTL_HOURS):
-            logger.debug(f"Cache hit for {url}")
-            return result
-        else:
-            # Expired, remove from cache
-            del _content_cache[cache_key]
-    return None
+    ttl = get_cache_ttl_seconds("extract")
+    result = _content_cache.get(cache_key, ttl)
+    if result is not None:
+        logger.debug(f"Cache hit for {url}")
+        return result
+
+    data = await aget_cached_json(f"extract|url={url}", ttl, memory=False)
+    if not isinstance(data, dict):
+        return None
+    result = ArticleMetadata.from_compact(data)
+    _content_cache.set(cache_key, time.time(), result, result.size_bytes())
+    logger.debug(f"Disk cache hit for {url}")
+    return result
 
 
-def _set_cache(url: str, result: ArticleMetadata) -> None:
-    """Store result in cache."""
+async def _set_cache(url: str, result: ArticleMetadata) -> None:
+    """Store result in memory and write it through to the disk cache."""
     if not ENABLE_CACHE:
         return
 
-    cache_key = _get_cache_key(url)
-    _content_cache[cache_key] = (result, datetime.now())
+    _content_cache.set(_get_cache_key(url), time.time(), result, result.size_bytes())
+    await aset_cached_json(f"extract|url={url}", result.to_compact(), kind="extract", memory=False)
 
-    # Limit cache size (keep last 1000 entries)
-    if len(_content_cache) > 1000:
-        oldest_key = min(_content_cache, key=lambda k: _content_cache[k][1])
-        del _content_cache[oldest_key]
+
+def classify_failure(error: str) -> Optional[str]:
+    """Map an extraction error message to a negative-cache failure class.
+
+    Returns None for failures that are not worth remembering (e.g. a parser
+    bug or a transient connection reset).
+    """
+    text = (error or "").lower()
+    if "http 404" in text or "http 410" in text:
+        return "not_found"
+    if any(marker in text for marker in ("403", "forbidden", "blocked", "http 401", "http 429")):
+        return "blocked"
+    if "timeout" in text or "timed out" in text:
+        return "timeout"
+    if "pdf content detected" in text or "non-html content" in text:
+        return "non_html"
+    return None
+
+
+async def get_cached_failure(url: str) -> Optional[str]:
+    """Return the remembered error for a URL whose extraction failed recently."""
+    if not ENABLE_CACHE:
+        return None
+    entry = await aget_negative(f"extract|{url}")
+    if entry is None:
+        return None
+    logger.info(f"Skipping {url}: cached {entry['class']} failure")
+    return str(entry.get("error") or "Error: Extraction failed recently")
+
+
+async def _remember_failure(url: str, error: str) -> None:
+    failure_class = classify_failure(error)
+    if failure_class == "timeout" and not deadline.has_time_for(0.5):
+        # The call's own deadline cut the fetch short; that says nothing about the page
+        return
+    if ENABLE_CACHE and failure_class:
+        await aset_negative(f"extract|{url}", failure_class, error)
 
 
 def get_random_user_agent() -> str:
@@ -158,9 +283,14 @@ def get_random_user_agent() -> str:
 
 
 def create_ssl_context() -> ssl.SSLContext:
-    """Create a secure SSL context with certifi certificates."""
-    ssl_context = ssl.create_default_context(cafile=certifi.where())
-    return ssl_context
+    """Return the shared SSL context with certifi certificates."""
+    return get_ssl_context()
+
+
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve (and download if needed) chromedriver once per process."""
+    return ChromeDriverManager().install()
 
 
 def create_chrome_driver(headless: bool = True):
@@ -196,11 +326,12 @@ def create_chrome_driver(headless: bool = True):
     prefs = {
         "profile.default_content_setting_values.notifications": 2,
         "profile.default_content_settings.popups": 0,
+        **browser_render.chrome_prefs(),
     }
     chrome_options.add_experimental_option("prefs", prefs)
 
     try:
-        service = Service(ChromeDriverManager().install())
+        service = Service(_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
 
         # Execute CDP commands to hide webdriver
@@ -251,34 +382,67 @@ class AsyncLinkParser:
             return False
 
 
-async def fetch_html_with_retry(
-    url: str, session: aiohttp.ClientSession, timeout: int = 10, max_retries: int = MAX_RETRIES
-) -> Tuple[Optional[str], Optional[str]]:
+async def fetch_page_with_retry(
+    url: str,
+    session: aiohttp.ClientSession,
+    timeout: int = 10,
+    max_retries: int = MAX_RETRIES,
+    headers: Optional[Dict[str, str]] = None,
+) -> Tuple[Optional[FetchedPage], Optional[str]]:
     """
-    Fetch HTML content with retry logic and proper error handling.
+    Download a page once with retry logic and proper error handling.
 
-    Returns: (html_content, error_message)
+    The raw bytes, response headers and charset are kept so that every
+    extraction method can work from the same buffer.
+
+    Returns: (page, error_message)
     """
     last_error = None
 
+    # Revalidate a stored copy instead of downloading it again
+    validated = await get_validated_response(url)
+    request_headers = {**(headers or {}), **conditional_headers(validated)}
+
     for attempt in range(max_retries):
+        if not deadline.has_time_for(0.5):
+            last_error = last_error or "Deadline exceeded"
+            break
         try:
+            await rate_limit("web_parser", url)
             async with session.get(
                 url,
-                timeout=aiohttp.ClientTimeout(total=timeout),
+                headers=request_headers,
+                timeout=aiohttp.ClientTimeout(total=deadline.clamp(timeout)),
                 allow_redirects=True,
                 max_redirects=5,
             ) as response:
-                # Handle rate limiting
-                if response.status == 429:
-                    retry_after = response.headers.get(
-                        "Retry-After", str(RETRY_DELAY_BASE * (2**attempt))
+                # Throttles without Retry-After pause for the backoff delay
+                rate_feedback(
+                    url,
+                    response.status,
+                    response.headers,
+                    default_retry_after=RETRY_DELAY_BASE * (2**attempt),
+                )
+                if response.status == 304 and validated:
+                    cached = await refresh_validated_response(url, validated)
+                    logger.debug(f"Not modified, reusing stored body for {url}")
+                    return (
+                        FetchedPage(
+                            url=url,
+                            body=cached.body,
+                            headers=cached.headers,
+                            charset=cached.charset,
+                        ),
+                        None,
                     )
-                    wait_time = min(float(retry_after), 30)  # Cap at 30 seconds
+
+                # Throttled: rate_feedback() slowed this host down for every
+                # caller and rate_limit() waits out Retry-After before the next attempt
+                if response.status in THROTTLE_STATUSES:
                     logger.warning(
-                        f"Rate limited on {url}, waiting {wait_time}s (attempt {attempt + 1})"
+                        f"Throttled ({response.status}) on {url} (attempt {attempt + 1})"
                     )
-                    await asyncio.sleep(wait_time)
+                    last_error = f"HTTP {response.status}"
                     continue
 
                 # Handle server errors with retry
@@ -287,7 +451,7 @@ async def fetch_html_with_retry(
                     logger.warning(
                         f"Server error {response.status} on {url}, retrying in {wait_time}s"
                     )
-                    await asyncio.sleep(wait_time)
+                    await asyncio.sleep(deadline.clamp(wait_time))
                     continue
 
                 response.raise_for_status()
@@ -305,6 +469,8 @@ async def fetch_html_with_retry(
                 ):
                     if "application/pdf" in content_type.lower():
                         return None, "PDF content detected - use PDF parser"
+                    if content_type.lower().startswith(BINARY_CONTENT_TYPES):
+                        return None, f"Non-HTML content: {content_type}"
                     if not content_type or "text" not in content_type.lower():
                         logger.warning(f"Unexpected content type: {content_type}")
 
@@ -318,29 +484,29 @@ async def fetch_html_with_retry(
                         break
                     chunks.append(chunk)
 
-                # Detect encoding
-                html_bytes = b"".join(chunks)
-                encoding = response.charset or "utf-8"
-
-                # Try to decode with detected encoding, fallback to utf-8 with errors='replace'
-                try:
-                    html = html_bytes.decode(encoding)
-                except (UnicodeDecodeError, LookupError):
-                    try:
-                        html = html_bytes.decode("utf-8", errors="replace")
-                    except Exception:
-                        html = html_bytes.decode("latin-1", errors="replace")
-
-                return html, None
-
-        except asyncio.TimeoutError:
+                page = FetchedPage(
+                    url=str(response.url),
+                    body=b"".join(chunks),
+                    headers=CIMultiDict(response.headers),
+                    charset=response.charset,
+                    status=response.status,
+                )
+                if total_size <= MAX_CONTENT_SIZE:
+                    await save_validated_response(url, page.headers, page.body, page.charset)
+                return page, None
+
+        except CircuitOpenError as e:
+            # The host keeps failing: don't spend the retry schedule on it
+            return None, str(e)
+        except asyncio.TimeoutError as e:
+            upstream_error(url, e)
             last_error = "Timeout"
             wait_time = RETRY_DELAY_BASE * (2**attempt)
             if attempt < max_retries - 1:
                 logger.warning(
                     f"Timeout on {url}, retrying in {wait_time}s (attempt {attempt + 1})"
                 )
-                await asyncio.sleep(wait_time)
+                await asyncio.sleep(deadline.clamp(wait_time))
         except aiohttp.ClientResponseError as e:
             last_error = f"HTTP {e.status}: {e.message}"
             if e.status in (401, 403, 404):
@@ -348,13 +514,14 @@ async def fetch_html_with_retry(
                 break
             wait_time = RETRY_DELAY_BASE * (2**attempt)
             if attempt < max_retries - 1:
-                await asyncio.sleep(wait_time)
+                await asyncio.sleep(deadline.clamp(wait_time))
         except aiohttp.ClientError as e:
+            upstream_error(url, e)
             last_error = str(e)
             wait_time = RETRY_DELAY_BASE * (2**attempt)
             if attempt < max_retries - 1:
                 logger.warning(f"Client error on {url}: {e}, retrying in {wait_time}s")
-                await asyncio.sleep(wait_time)
+                await asyncio.sleep(deadline.clamp(wait_time))
         except Exception as e:
             last_error = str(e)
             logger.error(f"Unexpected error fetching {url}: {e}")
@@ -363,105 +530,142 @@ async def fetch_html_with_retry(
     return None, f"Error after {max_retries} attempts: {last_error}"
 
 
-async def method1_bs4_async(url: str, session: aiohttp.ClientSession) -> str:
-    """Parse main content from URL using BeautifulSoup (async)."""
-    logger.debug(f"Method 1 (BeautifulSoup) attempting: {url}")
+async def fetch_html_with_retry(
+    url: str, session: aiohttp.ClientSession, timeout: int = 10, max_retries: int = MAX_RETRIES
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Fetch HTML content with retry logic and proper error handling.
 
-    html, error = await fetch_html_with_retry(url, session, timeout=10)
+    Returns: (html_content, error_message)
+    """
+    page, error = await fetch_page_with_retry(
+        url, session, timeout=timeout, max_retries=max_retries
+    )
+    if error or page is None:
+        return None, error
+    return page.text, None
+
+
+async def _resolve_page(
+    url: str, session: Optional[aiohttp.ClientSession], page: Optional[FetchedPage]
+) -> Tuple[Optional[FetchedPage], Optional[str]]:
+    """Return the pre-fetched page, downloading it only if none was given."""
+    if page is not None:
+        return page, None
+    if session is None:
+        return None, "No page or session provided"
+    page, error = await fetch_page_with_retry(url, session, timeout=10)
+    if error or page is None:
+        return None, error
+    return page, None
+
+
+async def method1_bs4_async(
+    url: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    page: Optional[FetchedPage] = None,
+) -> str:
+    """Parse main content from URL by its paragraphs (async)."""
+    logger.debug(f"Method 1 (bs4) attempting: {url}")
+
+    page, error = await _resolve_page(url, session, page)
     if error:
         return f"Error: {error}"
 
     try:
-        loop = asyncio.get_running_loop()
-        content = await loop.run_in_executor(None, _parse_bs4, html, url)
+        content = await get_extraction_executor().run(_parse_bs4, page, url)
         return content
     except Exception as e:
         logger.error(f"Error parsing with BS4 for {url}: {e}")
         return f"Error: {str(e)}"
 
 
-def _parse_bs4(html: str, url: str) -> str:
-    """CPU-bound BeautifulSoup parsing with improved content extraction."""
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Remove unwanted elements
-    unwanted_tags = [
-        "script",
-        "style",
-        "nav",
-        "header",
-        "footer",
-        "aside",
-        "form",
-        "button",
-        "input",
-        "noscript",
-        "iframe",
-        "svg",
-        "video",
-        "audio",
-        "canvas",
-        "map",
-        "object",
-        "embed",
-    ]
-    for tag in soup.find_all(unwanted_tags):
-        tag.decompose()
-
-    # Remove elements with common ad/navigation classes
-    ad_classes = [
-        "ad",
-        "ads",
-        "advertisement",
-        "sidebar",
-        "menu",
-        "navigation",
-        "comment",
-        "social",
-        "share",
-    ]
-    for element in soup.find_all(class_=lambda c: c and any(ad in c.lower() for ad in ad_classes)):
-        element.decompose()
+# Elements the bs4 method drops before collecting paragraphs
+BS4_UNWANTED_TAGS = (
+    "script",
+    "style",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "form",
+    "button",
+    "input",
+    "noscript",
+    "iframe",
+    "svg",
+    "video",
+    "audio",
+    "canvas",
+    "map",
+    "object",
+    "embed",
+)
+BS4_AD_CLASSES = (
+    "ad",
+    "ads",
+    "advertisement",
+    "sidebar",
+    "menu",
+    "navigation",
+    "comment",
+    "social",
+    "share",
+)
+BS4_CONTENT_CLASSES = ("content", "article", "main", "body", "post", "entry", "text")
+
+
+def _has_class(element, keys) -> bool:
+    classes = (element.get("class") or "").lower()
+    return bool(classes) and any(key in classes for key in keys)
+
+
+def _element_text(element, separator: str) -> str:
+    return separator.join(s.strip() for s in element.itertext() if s.strip())
+
+
+def _paragraphs_text(container) -> str:
+    return "".join(_element_text(p, "\n") + "\n\n" for p in container.iter("p"))
+
+
+def _parse_bs4(document: HtmlDocument, url: str) -> str:
+    """CPU-bound paragraph extraction with improved content extraction.
+
+    Keeps its `bs4` method name, but walks a copy of the page's shared lxml
+    tree instead of re-tokenizing the HTML with BeautifulSoup.
+    """
+    root = document.copy_tree()
+
+    # Remove unwanted elements, then elements with common ad/navigation classes
+    for element in list(root.iter(*BS4_UNWANTED_TAGS)):
+        element.drop_tree()
+    for element in list(root.iter(etree.Element)):
+        if element.getparent() is not None and _has_class(element, BS4_AD_CLASSES):
+            element.drop_tree()
 
     article_content = ""
 
     # Try to find article content with priority order
-    # 1. <article> tag
-    article_tag = soup.find("article")
-    if article_tag:
-        for p in article_tag.find_all("p"):
-            article_content += p.get_text(separator="\n", strip=True) + "\n\n"
-        if article_content.strip():
-            return article_content.strip()
-
-    # 2. <main> tag
-    main_tag = soup.find("main")
-    if main_tag:
-        for p in main_tag.find_all("p"):
-            article_content += p.get_text(separator="\n", strip=True) + "\n\n"
-        if article_content.strip():
-            return article_content.strip()
+    # 1. <article> tag, 2. <main> tag
+    for tag in ("article", "main"):
+        container = next(root.iter(tag), None)
+        if container is not None:
+            article_content += _paragraphs_text(container)
+            if article_content.strip():
+                return article_content.strip()
 
     # 3. Content divs with semantic class names
-    content_divs = soup.find_all(
-        "div",
-        class_=lambda c: c
-        and any(
-            key in c.lower()
-            for key in ["content", "article", "main", "body", "post", "entry", "text"]
-        ),
-    )
-    for div in content_divs:
-        for p in div.find_all("p"):
-            article_content += p.get_text(separator="\n", strip=True) + "\n\n"
+    for div in root.iter("div"):
+        if not _has_class(div, BS4_CONTENT_CLASSES):
+            continue
+        article_content += _paragraphs_text(div)
         if article_content.strip():
             return article_content.strip()
 
     # 4. Fallback to all paragraphs
     if not article_content:
-        paragraphs = soup.find_all("p")
-        for p in paragraphs:
-            text = p.get_text(separator="\n", strip=True)
+        for p in root.iter("p"):
+            text = _element_text(p, "\n")
             # Filter out very short paragraphs (likely navigation/buttons)
             if len(text) > 30:
                 article_content += text + "\n\n"
@@ -469,40 +673,59 @@ def _parse_bs4(html: str, url: str) -> str:
     return article_content.strip()
 
 
-async def method2_newspaper_async(url: str, session: aiohttp.ClientSession) -> str:
+async def method2_newspaper_async(
+    url: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    page: Optional[FetchedPage] = None,
+) -> str:
     """Parse content using Newspaper3k (async-safe version)."""
     logger.debug(f"Method 2 (Newspaper3k) attempting: {url}")
     try:
-        # Fetch HTML using our robust async method first
-        html, error = await fetch_html_with_retry(url, session, timeout=10)
+        # Fetch HTML using our robust async method first (unless already downloaded)
+        page, error = await _resolve_page(url, session, page)
         if error:
             return f"Error: {error}"
 
-        loop = asyncio.get_running_loop()
-        content = await loop.run_in_executor(None, _newspaper_parse_html, html, url)
+        content = await get_extraction_executor().run(_newspaper_parse_html, page, url)
         return content
     except Exception as e:
         logger.error(f"Error in method2_newspaper for {url}: {e}")
         return f"Error: {str(e)}"
 
 
-def _newspaper_parse_html(html: str, url: str) -> str:
-    """CPU-bound Newspaper parsing from pre-fetched HTML."""
+def _newspaper_article(document: HtmlDocument, url: str) -> Article:
+    """Parse a newspaper Article from a copy of the page's shared lxml tree."""
+    tree = document.copy_tree()
+    html = document.text
+
+    class SharedTreeParser(Parser):
+        @classmethod
+        def fromstring(cls, source):
+            # Only the page itself; the cleaner also parses small fragments
+            return tree if source is html else super().fromstring(source)
+
+    config = Configuration()
+    config.get_parser = lambda: SharedTreeParser
+    config.fetch_images = False  # the top image is unused and costs extra downloads
+    article = Article(url, config=config)
+    article.set_html(html)  # still needed for newspaper's article hash
+    article.parse()
+    return article
+
+
+def _newspaper_parse_html(document: HtmlDocument, url: str) -> str:
+    """CPU-bound Newspaper parsing from the pre-fetched page."""
     try:
-        article = Article(url)
-        article.set_html(html)
-        article.parse()
+        article = _newspaper_article(document, url)
         return article.text.strip() if article.text else ""
     except Exception as e:
         raise e
 
 
-def _newspaper_parse_with_metadata(html: str, url: str) -> ArticleMetadata:
+def _newspaper_parse_with_metadata(document: HtmlDocument, url: str) -> ArticleMetadata:
     """CPU-bound Newspaper parsing with metadata extraction."""
     try:
-        article = Article(url)
-        article.set_html(html)
-        article.parse()
+        article = _newspaper_article(document, url)
 
         return ArticleMetadata(
             title=article.title if article.title else None,
@@ -529,7 +752,9 @@ def _newspaper_parse(url: str) -> str:
 
 
 async def method0_trafilatura_async(
-    url: str, session: aiohttp.ClientSession
+    url: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    page: Optional[FetchedPage] = None,
 ) -> Tuple[str, Optional[ArticleMetadata]]:
     """
     Parse content using Trafilatura - the best method for article extraction.
@@ -540,21 +765,23 @@ async def method0_trafilatura_async(
 
     logger.debug(f"Method 0 (Trafilatura) attempting: {url}")
 
-    html, error = await fetch_html_with_retry(url, session, timeout=10)
+    page, error = await _resolve_page(url, session, page)
     if error:
         return f"Error: {error}", None
 
     try:
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, _trafilatura_parse, html, url)
+        result = await get_extraction_executor().run(_trafilatura_parse, page, url)
         return result
     except Exception as e:
         logger.error(f"Error parsing with Trafilatura for {url}: {e}")
         return f"Error: {str(e)}", None
 
 
-def _trafilatura_parse(html: str, url: str) -> Tuple[str, Optional[ArticleMetadata]]:
-    """CPU-bound Trafilatura parsing with metadata extraction."""
+def _trafilatura_parse(document: HtmlDocument, url: str) -> Tuple[str, Optional[ArticleMetadata]]:
+    """CPU-bound Trafilatura parsing with metadata extraction.
+
+    Both passes read the shared tree; trafilatura copies it before cleaning.
+    """
     try:
         # Configure trafilatura for best quality extraction
         config = use_config()
@@ -562,7 +789,7 @@ def _trafilatura_parse(html: str, url: str) -> Tuple[str, Optional[ArticleMetada
 
         # First try to get metadata in JSON format
         metadata_result = trafilatura.extract(
-            html,
+            document.tree,
             url=url,
             include_comments=False,
             include_tables=True,
@@ -598,7 +825,7 @@ def _trafilatura_parse(html: str, url: str) -> Tuple[str, Optional[ArticleMetada
         if not content:
             content = (
                 trafilatura.extract(
-                    html,
+                    document.tree,
                     url=url,
                     include_comments=False,
                     include_tables=True,
@@ -622,17 +849,20 @@ def _trafilatura_parse(html: str, url: str) -> Tuple[str, Optional[ArticleMetada
         raise
 
 
-async def method3_readability_async(url: str, session: aiohttp.ClientSession) -> str:
+async def method3_readability_async(
+    url: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    page: Optional[FetchedPage] = None,
+) -> str:
     """Parse content using Readability (async)."""
     logger.debug(f"Method 3 (Readability) attempting: {url}")
 
-    html, error = await fetch_html_with_retry(url, session, timeout=10)
+    page, error = await _resolve_page(url, session, page)
     if error:
         return f"Error: {error}"
 
     try:
-        loop = asyncio.get_running_loop()
-        content = await loop.run_in_executor(None, _readability_parse, html)
+        content = await get_extraction_executor().run(_readability_parse, page)
         return content
     except Exception as e:
         logger.error(f"Error parsing with Readability for {url}: {e}")
@@ -647,58 +877,68 @@ async def method4_selenium_async(url: str) -> str:
     logger.debug(f"Method 4 (Selenium) attempting: {url}")
 
     try:
-        loop = asyncio.get_running_loop()
-        content = await loop.run_in_executor(None, _selenium_parse, url)
+        pool = get_browser_pool("selenium", create_chrome_driver)
+        content = await pool.run(_selenium_parse, url)
         return content
     except Exception as e:
         logger.error(f"Error in method4_selenium for {url}: {e}")
         return f"Error: {str(e)}"
 
 
-def _selenium_parse(url: str) -> str:
-    """CPU/IO-bound Selenium parsing."""
-    driver = None
+def _selenium_full_load(driver, url: str) -> None:
+    """Load `url` with every resource and fixed waits for JavaScript rendering."""
+    driver.set_page_load_timeout(deadline.clamp(SELENIUM_TIMEOUT))
+    # Set script timeout
+    driver.set_script_timeout(deadline.clamp(SELENIUM_TIMEOUT))
+
+    logger.info(f"[SELENIUM] Loading page: {url}")
+
+    # Use 'eager' page load strategy for faster results
     try:
-        logger.info(f"[SELENIUM] Starting driver for {url}")
-        driver = create_chrome_driver(headless=True)
-        driver.set_page_load_timeout(SELENIUM_TIMEOUT)
-        # Set script timeout
-        driver.set_script_timeout(SELENIUM_TIMEOUT)
+        driver.get(url)
+        logger.info("[SELENIUM] Page loaded successfully")
+    except Exception as e:
+        # Sometimes timeout happens but page is loaded
+        if "timeout" not in str(e).lower():
+            logger.error(f"[SELENIUM] Failed to load page: {e}")
+            raise
+        logger.warning(f"[SELENIUM] Timeout during page load, continuing anyway: {e}")
+
+    # Wait for body to be present with longer timeout
+    logger.info("[SELENIUM] Waiting for body element")
+    try:
+        WebDriverWait(driver, deadline.clamp(10)).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        logger.info("[SELENIUM] Body element found")
+    except Exception as e:
+        logger.warning(f"[SELENIUM] Body not found, continuing: {e}")
 
-        logger.info(f"[SELENIUM] Loading page: {url}")
+    # Give JavaScript time to render (adaptive wait)
+    logger.info("[SELENIUM] Waiting for JavaScript rendering")
+    _browser_pause(2)
 
-        # Use 'eager' page load strategy for faster results
-        try:
-            driver.get(url)
-            logger.info("[SELENIUM] Page loaded successfully")
-        except Exception as e:
-            # Sometimes timeout happens but page is loaded
-            if "timeout" not in str(e).lower():
-                logger.error(f"[SELENIUM] Failed to load page: {e}")
-                raise
-            logger.warning(f"[SELENIUM] Timeout during page load, continuing anyway: {e}")
-
-        # Wait for body to be present with longer timeout
-        logger.info("[SELENIUM] Waiting for body element")
-        try:
-            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            logger.info("[SELENIUM] Body element found")
-        except Exception as e:
-            logger.warning(f"[SELENIUM] Body not found, continuing: {e}")
+    # Scroll to load lazy content
+    logger.info("[SELENIUM] Scrolling to load lazy content")
+    try:
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
+        _browser_pause(0.5)
+        driver.execute_script("window.scrollTo(0, 0);")
+        _browser_pause(0.5)
+    except Exception as e:
+        logger.warning(f"[SELENIUM] Scrolling failed: {e}")
 
-        # Give JavaScript time to render (adaptive wait)
-        logger.info("[SELENIUM] Waiting for JavaScript rendering")
-        time.sleep(2)
 
-        # Scroll to load lazy content
-        logger.info("[SELENIUM] Scrolling to load lazy content")
-        try:
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(0.5)
-            driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(0.5)
-        except Exception as e:
-            logger.warning(f"[SELENIUM] Scrolling failed: {e}")
+def _selenium_parse(driver, url: str) -> str:
+    """CPU/IO-bound Selenium parsing on a pooled driver."""
+    try:
+        deadline.check("selenium")
+        started = time.monotonic()
+        lightweight = browser_render.prepare(driver)
+        if lightweight:
+            browser_render.load(driver, url, "SELENIUM")
+        else:
+            _selenium_full_load(driver, url)
 
         # Get page source
         logger.info("[SELENIUM] Extracting page source")
@@ -708,7 +948,12 @@ def _selenium_parse(url: str) -> str:
             logger.error(f"[SELENIUM] Empty or too short HTML: {len(html) if html else 0} bytes")
             raise ValueError("Empty or too short HTML content")
 
-        logger.info(f"[SELENIUM] HTML extracted: {len(html)} bytes")
+        metrics = browser_render.record(driver, "selenium", lightweight, time.monotonic() - started)
+        logger.info(
+            f"[SELENIUM] HTML extracted: {len(html)} bytes, rendered in "
+            f"{metrics['render_ms']}ms ({metrics['bytes']} bytes loaded, "
+            f"{metrics['blocked']} requests blocked, ~{metrics['bytes_saved']} bytes saved)"
+        )
 
         # Parse with BeautifulSoup
         soup = BeautifulSoup(html, "html.parser")
@@ -779,12 +1024,6 @@ def _selenium_parse(url: str) -> str:
     except Exception as e:
         logger.error(f"Selenium parse error for {url}: {e}")
         raise
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception as e:
-                logger.warning(f"Error closing driver: {e}")
 
 
 async def method5_undetected_async(url: str) -> str:
@@ -795,52 +1034,70 @@ async def method5_undetected_async(url: str) -> str:
     logger.debug(f"Method 5 (Undetected ChromeDriver) attempting: {url}")
 
     try:
-        loop = asyncio.get_running_loop()
-        content = await loop.run_in_executor(None, _undetected_parse, url)
+        pool = get_browser_pool("undetected", create_undetected_driver)
+        content = await pool.run(_undetected_parse, url)
         return content
     except Exception as e:
         logger.error(f"Error in method5_undetected for {url}: {e}")
         return f"Error: {str(e)}"
 
 
-def _undetected_parse(url: str) -> str:
-    """CPU/IO-bound Undetected ChromeDriver parsing - best for bot-protected sites."""
-    driver = None
+def create_undetected_driver():
+    """Create an Undetected ChromeDriver instance."""
+    if not UNDETECTED_AVAILABLE:
+        raise ImportError("undetected-chromedriver is not available")
+
+    # Create undetected Chrome options
+    options = uc.ChromeOptions()
+    # Don't use headless - it's often detected
+    # options.add_argument('--headless=new')
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--start-maximized")
+    prefs = browser_render.chrome_prefs()
+    if prefs:
+        options.add_experimental_option("prefs", prefs)
+
+    # Create driver with specific version to avoid detection
+    return uc.Chrome(options=options, version_main=None, use_subprocess=True)
+
+
+def _undetected_full_load(driver, url: str) -> None:
+    """Load `url` with every resource and human-like waits and scrolling."""
+    driver.set_page_load_timeout(deadline.clamp(30))
+
+    logger.info(f"[UNDETECTED] Loading page: {url}")
+    driver.get(url)
+
+    # Random human-like delay
+    wait_time = random.uniform(4, 7)
+    logger.info(f"[UNDETECTED] Waiting {wait_time:.1f}s for content (human-like)")
+    _browser_pause(wait_time)
+
+    # Scroll like a human
     try:
-        logger.info(f"[UNDETECTED] Starting driver for {url}")
-
-        # Create undetected Chrome options
-        options = uc.ChromeOptions()
-        # Don't use headless - it's often detected
-        # options.add_argument('--headless=new')
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--start-maximized")
-
-        # Create driver with specific version to avoid detection
-        driver = uc.Chrome(options=options, version_main=None, use_subprocess=True)
-        driver.set_page_load_timeout(30)
-
-        logger.info(f"[UNDETECTED] Loading page: {url}")
-        driver.get(url)
+        driver.execute_script("window.scrollTo(0, 500);")
+        _browser_pause(random.uniform(0.5, 1.5))
+        driver.execute_script("window.scrollTo(0, 1000);")
+        _browser_pause(random.uniform(0.5, 1.5))
+        driver.execute_script("window.scrollTo(0, 0);")
+        _browser_pause(random.uniform(0.5, 1.0))
+    except Exception:
+        pass
 
-        # Random human-like delay
-        wait_time = random.uniform(4, 7)
-        logger.info(f"[UNDETECTED] Waiting {wait_time:.1f}s for content (human-like)")
-        time.sleep(wait_time)
 
-        # Scroll like a human
-        try:
-            driver.execute_script("window.scrollTo(0, 500);")
-            time.sleep(random.uniform(0.5, 1.5))
-            driver.execute_script("window.scrollTo(0, 1000);")
-            time.sleep(random.uniform(0.5, 1.5))
-            driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(random.uniform(0.5, 1.0))
-        except Exception:
-            pass
+def _undetected_parse(driver, url: str) -> str:
+    """CPU/IO-bound Undetected ChromeDriver parsing - best for bot-protected sites."""
+    try:
+        deadline.check("undetected")
+        started = time.monotonic()
+        lightweight = browser_render.prepare(driver)
+        if lightweight:
+            browser_render.load(driver, url, "UNDETECTED")
+        else:
+            _undetected_full_load(driver, url)
 
         # Get page source
         logger.info("[UNDETECTED] Extracting content")
@@ -850,7 +1107,14 @@ def _undetected_parse(url: str) -> str:
             logger.error(f"[UNDETECTED] Empty or too short HTML: {len(html) if html else 0} bytes")
             raise ValueError("Empty or too short HTML content")
 
-        logger.info(f"[UNDETECTED] HTML extracted: {len(html)} bytes")
+        metrics = browser_render.record(
+            driver, "undetected", lightweight, time.monotonic() - started
+        )
+        logger.info(
+            f"[UNDETECTED] HTML extracted: {len(html)} bytes, rendered in "
+            f"{metrics['render_ms']}ms ({metrics['bytes']} bytes loaded, "
+            f"{metrics['blocked']} requests blocked, ~{metrics['bytes_saved']} bytes saved)"
+        )
 
         # Parse with BeautifulSoup
         soup = BeautifulSoup(html, "html.parser")
@@ -924,18 +1188,12 @@ def _undetected_parse(url: str) -> str:
     except Exception as e:
         logger.error(f"[UNDETECTED] Parse error for {url}: {e}")
         raise
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                logger.info("[UNDETECTED] Driver closed")
-            except Exception as e:
-                logger.warning(f"[UNDETECTED] Error closing driver: {e}")
 
 
-def _readability_parse(html: str) -> str:
+def _readability_parse(document: HtmlDocument) -> str:
     """CPU-bound Readability parsing with improved text extraction."""
-    doc = Document(html)
+    # Readability drops hidden elements from the tree it is given
+    doc = Document(document.copy_tree())
     content_html = doc.summary()
     soup = BeautifulSoup(content_html, "html.parser")
 
@@ -958,165 +1216,306 @@ def _readability_parse(html: str) -> str:
     return clean_text.strip()
 
 
-async def compare_methods_async(url: str) -> Tuple[str, str]:
+# Browser-like headers used for every extraction download
+EXTRACTION_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9,ru;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
+
+
+async def fetch_page_for_extraction(
+    url: str, timings: Optional[Dict[str, float]] = None
+) -> Tuple[Optional[FetchedPage], Optional[str]]:
+    """
+    Download a page once with browser-like headers for the extraction chain.
+
+    Args:
+        url: URL to download
+        timings: Optional dict that receives the download time under "fetch" (ms)
+
+    Returns: (page, error_message)
+    """
+    headers = {"User-Agent": get_random_user_agent(), **EXTRACTION_HEADERS}
+
+    started = time.perf_counter()
+    session = await get_session()
+    page, error = await fetch_page_with_retry(url, session, timeout=10, headers=headers)
+
+    if timings is not None:
+        timings["fetch"] = _elapsed_ms(started)
+    return page, error
+
+
+async def compare_methods_async(
+    url: str,
+    *,
+    page: Optional[FetchedPage] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> Tuple[str, str]:
     """
     Compare parsing methods with early exit optimization.
+
+    The page is downloaded once and the same buffer is handed to every
+    extractor in the chain. For domains the extractor scoreboard knows to
+    block plain downloads, the browser fallback runs first; if it fails the
+    normal chain still runs.
+
+    Args:
+        url: URL to extract content from
+        page: Already downloaded page (skips the download)
+        timings: Optional dict that receives per-step durations in milliseconds
+
     Returns: (content, method_used)
     """
     logger.debug(f"Comparing parsing methods for {url}")
 
-    # Create SSL context and connector
-    ssl_context = create_ssl_context()
-    connector = aiohttp.TCPConnector(
-        ssl=ssl_context, limit=10, limit_per_host=5, ttl_dns_cache=300, enable_cleanup_closed=True
-    )
-
-    # Enhanced headers to appear more like a real browser
-    headers = {
-        "User-Agent": get_random_user_agent(),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9,ru;q=0.8",
-        "Accept-Encoding": "gzip, deflate, br",
-        "DNT": "1",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Sec-Fetch-User": "?1",
-        "Cache-Control": "max-age=0",
-    }
+    timings = {} if timings is None else timings
+    domain = domain_of(url)
+    scoreboard = get_extractor_scoreboard()
+    await scoreboard.load(domain)
 
-    # Cookie jar for session management
-    cookie_jar = aiohttp.CookieJar()
-
-    async with aiohttp.ClientSession(
-        headers=headers,
-        connector=connector,
-        cookie_jar=cookie_jar,
-        timeout=aiohttp.ClientTimeout(total=30),
-    ) as session:
-        # Try Trafilatura first - usually gives best results for articles
-        trafilatura_result = ""
-        trafilatura_metadata = None
-        if TRAFILATURA_AVAILABLE:
-            try:
-                result = await method0_trafilatura_async(url, session)
-                # Handle both tuple and string returns
-                if isinstance(result, tuple):
-                    trafilatura_result, trafilatura_metadata = result
-                else:
-                    trafilatura_result = result
-
-                if (
-                    trafilatura_result
-                    and not trafilatura_result.startswith("Error")
-                    and len(trafilatura_result) > 300
-                ):
-                    logger.info(
-                        f"Early exit: trafilatura gave {len(trafilatura_result)} chars for {url}"
-                    )
-                    return trafilatura_result, "trafilatura"
-            except Exception as e:
-                logger.warning(f"Trafilatura failed: {e}")
-                trafilatura_result = f"Error: {e}"
-
-        # Try readability second
-        readability_result = await method3_readability_async(url, session)
+    try:
         if (
-            readability_result
-            and not readability_result.startswith("Error")
-            and len(readability_result) > 500
+            page is None
+            and scoreboard.browser_first(domain)
+            and not _budget_error("browser fallback", BROWSER_MIN_SECONDS)
         ):
-            logger.info(f"Early exit: readability gave {len(readability_result)} chars for {url}")
-            return readability_result, "readability"
+            logger.info(f"{domain} usually blocks downloads, starting with the browser")
+            success = _first_usable_browser_result(
+                await _run_browser_fallback(url, timings, domain)
+            )
+            if success:
+                return success
 
-        # Try newspaper third
-        newspaper_result = await method2_newspaper_async(url, session)
-        if (
-            newspaper_result
-            and not newspaper_result.startswith("Error")
-            and len(newspaper_result) > 500
-        ):
-            logger.info(f"Early exit: newspaper gave {len(newspaper_result)} chars for {url}")
-            return newspaper_result, "newspaper"
-
-        # Try BeautifulSoup as last resort
-        bs4_result = await method1_bs4_async(url, session)
-        if bs4_result and not bs4_result.startswith("Error") and len(bs4_result) > 200:
-            logger.info(f"Selected bs4: {len(bs4_result)} chars for {url}")
-            return bs4_result, "bs4"
-
-        # Check if we got 403 errors and should try undetected/Selenium
-        selenium_result = ""
-        undetected_result = ""
-
-        if USE_SELENIUM_FOR_403:
-            # Check if all methods failed with 403 or similar bot-detection errors
-            has_403_or_blocked = any(
-                "403" in str(result)
-                or "Forbidden" in str(result)
-                or "blocked" in str(result).lower()
-                for result in [trafilatura_result, readability_result, newspaper_result, bs4_result]
+        fetch_error = None
+        if page is None:
+            page, fetch_error = await fetch_page_for_extraction(url, timings)
+        return await _run_extraction_chain(url, page, fetch_error, timings)
+    finally:
+        await scoreboard.save(domain)
+        if timings:
+            summary = ", ".join(f"{name}={ms:.0f}ms" for name, ms in timings.items())
+            logger.info(f"Extraction timings for {url}: {summary}")
+
+
+def _budget_error(step: str, seconds: float = 0.5) -> Optional[str]:
+    """Return an error result if the tool call has no time left for `step`."""
+    if deadline.has_time_for(seconds):
+        return None
+    logger.info(f"Skipping {step}: tool call deadline reached")
+    return f"Error: Deadline reached before {step}"
+
+
+def _offer_partial(url: str, method: str, content: str) -> None:
+    """Keep the longest usable result so far in case the tool call times out."""
+    budget = deadline.current_budget()
+    if budget is None or not content or content.startswith("Error"):
+        return
+    previous = budget.partial.get(url)
+    if previous is None or len(previous["content"]) < len(content):
+        deadline.add_partial(url, {"method": method, "content": content})
+
+
+def _browser_pause(seconds: float) -> None:
+    """Sleep in a browser worker thread, stopping once the tool call is out of time."""
+    end = time.monotonic() + seconds
+    while True:
+        deadline.check("browser wait")
+        left = end - time.monotonic()
+        if left <= 0:
+            return
+        time.sleep(min(left, 0.25))
+
+
+async def _timed(timings: Dict[str, float], name: str, coro):
+    started = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        timings[name] = _elapsed_ms(started)
+
+
+# HTML extractors in their default order, with the output length at which
+# the chain stops early
+HTML_METHODS = {"trafilatura": 300, "readability": 500, "newspaper": 500, "bs4": 200}
+BROWSER_MIN_CHARS = 200
+
+
+def _usable(result: str, min_chars: int) -> bool:
+    return bool(result) and not result.startswith("Error") and len(result) > min_chars
+
+
+def _trafilatura_text(document: HtmlDocument, url: str) -> str:
+    return _trafilatura_parse(document, url)[0]
+
+
+def _readability_text(document: HtmlDocument, url: str) -> str:
+    return _readability_parse(document)
+
+
+# Blocking parser behind each HTML method
+HTML_PARSERS: Dict[str, Callable[[HtmlDocument, str], str]] = {
+    "trafilatura": _trafilatura_text,
+    "readability": _readability_text,
+    "newspaper": _newspaper_parse_html,
+    "bs4": _parse_bs4,
+}
+
+
+def _run_html_chain(
+    document: HtmlDocument, url: str, names: List[str], seconds_left: Optional[float]
+) -> List[Tuple[str, str, float]]:
+    """Run the HTML methods `names` in order over one document until one is usable.
+
+    Runs as a single extraction job, so a worker process parses the page once
+    for the whole chain. Stops early when less than half a second of
+    `seconds_left` remains. Returns ``(method, result, elapsed_ms)`` for each
+    method that ran.
+    """
+    stop_at = None if seconds_left is None else time.monotonic() + seconds_left - 0.5
+    outcomes: List[Tuple[str, str, float]] = []
+    for name in names:
+        if deadline.cancelled() or (stop_at is not None and time.monotonic() >= stop_at):
+            break
+        started = time.perf_counter()
+        try:
+            result = HTML_PARSERS[name](document, url)
+        except Exception as e:
+            logger.warning(f"{name} failed: {e}")
+            result = f"Error: {e}"
+        outcomes.append((name, result, _elapsed_ms(started)))
+        if _usable(result, HTML_METHODS[name]):
+            break
+    return outcomes
+
+
+async def _run_browser_fallback(url: str, timings: Dict[str, float], domain: str) -> Dict[str, str]:
+    """Try undetected-chromedriver, then Selenium; stops at the first usable result."""
+    scoreboard = get_extractor_scoreboard()
+    results: Dict[str, str] = {}
+
+    # Try undetected-chromedriver first (best for bot detection bypass)
+    if UNDETECTED_AVAILABLE:
+        logger.info(f"Detected bot protection, trying Undetected ChromeDriver for {url}")
+        result = await _timed(timings, "undetected", method5_undetected_async(url))
+        results["undetected"] = result
+        ok = _usable(result, BROWSER_MIN_CHARS)
+        scoreboard.record(domain, "undetected", ok, timings["undetected"], len(result))
+        if ok:
+            logger.info(f"Undetected ChromeDriver success: {len(result)} chars for {url}")
+            return results
+
+    # Fallback to regular Selenium if undetected failed
+    if SELENIUM_AVAILABLE and not _budget_error("selenium", BROWSER_MIN_SECONDS):
+        logger.info(f"Trying regular Selenium for {url}")
+        result = await _timed(timings, "selenium", method4_selenium_async(url))
+        results["selenium"] = result
+        ok = _usable(result, BROWSER_MIN_CHARS)
+        scoreboard.record(domain, "selenium", ok, timings["selenium"], len(result))
+        if ok:
+            logger.info(f"Selenium success: {len(result)} chars for {url}")
+    return results
+
+
+def _first_usable_browser_result(results: Dict[str, str]) -> Optional[Tuple[str, str]]:
+    for method, result in results.items():
+        if _usable(result, BROWSER_MIN_CHARS):
+            return result, method
+    return None
+
+
+async def _run_extraction_chain(
+    url: str,
+    page: Optional[FetchedPage],
+    fetch_error: Optional[str],
+    timings: Dict[str, float],
+) -> Tuple[str, str]:
+    """Run the extractor chain over a single downloaded page.
+
+    HTML extractors run in the order learned for the page's domain by the
+    extractor scoreboard (trafilatura, readability, newspaper, bs4 by
+    default), each outcome is recorded back into it. They run as one
+    extraction job over the page's shared document.
+    """
+    # If the download failed every HTML method fails the same way
+    failed = f"Error: {fetch_error}" if fetch_error or page is None else None
+    domain = domain_of(url)
+    scoreboard = get_extractor_scoreboard()
+    await scoreboard.load(domain)
+
+    names = [
+        name
+        for name in scoreboard.order(domain, list(HTML_METHODS))
+        if name != "trafilatura" or TRAFILATURA_AVAILABLE
+    ]
+    outcomes: List[Tuple[str, str, float]] = []
+    if not failed and names and not _budget_error(names[0]):
+        try:
+            outcomes = await get_extraction_executor().run(
+                _run_html_chain, page, url, names, deadline.remaining()
             )
+        except Exception as e:
+            logger.error(f"HTML extraction failed for {url}: {e}")
+            failed = f"Error: {e}"
+
+    results: Dict[str, str] = {}
+    for name, result, elapsed_ms in outcomes:
+        timings[name] = elapsed_ms
+        results[name] = result
+        _offer_partial(url, name, result)
+
+        ok = _usable(result, HTML_METHODS[name])
+        scoreboard.record(domain, name, ok, timings[name], len(result) if ok else 0)
+        if ok:
+            logger.info(f"Early exit: {name} gave {len(result)} chars for {url}")
+            scoreboard.record_blocked(domain, False)
+            return result, name
+    for name in names:
+        # Not run: the download failed or the call ran out of time
+        results.setdefault(name, failed or f"Error: Deadline reached before {name}")
+
+    if USE_SELENIUM_FOR_403:
+        # Check if all methods failed with 403 or similar bot-detection errors
+        has_403_or_blocked = any(
+            "403" in str(result) or "Forbidden" in str(result) or "blocked" in str(result).lower()
+            for result in results.values()
+        )
+        if has_403_or_blocked or not failed:
+            scoreboard.record_blocked(domain, has_403_or_blocked)
 
-            if has_403_or_blocked:
-                # Try undetected-chromedriver first (best for bot detection bypass)
-                if UNDETECTED_AVAILABLE:
-                    logger.info(
-                        f"Detected bot protection, trying Undetected ChromeDriver for {url}"
-                    )
-                    undetected_result = await method5_undetected_async(url)
-                    if (
-                        undetected_result
-                        and not undetected_result.startswith("Error")
-                        and len(undetected_result) > 200
-                    ):
-                        logger.info(
-                            f"Undetected ChromeDriver success: {len(undetected_result)} chars for {url}"
-                        )
-                        return undetected_result, "undetected"
-
-                # Fallback to regular Selenium if undetected failed
-                if SELENIUM_AVAILABLE and (
-                    not undetected_result or undetected_result.startswith("Error")
-                ):
-                    logger.info(f"Trying regular Selenium for {url}")
-                    selenium_result = await method4_selenium_async(url)
-                    if (
-                        selenium_result
-                        and not selenium_result.startswith("Error")
-                        and len(selenium_result) > 200
-                    ):
-                        logger.info(f"Selenium success: {len(selenium_result)} chars for {url}")
-                        return selenium_result, "selenium"
-
-        # Select the best result from what we have
-        results = {
-            "trafilatura": trafilatura_result,
-            "readability": readability_result,
-            "newspaper": newspaper_result,
-            "bs4": bs4_result,
-            "undetected": undetected_result,
-            "selenium": selenium_result,
-        }
+        if has_403_or_blocked and not _budget_error("browser fallback", BROWSER_MIN_SECONDS):
+            browser_results = await _run_browser_fallback(url, timings, domain)
+            results.update(browser_results)
+            success = _first_usable_browser_result(browser_results)
+            if success:
+                return success
 
-        best_result = ""
-        best_method = "none"
-        best_length = 0
+    # Select the best result from what we have
+    best_result = ""
+    best_method = "none"
+    best_length = 0
 
-        for method, result in results.items():
-            if result and not result.startswith("Error") and len(result) > best_length:
-                best_result = result
-                best_method = method
-                best_length = len(result)
+    for method, result in results.items():
+        if result and not result.startswith("Error") and len(result) > best_length:
+            best_result = result
+            best_method = method
+            best_length = len(result)
 
-        if best_result:
-            logger.info(f"Selected {best_method} (longest): {best_length} chars for {url}")
-            return best_result, best_method
+    if best_result:
+        logger.info(f"Selected {best_method} (longest): {best_length} chars for {url}")
+        return best_result, best_method
 
-        logger.warning(f"All methods failed for {url}")
-        return readability_result or "Error: All methods failed", "failed"
+    logger.warning(f"All methods failed for {url}")
+    return results.get("readability") or "Error: All methods failed", "failed"
 
 
 def clean_text(text: str) -> str:
@@ -1183,19 +1582,34 @@ async def extract_content_from_url(url: str) -> str:
     Returns:
         Extracted and cleaned text content
     """
+    content, _ = await _extract_with_method(url)
+    return content
+
+
+async def _extract_with_method(url: str) -> Tuple[str, str]:
+    """Extract cleaned content from `url`; returns (content, method_used)."""
     logger.info(f"Extracting content from: {url}")
 
     if not url or not AsyncLinkParser.is_valid_url(url):
         error_msg = f"Invalid URL: {url}"
         logger.error(error_msg)
-        return f"Error: {error_msg}"
+        return f"Error: {error_msg}", "failed"
 
     # Check cache first
-    cached = _get_from_cache(url)
+    cached = await _get_from_cache(url)
     if cached:
         logger.info(f"Returning cached content for {url}")
-        return cached.content
+        return cached.content, cached.method or "cache"
 
+    failure = await get_cached_failure(url)
+    if failure:
+        return failure, "failed"
+
+    # Identical concurrent extractions share one download
+    return await _extract_flight.do(url, lambda: _extract_content_uncached(url))
+
+
+async def _extract_content_uncached(url: str) -> Tuple[str, str]:
     try:
         content, method_used = await compare_methods_async(url)
         original_length = len(content) if content else 0
@@ -1203,7 +1617,8 @@ async def extract_content_from_url(url: str) -> str:
         logger.info(f"Extracted {original_length} chars from {url} using {method_used}")
 
         if not content or content.startswith("Error"):
-            return content or "Error: No content extracted"
+            await _remember_failure(url, content or "")
+            return content or "Error: No content extracted", "failed"
 
         cleaned_content = clean_text(content)
         cleaned_length = len(cleaned_content)
@@ -1220,14 +1635,91 @@ async def extract_content_from_url(url: str) -> str:
 
         # Cache the result
         if not final_content.startswith("Error"):
-            _set_cache(url, ArticleMetadata(content=final_content, url=url, method=method_used))
+            await _set_cache(
+                url, ArticleMetadata(content=final_content, url=url, method=method_used)
+            )
+            return final_content, method_used
 
-        return final_content
+        return final_content, "failed"
 
     except Exception as e:
         error_msg = f"Critical error extracting {url}: {str(e)}"
         logger.exception(error_msg)
-        return f"Error: {error_msg}"
+        return f"Error: {error_msg}", "failed"
+
+
+async def extract_contents_from_urls(urls: List[str]) -> Dict[str, Any]:
+    """
+    Extract content from several URLs concurrently.
+
+    At most `batch_extraction.concurrency` pages are extracted at once and at
+    most `per_host` from the same host; all downloads share the pooled HTTP
+    session. Results are listed in completion order, and each completion is
+    also sent as an MCP progress notification when the client asked for them.
+
+    Args:
+        urls: URLs to extract (duplicates are dropped, at most `max_urls` are used)
+
+    Returns:
+        Per-URL content, method, timing and error, plus batch totals
+    """
+    settings = get_batch_extraction_config()
+    unique = list(dict.fromkeys(url.strip() for url in urls or [] if url and url.strip()))
+    batch, skipped = unique[: settings["max_urls"]], unique[settings["max_urls"] :]
+    started = time.perf_counter()
+
+    overall = asyncio.Semaphore(settings["concurrency"])
+    per_host: Dict[str, asyncio.Semaphore] = {}
+
+    async def extract_one(index: int, url: str) -> Dict[str, Any]:
+        host = urlparse(url).netloc.lower()
+        host_slots = per_host.setdefault(host, asyncio.Semaphore(settings["per_host"]))
+        # Take the host slot first so waiting on a busy host doesn't hold a global one
+        try:
+            async with host_slots, overall:
+                url_started = time.perf_counter()
+                content, method = await _extract_with_method(url)
+        except Exception as e:
+            # Keep the rest of the batch; cancellation still propagates
+            logger.warning(f"Batch extraction of {url} failed: {e}")
+            content, method = f"Error: {e or type(e).__name__}", "failed"
+        failed = not content or content.startswith("Error")
+        if not failed:
+            deadline.add_partial(url, {"method": method, "content": content})
+        return {
+            "index": index,
+            "url": url,
+            "method": method,
+            "content": None if failed else content,
+            "chars": 0 if failed else len(content),
+            "error": (
+                re.sub(r"^Error:\s*", "", content or "No content extracted") if failed else None
+            ),
+            "elapsed_ms": _elapsed_ms(url_started),
+        }
+
+    tasks = [asyncio.ensure_future(extract_one(i, url)) for i, url in enumerate(batch)]
+    results: List[Dict[str, Any]] = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            entry = await next_done
+            results.append(entry)
+            status = entry["method"] if entry["error"] is None else "failed"
+            await report_progress(len(results), len(tasks), f"{entry['url']}: {status}")
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    succeeded = sum(1 for entry in results if entry["error"] is None)
+    logger.info(f"Batch extraction: {succeeded}/{len(batch)} URLs in {_elapsed_ms(started):.0f}ms")
+    return {
+        "results": results,
+        "total": len(batch),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "skipped": skipped,
+        "elapsed_ms": _elapsed_ms(started),
+    }
 
 
 async def extract_article_with_metadata(url: str) -> ArticleMetadata:
@@ -1246,76 +1738,68 @@ async def extract_article_with_metadata(url: str) -> ArticleMetadata:
         return ArticleMetadata(content=f"Error: Invalid URL: {url}", url=url, method="failed")
 
     # Check cache first
-    cached = _get_from_cache(url)
+    cached = await _get_from_cache(url)
     if cached:
         logger.info(f"Returning cached article for {url}")
         return cached
 
-    # Create session
-    ssl_context = create_ssl_context()
-    connector = aiohttp.TCPConnector(
-        ssl=ssl_context, limit=10, limit_per_host=5, ttl_dns_cache=300, enable_cleanup_closed=True
-    )
-
-    headers = {
-        "User-Agent": get_random_user_agent(),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9,ru;q=0.8",
-        "Accept-Encoding": "gzip, deflate, br",
-        "DNT": "1",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-    }
+    failure = await get_cached_failure(url)
+    if failure:
+        return ArticleMetadata(content=failure, url=url, method="failed")
 
-    cookie_jar = aiohttp.CookieJar()
+    # Download once; every extractor below reuses the same buffer
+    timings: Dict[str, float] = {}
+    page, fetch_error = await fetch_page_for_extraction(url, timings)
 
-    async with aiohttp.ClientSession(
-        headers=headers,
-        connector=connector,
-        cookie_jar=cookie_jar,
-        timeout=aiohttp.ClientTimeout(total=30),
-    ) as session:
+    if page is not None:
         # Try Trafilatura first - it provides the best metadata extraction
         if TRAFILATURA_AVAILABLE:
-            trafilatura_content, metadata = await method0_trafilatura_async(url, session)
+            trafilatura_content, metadata = await _timed(
+                timings, "trafilatura", method0_trafilatura_async(url, page=page)
+            )
             if metadata and metadata.content and len(metadata.content) > 200:
                 # Clean the content
                 metadata.content = clean_text(metadata.content)
-                _set_cache(url, metadata)
+                await _set_cache(url, metadata)
                 logger.info(
                     f"Extracted article with metadata using trafilatura: {len(metadata.content)} chars"
                 )
                 return metadata
 
         # Fallback to newspaper which also provides good metadata
-        html, error = await fetch_html_with_retry(url, session, timeout=10)
-        if not error and html:
-            try:
-                loop = asyncio.get_running_loop()
-                metadata = await loop.run_in_executor(
-                    None, _newspaper_parse_with_metadata, html, url
+        try:
+            metadata = await _timed(
+                timings,
+                "newspaper",
+                get_extraction_executor().run(_newspaper_parse_with_metadata, page, url),
+            )
+            if metadata and metadata.content and len(metadata.content) > 200:
+                metadata.content = clean_text(metadata.content)
+                await _set_cache(url, metadata)
+                logger.info(
+                    f"Extracted article with metadata using newspaper: {len(metadata.content)} chars"
                 )
-                if metadata and metadata.content and len(metadata.content) > 200:
-                    metadata.content = clean_text(metadata.content)
-                    _set_cache(url, metadata)
-                    logger.info(
-                        f"Extracted article with metadata using newspaper: {len(metadata.content)} chars"
-                    )
-                    return metadata
-            except Exception as e:
-                logger.error(f"Newspaper metadata extraction failed: {e}")
-
-        # Final fallback to regular extraction
-        content, method = await compare_methods_async(url)
-        cleaned_content = (
-            clean_text(content) if content and not content.startswith("Error") else content
-        )
+                return metadata
+        except Exception as e:
+            logger.error(f"Newspaper metadata extraction failed: {e}")
 
-        result = ArticleMetadata(
-            content=cleaned_content or "Error: No content extracted", url=url, method=method
-        )
+    # Final fallback to regular extraction over the same page
+    if page is not None:
+        content, method = await compare_methods_async(url, page=page, timings=timings)
+    else:
+        content, method = await _run_extraction_chain(url, None, fetch_error, timings)
+        await get_extractor_scoreboard().save(domain_of(url))
+    cleaned_content = (
+        clean_text(content) if content and not content.startswith("Error") else content
+    )
+
+    result = ArticleMetadata(
+        content=cleaned_content or "Error: No content extracted", url=url, method=method
+    )
 
-        if not cleaned_content.startswith("Error"):
-            _set_cache(url, result)
+    if not cleaned_content.startswith("Error"):
+        await _set_cache(url, result)
+    else:
+        await _remember_failure(url, cleaned_content)
 
-        return result
+    return result
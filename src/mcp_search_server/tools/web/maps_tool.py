@@ -7,8 +7,10 @@ from typing import Any, Dict, List, Optional
 
 import aiohttp
 
-from ...cache_store import get_cached_json, set_cached_json
+from ...cache_store import aget_cached_json, aset_cached_json
 from ...config_loader import get_cache_ttl_seconds, get_maps_config
+from ...http_client import get_session
+from ...utils import rate_feedback, rate_limit
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +27,9 @@ async def search_maps(
     endpoint = maps_cfg.get("nominatim_endpoint", "https://nominatim.openstreetmap.org/search")
     user_agent = maps_cfg.get("user_agent", "mcp-search-server")
 
-    ttl = get_cache_ttl_seconds("enrich")
+    ttl = get_cache_ttl_seconds("maps")
     cache_key = f"maps|q={query}|limit={limit}|country_codes={country_codes}"
-    cached = get_cached_json(cache_key, ttl_seconds=ttl, no_cache=no_cache)
+    cached = await aget_cached_json(cache_key, ttl_seconds=ttl, no_cache=no_cache)
     if isinstance(cached, list):
         return cached[:limit]
 
@@ -43,13 +45,15 @@ async def search_maps(
     headers = {"User-Agent": user_agent}
 
     try:
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(
-                endpoint, params=params, timeout=aiohttp.ClientTimeout(total=10)
-            ) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json()
+        await rate_limit("nominatim", endpoint)
+        session = await get_session()
+        async with session.get(
+            endpoint, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=10)
+        ) as resp:
+            rate_feedback(endpoint, resp.status, resp.headers)
+            if resp.status != 200:
+                return []
+            data = await resp.json()
     except Exception as exc:
         logger.debug(f"Nominatim request failed: {exc}")
         return []
@@ -77,5 +81,5 @@ async def search_maps(
             }
         )
 
-    set_cached_json(cache_key, results, no_cache=no_cache)
+    await aset_cached_json(cache_key, results, kind="maps", no_cache=no_cache)
     return results[:limit]
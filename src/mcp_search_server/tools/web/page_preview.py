@@ -0,0 +1,190 @@
+"""Fast page previews from the start of an HTML document.
+
+Search result previews only need a title, a description and the opening
+paragraphs, so this reads the response incrementally and stops as soon as the
+`<head>` metadata and enough lead text have been seen (or after
+`enrich.preview_max_bytes`). No extractor chain and no browser fallback run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import logging
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+from ... import deadline
+from ...circuit_breaker import CircuitOpenError
+from ...config_loader import get_enrich_defaults
+from ...http_client import get_session
+from ...utils import rate_feedback, rate_limit, upstream_error
+from .link_parser import get_random_user_agent
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.5",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Paragraphs shorter than this are usually navigation, bylines or buttons
+MIN_PARAGRAPH_CHARS = 40
+
+# Text inside these elements is never part of the lead
+SKIPPED_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "form", "svg"}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class PagePreview:
+    url: str
+    title: Optional[str] = None
+    description: Optional[str] = None
+    paragraphs: List[str] = field(default_factory=list)
+    bytes_read: int = 0
+
+    def text(self, max_chars: int) -> str:
+        """Description followed by the lead paragraphs, cut at `max_chars`."""
+        parts = [self.description] if self.description else []
+        parts += [p for p in self.paragraphs if not self.description or p not in self.description]
+        text = "\n\n".join(parts).strip()
+        if len(text) <= max_chars:
+            return text
+        return text[:max_chars].rstrip() + "..."
+
+
+class PreviewParser(HTMLParser):
+    """Incremental parser that collects head metadata and lead paragraphs."""
+
+    def __init__(self, max_chars: int):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.meta: Dict[str, str] = {}
+        self.title = ""
+        self.paragraphs: List[str] = []
+        self.head_done = False
+        self._in_title = False
+        self._skip_depth = 0
+        self._paragraph: Optional[List[str]] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the head has been read and enough lead text collected."""
+        lead = sum(len(p) for p in self.paragraphs)
+        return self.head_done and (lead >= self.max_chars or len(self.paragraphs) >= 3)
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "meta":
+            attributes = {k.lower(): v or "" for k, v in attrs}
+            name = (attributes.get("property") or attributes.get("name") or "").lower()
+            if name and attributes.get("content"):
+                self.meta.setdefault(name, _clean(attributes["content"]))
+        elif tag == "title" and not self.title:
+            self._in_title = True
+        elif tag == "body":
+            self.head_done = True
+        elif tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "p" and not self._skip_depth:
+            self.head_done = True
+            self._paragraph = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        elif tag == "head":
+            self.head_done = True
+        elif tag in SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "p" and self._paragraph is not None:
+            text = _clean("".join(self._paragraph))
+            if len(text) >= MIN_PARAGRAPH_CHARS:
+                self.paragraphs.append(text)
+            self._paragraph = None
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data
+        elif self._paragraph is not None and not self._skip_depth:
+            self._paragraph.append(data)
+
+    def preview(self, url: str, bytes_read: int) -> PagePreview:
+        description = (
+            self.meta.get("og:description")
+            or self.meta.get("description")
+            or self.meta.get("twitter:description")
+        )
+        return PagePreview(
+            url=url,
+            title=self.meta.get("og:title") or _clean(self.title) or None,
+            description=description or None,
+            paragraphs=list(self.paragraphs),
+            bytes_read=bytes_read,
+        )
+
+
+def _clean(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+async def fetch_preview(
+    url: str, *, max_chars: int = 600, timeout: float = 8.0
+) -> Tuple[Optional[PagePreview], Optional[str]]:
+    """
+    Read just enough of an HTML page for a preview.
+
+    Args:
+        url: Page URL
+        max_chars: Lead text to collect before the download is stopped
+        timeout: Request timeout in seconds (clamped to the tool call deadline)
+
+    Returns: (preview, error_message)
+    """
+    max_bytes = int(get_enrich_defaults()["preview_max_bytes"])
+    headers = {"User-Agent": get_random_user_agent(), **PREVIEW_HEADERS}
+    try:
+        await rate_limit("web_parser", url)
+        session = await get_session()
+        async with session.get(
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=deadline.clamp(timeout)),
+            allow_redirects=True,
+            max_redirects=5,
+        ) as response:
+            rate_feedback(url, response.status, response.headers)
+            if response.status >= 400:
+                return None, f"HTTP {response.status}"
+            content_type = response.headers.get("Content-Type", "").lower()
+            if content_type and "html" not in content_type:
+                return None, f"Non-HTML content: {content_type}"
+
+            parser = PreviewParser(max_chars)
+            decoder = codecs.getincrementaldecoder(_codec(response.charset))(errors="replace")
+            bytes_read = 0
+            # Leaving the block early closes the connection instead of reading the rest
+            async for chunk in response.content.iter_chunked(8192):
+                bytes_read += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if parser.done or bytes_read >= max_bytes:
+                    break
+            logger.debug(f"Preview of {url} read {bytes_read} bytes")
+            return parser.preview(url, bytes_read), None
+    except CircuitOpenError as e:
+        return None, str(e)
+    except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+        upstream_error(url, e)
+        return None, str(e) or type(e).__name__
+
+
+def _codec(charset: Optional[str]) -> str:
+    try:
+        return codecs.lookup(charset or "utf-8").name
+    except LookupError:
+        return "utf-8"
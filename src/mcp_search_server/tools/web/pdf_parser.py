@@ -1,9 +1,11 @@
 """PDF Parser Tool - Extract text from PDF files."""
 
 import logging
-import aiohttp
 import io
 
+from ...http_client import conditional_get
+from ...utils import rate_limit
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,13 +35,13 @@ async def parse_pdf(url: str, max_chars: int = 50000) -> str:
                 logger.error("No PDF parsing library found. Install PyPDF2 or pdfplumber.")
                 return "Error: No PDF parsing library installed"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                if response.status != 200:
-                    logger.warning(f"Failed to download PDF: {url} (status: {response.status})")
-                    return f"Error: Failed to download PDF (status: {response.status})"
+        await rate_limit("pdf", url)
+        response = await conditional_get(url, timeout=30)
+        if response.status != 200:
+            logger.warning(f"Failed to download PDF: {url} (status: {response.status})")
+            return f"Error: Failed to download PDF (status: {response.status})"
 
-                pdf_data = await response.read()
+        pdf_data = response.body
 
         if pdf_library == "pypdf2":
             return await _parse_with_pypdf2(pdf_data, max_chars)
@@ -8,11 +8,11 @@ import re
 import time
 from typing import Any, Dict, List, Optional
 
-import aiohttp
 import feedparser
 
-from ...cache_store import get_cached_json, set_cached_json
+from ...cache_store import aget_cached_json_swr, aset_cached_json
 from ...config_loader import (
+    get_cache_stale_grace_seconds,
     get_cache_ttl_seconds,
     get_dedupe_enabled,
     get_normalize_urls_enabled,
@@ -20,10 +20,17 @@ from ...config_loader import (
     get_rss_sources,
     get_title_similarity_threshold,
 )
+from ...http_client import HttpResponse, conditional_get
 from ...result_utils import dedupe_and_limit_results
+from ...singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+_rss_flight = SingleFlight("rss")
+
+# Last parse per feed URL, keyed by the response validator (ETag/Last-Modified)
+_parsed_feeds: Dict[str, tuple[str, feedparser.FeedParserDict]] = {}
+
 
 def _clean_html(text: str) -> str:
     if not text:
@@ -69,22 +76,38 @@ async def list_news_sources(
     return output
 
 
-async def _fetch_text(url: str, *, timeout_seconds: int = 10) -> Optional[str]:
+async def _fetch_text(url: str, *, timeout_seconds: int = 10) -> Optional[HttpResponse]:
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url, timeout=aiohttp.ClientTimeout(total=timeout_seconds)
-            ) as resp:
-                if resp.status != 200:
-                    return None
-                return await resp.text()
+        # Feeds are polled by every query: reuse a copy validated within the
+        # RSS TTL, otherwise revalidate with ETag/Last-Modified.
+        resp = await conditional_get(
+            url, timeout=timeout_seconds, max_age=get_cache_ttl_seconds("rss")
+        )
+        return resp if resp.status == 200 else None
     except Exception as exc:
         logger.debug(f"RSS fetch failed for {url}: {exc}")
         return None
 
 
-def _parse_feed(xml_text: str) -> feedparser.FeedParserDict:
-    return feedparser.parse(xml_text)
+def _parse_feed(body: bytes, content_type: Optional[str] = None) -> feedparser.FeedParserDict:
+    # Raw bytes: feedparser weighs the HTTP charset against the <?xml encoding?> prolog itself
+    headers = {"content-type": content_type} if content_type else None
+    return feedparser.parse(body, response_headers=headers)
+
+
+async def _parse_feed_cached(url: str, resp: HttpResponse) -> feedparser.FeedParserDict:
+    """Parse a feed, reusing the previous parse when the validator is unchanged."""
+    validator = resp.validator
+    cached = _parsed_feeds.get(url)
+    if validator and cached and cached[0] == validator:
+        return cached[1]
+    loop = asyncio.get_running_loop()
+    parsed = await loop.run_in_executor(
+        None, _parse_feed, resp.body, resp.headers.get("Content-Type")
+    )
+    if validator:
+        _parsed_feeds[url] = (validator, parsed)
+    return parsed
 
 
 async def search_rss(
@@ -114,11 +137,30 @@ async def search_rss(
 
     ttl = get_cache_ttl_seconds("rss")
     cache_key = f"rss|region={region}|sources={','.join(sorted([s.get('id','') for s in selected_sources]))}|q={query}|limit={limit}"
-    cached = get_cached_json(cache_key, ttl_seconds=ttl, no_cache=no_cache)
+
+    def fetch_feeds():
+        return _search_rss_uncached(query, selected_sources, cache_key, no_cache)
+
+    cached, stale = await aget_cached_json_swr(
+        cache_key, ttl, get_cache_stale_grace_seconds("rss"), no_cache=no_cache
+    )
     if isinstance(cached, list):
+        if stale:
+            _rss_flight.refresh(cache_key, fetch_feeds)
         return cached[:limit]
 
-    fetch_jobs: List[tuple[Dict[str, Any], asyncio.Task[Optional[str]]]] = []
+    # Identical concurrent searches share one round of feed fetches
+    results = await _rss_flight.do(cache_key, fetch_feeds)
+    return results[:limit]
+
+
+async def _search_rss_uncached(
+    query: str,
+    selected_sources: List[Dict[str, Any]],
+    cache_key: str,
+    no_cache: bool,
+) -> List[Dict[str, Any]]:
+    fetch_jobs: List[tuple[Dict[str, Any], asyncio.Task[Optional[HttpResponse]]]] = []
     for src in selected_sources:
         url = str(src.get("url", ""))
         if not url:
@@ -132,8 +174,7 @@ async def search_rss(
         if isinstance(raw, Exception) or not raw:
             continue
 
-        loop = asyncio.get_event_loop()
-        parsed = await loop.run_in_executor(None, _parse_feed, raw)
+        parsed = await _parse_feed_cached(str(src.get("url", "")), raw)
         entries = getattr(parsed, "entries", []) or []
 
         for entry in entries:
@@ -177,5 +218,5 @@ async def search_rss(
             normalize_urls=get_normalize_urls_enabled(),
         )
 
-    set_cached_json(cache_key, results, no_cache=no_cache)
-    return results[:limit]
+    await aset_cached_json(cache_key, results, kind="rss", no_cache=no_cache)
+    return results
@@ -9,9 +9,7 @@ logger = logging.getLogger(__name__)
 
 # Import cache utilities if available
 try:
-    from ...cache_store import get_cached_json, set_cached_json
     from ...config_loader import (
-        get_cache_ttl_seconds,
         get_dedupe_enabled,
         get_normalize_urls_enabled,
         get_results_max_per_domain,
@@ -33,6 +31,7 @@ async def search_with_fallback(
     engine: Optional[str] = None,
     no_cache: bool = False,
     use_fallback: bool = True,
+    enrich: Optional[bool] = None,
 ) -> List[Dict]:
     """
     Unified search with smart fallback and caching.
@@ -45,24 +44,13 @@ async def search_with_fallback(
         engine: Specific engine to use (None = auto with fallback)
         no_cache: Disable caching
         use_fallback: Enable fallback to other engines if primary fails
+        enrich: Add a `preview` of the top results (default: enrich.default_enabled)
 
     Returns:
         List of search results
     """
-    # Build cache key
-    cache_key = f"engine={engine or 'auto'}|mode={mode}|timelimit={timelimit}|q={query}"
-
-    # Check cache first
-    if HAS_CACHE and not no_cache:
-        cache_kind = "news" if mode == "news" else "web"
-        cached_results = get_cached_json(
-            cache_key, get_cache_ttl_seconds(cache_kind), no_cache=no_cache
-        )
-        if cached_results is not None:
-            logger.info(f"Using cached results for '{cache_key}'")
-            return cached_results[:limit]
-
-    # Perform search
+    # Perform search. Raw results are cached per engine and served from
+    # supersets (see duckduckgo.ddg_results); deduplication runs on every serve.
     if engine:
         # Use specific engine without fallback
         logger.info(f"Using specific engine: {engine}")
@@ -72,6 +60,7 @@ async def search_with_fallback(
             max_results=limit * 2,  # Request more for deduplication
             timelimit=timelimit,
             mode=mode,
+            no_cache=no_cache,
         )
     elif use_fallback:
         # Use smart fallback
@@ -81,6 +70,7 @@ async def search_with_fallback(
             max_results=limit * 2,  # Request more for deduplication
             timelimit=timelimit,
             mode=mode,
+            no_cache=no_cache,
         )
     else:
         # Default to DuckDuckGo only (backward compatible)
@@ -91,6 +81,7 @@ async def search_with_fallback(
             max_results=limit * 2,
             timelimit=timelimit,
             mode=mode,
+            no_cache=no_cache,
         )
 
     if not results:
@@ -106,11 +97,10 @@ async def search_with_fallback(
             normalize_urls=get_normalize_urls_enabled(),
         )
 
-    # Cache results
-    if HAS_CACHE and not no_cache:
-        set_cached_json(cache_key, results, no_cache=no_cache)
+    # Imported here: enrich depends on the web tools package
+    from ...enrich import enrich_if_requested
 
-    return results[:limit]
+    return await enrich_if_requested(results[:limit], enrich, no_cache=no_cache)
 
 
 # Backward compatibility alias
@@ -1,59 +1,361 @@
 """Utility functions for MCP Search Server."""
 
 import asyncio
+import threading
 import time
-from typing import Any, Callable, Dict, List
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 from functools import wraps
+from urllib.parse import urlparse
 import logging
 
+import aiohttp
+
+from . import deadline
+from .circuit_breaker import get_circuit_breaker
+from .config_loader import get_rate_control_config, get_rate_limit
+
 logger = logging.getLogger(__name__)
 
+# Statuses that mean the upstream wants us to slow down
+THROTTLE_STATUSES = (429, 503)
+
+# Failures that say nothing about the request itself, only about the upstream
+NETWORK_ERRORS = (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+
 
 class RateLimiter:
-    """Simple rate limiter to prevent API bans."""
+    """Async token-bucket rate limiter, one bucket per key.
 
-    def __init__(self, calls_per_second: float = 2.0):
+    Each key refills at `calls_per_second` up to `burst` tokens. A caller that
+    finds the bucket empty reserves the next token and sleeps until it is due,
+    so concurrent callers are spaced out and served in arrival order. The
+    reservation happens without awaiting, which makes it safe under any number
+    of concurrent tasks. A cancelled waiter does not give its token back.
+    """
+
+    # Idle buckets are dropped once this many keys are tracked.
+    MAX_KEYS = 1024
+
+    def __init__(self, calls_per_second: float = 2.0, burst: int = 1):
         """
         Initialize rate limiter.
 
         Args:
-            calls_per_second: Maximum number of calls per second
+            calls_per_second: Sustained number of calls per second per key
+            burst: Number of calls allowed back to back after an idle period
         """
-        self.calls_per_second = calls_per_second
-        self.min_interval = 1.0 / calls_per_second
-        self.last_call: Dict[str, float] = {}
-
-    async def acquire(self, key: str = "default"):
+        self.calls_per_second = max(calls_per_second, 1e-6)
+        self.burst = max(1, int(burst))
+        self.min_interval = 1.0 / self.calls_per_second
+        # key -> [tokens, updated]; tokens go negative while callers are queued.
+        self._buckets: Dict[str, List[float]] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def reserve(self, key: str = "default", scale: float = 1.0) -> float:
+        """Take a token for `key` and return how long the caller must wait for it.
+
+        `scale` slows the refill rate for a host that is pushing back; while it
+        is below 1 the bucket does not allow bursts.
+        """
+        now = time.monotonic()
+        rate = self.calls_per_second * min(1.0, max(scale, 1e-3))
+        burst = self.burst if scale >= 1.0 else 1
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.MAX_KEYS:
+                self._prune(now)
+            bucket = self._buckets[key] = [float(burst), now]
+        tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+        tokens -= 1.0
+        bucket[0], bucket[1] = tokens, now
+        return -tokens / rate if tokens < 0 else 0.0
+
+    async def acquire(self, key: str = "default", scale: float = 1.0) -> float:
         """
         Acquire permission to make a call.
 
         Args:
             key: Identifier for rate limiting (e.g., domain name)
-        """
-        now = time.time()
-        last = self.last_call.get(key, 0)
-        time_since_last = now - last
+            scale: Fraction of the configured rate currently allowed for `key`
 
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
+        Returns:
+            Seconds spent waiting for the token
+        """
+        wait_time = self.reserve(key, scale)
+        self._record(key, wait_time)
+        if wait_time > 0:
             logger.debug(f"Rate limiting {key}: waiting {wait_time:.2f}s")
             await asyncio.sleep(wait_time)
+        return wait_time
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return per-key call counts and wait times in seconds."""
+        return {key: dict(values) for key, values in self._stats.items()}
+
+    def _record(self, key: str, wait_time: float) -> None:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = {"calls": 0, "waited": 0, "wait_total": 0.0, "wait_max": 0.0}
+        stats["calls"] += 1
+        if wait_time > 0:
+            stats["waited"] += 1
+            stats["wait_total"] += wait_time
+            stats["wait_max"] = max(stats["wait_max"], wait_time)
+
+    def _prune(self, now: float) -> None:
+        full_after = self.burst / self.calls_per_second
+        for key, (tokens, updated) in list(self._buckets.items()):
+            if tokens >= 0 and now - updated >= full_after:
+                del self._buckets[key]
+                self._stats.pop(key, None)
+
+
+class AdaptiveRateControl:
+    """AIMD rate scaling per host, shared by every service limiter.
+
+    A 429 or 503 multiplies the host's allowed rate by `decrease_factor` and,
+    with a Retry-After, pauses the host until it has passed. Each success adds
+    `increase_step` back until the configured rate is reached again. State is
+    keyed by host, so a throttled host is slowed down for every tool that
+    calls it. Feedback may be reported from executor threads.
+
+    Upstreams that advertise their request budget (X-RateLimit-Remaining and
+    X-RateLimit-Reset) are paced to spread what is left over the rest of the
+    window, and paused until the reset once it is used up.
+    """
 
-        self.last_call[key] = time.time()
+    def __init__(
+        self,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.05,
+        min_factor: float = 0.05,
+        max_pause: float = 60.0,
+    ):
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.min_factor = min_factor
+        self.max_pause = max_pause
+        self._factors: Dict[str, float] = {}
+        self._paused_until: Dict[str, float] = {}
+        self._throttles: Dict[str, int] = {}
+        # key -> (calls per second the remaining budget allows, monotonic expiry)
+        self._quotas: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def factor(self, key: str) -> float:
+        """Return the fraction of the configured rate currently allowed for `key`."""
+        return self._factors.get(key, 1.0)
+
+    def pause_remaining(self, key: str) -> float:
+        """Return how long `key` must still be left alone after a Retry-After."""
+        until = self._paused_until.get(key)
+        return max(0.0, until - time.monotonic()) if until else 0.0
+
+    def on_throttle(self, key: str, retry_after: Optional[float] = None) -> None:
+        """Back off multiplicatively after the host pushed back."""
+        with self._lock:
+            factor = max(self.min_factor, self.factor(key) * self.decrease_factor)
+            self._factors[key] = factor
+            self._throttles[key] = self._throttles.get(key, 0) + 1
+            if retry_after:
+                until = time.monotonic() + min(retry_after, self.max_pause)
+                self._paused_until[key] = max(until, self._paused_until.get(key, 0.0))
+        logger.warning(f"Upstream {key} is throttling, rate scaled to {factor:.2f}")
+
+    def quota_rate(self, key: str) -> Optional[float]:
+        """Return the rate the upstream's advertised budget allows, if it sent one."""
+        quota = self._quotas.get(key)
+        if quota is None or quota[1] <= time.monotonic():
+            return None
+        return quota[0]
+
+    def on_quota(self, key: str, remaining: float, reset_in: float) -> None:
+        """Pace `key` to `remaining` calls over the `reset_in` seconds left in the window."""
+        now = time.monotonic()
+        with self._lock:
+            if remaining < 1:
+                until = now + min(reset_in, self.max_pause)
+                self._paused_until[key] = max(until, self._paused_until.get(key, 0.0))
+                self._quotas.pop(key, None)
+            else:
+                self._quotas[key] = (remaining / max(reset_in, 1.0), now + reset_in)
+        if remaining < 1:
+            logger.warning(f"Upstream {key} budget exhausted, pausing for {reset_in:.0f}s")
+
+    def on_success(self, key: str) -> None:
+        """Recover additively after a successful call."""
+        if key not in self._factors:
+            return
+        with self._lock:
+            factor = self._factors.get(key, 1.0) + self.increase_step
+            if factor >= 1.0:
+                self._factors.pop(key, None)
+                self._paused_until.pop(key, None)
+            else:
+                self._factors[key] = factor
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return the current factor, pause, budget rate and throttle count per host."""
+        return {
+            key: {
+                "factor": round(self.factor(key), 3),
+                "paused_seconds": round(self.pause_remaining(key), 3),
+                "quota_rate": self.quota_rate(key),
+                "throttles": self._throttles.get(key, 0),
+            }
+            for key in sorted({*self._throttles, *self._quotas, *self._paused_until})
+        }
+
+
+_rate_control: Optional[AdaptiveRateControl] = None
+
+
+def get_rate_control() -> AdaptiveRateControl:
+    """Return the process-wide AIMD rate control."""
+    global _rate_control
+    if _rate_control is None:
+        _rate_control = AdaptiveRateControl(**get_rate_control_config())
+    return _rate_control
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> Optional[Tuple[float, float]]:
+    """Return (remaining calls, seconds until reset) from X-RateLimit-* headers."""
+    remaining, reset = headers.get("X-RateLimit-Remaining"), headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        remaining_calls, reset_value = float(remaining), float(reset)
+    except ValueError:
+        return None
+    # GitHub sends the reset as an epoch timestamp, Reddit as seconds left
+    reset_in = reset_value - time.time() if reset_value > 1e9 else reset_value
+    return remaining_calls, max(0.0, reset_in)
+
+
+def rate_feedback(
+    target: str,
+    status: int,
+    headers: Optional[Mapping[str, str]] = None,
+    default_retry_after: Optional[float] = None,
+) -> None:
+    """
+    Report an upstream response to the adaptive rate control and circuit breaker.
 
+    Args:
+        target: Request URL, or the service name for calls without one
+        status: HTTP status (429 and 503 count as throttling, <400 as success;
+            throttling and 5xx count as breaker failures)
+        headers: Response headers, used for Retry-After and X-RateLimit-* budgets
+        default_retry_after: Pause to apply when a throttle has no Retry-After
+    """
+    key = _rate_key(target)
+    budget = parse_rate_limit_headers(headers) if headers else None
+    if budget is not None:
+        get_rate_control().on_quota(key, *budget)
+    if status in THROTTLE_STATUSES:
+        retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+        get_rate_control().on_throttle(key, retry_after or default_retry_after)
+    elif status < 400:
+        get_rate_control().on_success(key)
+    if status in THROTTLE_STATUSES or status >= 500:
+        get_circuit_breaker(key).record_failure()
+    else:
+        get_circuit_breaker(key).record_success()
+
+
+def upstream_error(target: str, error: Optional[BaseException] = None) -> None:
+    """
+    Report a call that got no response to the upstream's circuit breaker.
+
+    Args:
+        target: Request URL, or the service name for calls without one
+        error: The exception raised; only timeouts and connection errors count.
+            A timeout that hit once the tool call's budget was used up came
+            from `deadline.clamp`, not the upstream, and is not counted.
+    """
+    if isinstance(error, asyncio.TimeoutError) and not deadline.has_time_for(0.5):
+        return
+    if error is None or isinstance(error, NETWORK_ERRORS):
+        get_circuit_breaker(_rate_key(target)).record_failure()
+
+
+def _rate_key(target: str) -> str:
+    return urlparse(target).hostname or target
 
-# Global rate limiters for different services
-rate_limiters = {
-    "duckduckgo": RateLimiter(calls_per_second=1.0),
-    "wikipedia": RateLimiter(calls_per_second=2.0),
-    "web_parser": RateLimiter(calls_per_second=3.0),
-    "pdf": RateLimiter(calls_per_second=1.0),
-}
+
+# Shared rate limiters, created on first use from `rate_limits` in search_config.json
+rate_limiters: Dict[str, RateLimiter] = {}
 
 
 def get_rate_limiter(service: str) -> RateLimiter:
-    """Get rate limiter for a service."""
-    return rate_limiters.get(service, RateLimiter(calls_per_second=1.0))
+    """Get the shared rate limiter for a service."""
+    limiter = rate_limiters.get(service)
+    if limiter is None:
+        limits = get_rate_limit(service)
+        limiter = RateLimiter(calls_per_second=limits["rate"], burst=int(limits["burst"]))
+        rate_limiters[service] = limiter
+    return limiter
+
+
+async def rate_limit(service: str, url: Optional[str] = None) -> float:
+    """
+    Wait for a call slot for `service`, keyed per host when `url` is given.
+
+    Args:
+        service: Rate limit section, e.g. "duckduckgo" or "web_parser"
+        url: Target URL; calls to different hosts use separate buckets
+
+    Returns:
+        Seconds spent waiting
+
+    Raises:
+        CircuitOpenError: The upstream's circuit breaker is open
+    """
+    key = _rate_key(url) if url else service
+    breaker = get_circuit_breaker(key)
+    breaker.check()
+    try:
+        control = get_rate_control()
+        paused = control.pause_remaining(key)
+        if paused > 0:
+            logger.debug(f"Waiting {paused:.2f}s for Retry-After on {key}")
+            await asyncio.sleep(paused)
+        limiter = get_rate_limiter(service)
+        scale = control.factor(key)
+        quota_rate = control.quota_rate(key)
+        if quota_rate is not None:
+            # Only slower than configured when the advertised budget is running out
+            scale = min(scale, quota_rate / limiter.calls_per_second)
+        return paused + await limiter.acquire(key, scale)
+    except BaseException:
+        # Cancelled while waiting: the call never went out, free a half-open probe
+        breaker.release()
+        raise
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Return wait-time metrics for every service limiter in use.
+
+    Hosts that pushed back or advertise a request budget appear under "adaptive".
+    """
+    stats = {service: limiter.stats() for service, limiter in rate_limiters.items()}
+    stats["adaptive"] = get_rate_control().stats()
+    return stats
 
 
 async def run_parallel(*tasks: Callable, max_concurrent: int = 3) -> List[Any]:
@@ -136,8 +438,7 @@ def with_rate_limit(service: str):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            limiter = get_rate_limiter(service)
-            await limiter.acquire(service)
+            await rate_limit(service)
             return await func(*args, **kwargs)
 
         return wrapper
@@ -22,6 +22,24 @@ def registry():
     # Cleanup after test
     reset_global_registry()
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path_factory, monkeypatch):
+    """Point the disk cache at a per-test directory and start with empty in-process tiers."""
+    from mcp_search_server import cache_store
+    from mcp_search_server.tools.web import link_parser
+    from mcp_search_server.tools.web.extractor_scoreboard import reset_extractor_scoreboard
+
+    def reset():
+        cache_store.reset_cache_backend()
+        link_parser._content_cache.clear()
+        reset_extractor_scoreboard()
+
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setattr(cache_store, "get_cache_dir", lambda: cache_dir)
+    reset()
+    yield cache_dir
+    reset()
+
 @pytest.fixture
 def sample_search_results():
     """Sample search results for testing."""
@@ -0,0 +1,236 @@
+"""Tests for the pool of warm browser workers."""
+
+import asyncio
+import threading
+import urllib.request
+
+import pytest
+import pytest_asyncio
+
+from mcp_search_server.tools.web.browser_pool import BrowserPool, BrowserPoolBusy, BrowserWorker
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    """Minimal stand-in for a Selenium driver that fetches pages over HTTP."""
+
+    def __init__(self):
+        self.page_source = ""
+        self.window_handles = ["main"]
+        self.switch_to = FakeSwitchTo(self)
+        self.healthy = True
+        self.quit_called = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def get(self, url):
+        if url == "about:blank":
+            self.page_source = ""
+            return
+        with urllib.request.urlopen(url, timeout=5) as response:
+            self.page_source = response.read().decode()
+
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError("browser crashed")
+        return 1 if script == "return 1" else None
+
+    def delete_all_cookies(self):
+        pass
+
+    def close(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def load(driver, url):
+    driver.release.wait(5)
+    driver.get(url)
+    return driver.page_source
+
+
+@pytest_asyncio.fixture
+async def page_url():
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    async def page(request):
+        return web.Response(text="<html><body>hello</body></html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    yield str(server.make_url("/page"))
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_workers_are_reused_and_recycled_after_max_pages(page_url):
+    """Drivers serve several pages and are replaced once worn out."""
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    pool = BrowserPool(factory, size=1, max_pages=2)
+    try:
+        for _ in range(3):
+            assert "hello" in await pool.run(load, page_url)
+        await asyncio.sleep(0.05)
+    finally:
+        await pool.close()
+
+    assert len(drivers) == 2
+    assert drivers[0].quit_called
+    assert pool.stats["created"] == 2
+    assert pool.stats["recycled"] == 1
+    assert pool.stats["pages"] == 3
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_worker_is_replaced(page_url):
+    """A driver failing its health check is quit and a fresh one is started."""
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    pool = BrowserPool(factory, size=1)
+    try:
+        await pool.run(load, page_url)
+        drivers[0].healthy = False
+        assert "hello" in await pool.run(load, page_url)
+    finally:
+        await pool.close()
+
+    assert len(drivers) == 2
+    assert drivers[0].quit_called
+    assert pool.stats["unhealthy"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_new_callers(page_url):
+    """Callers beyond size + max_queue fail fast instead of piling up."""
+    driver = FakeDriver()
+    driver.release.clear()
+    pool = BrowserPool(lambda: driver, size=1, max_queue=1)
+    try:
+        busy = asyncio.ensure_future(pool.run(load, page_url))
+        await asyncio.sleep(0.1)
+        queued = asyncio.ensure_future(pool.run(load, page_url))
+        await asyncio.sleep(0.05)
+        assert pool.snapshot()["waiting"] == 1
+
+        with pytest.raises(BrowserPoolBusy):
+            await pool.run(load, page_url)
+
+        driver.release.set()
+        assert "hello" in await busy
+        assert "hello" in await queued
+    finally:
+        driver.release.set()
+        await pool.close()
+
+    assert pool.stats["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_during_health_check_keeps_the_worker(page_url):
+    """A caller cancelled while its worker is checked does not lose the pool slot."""
+    gate = threading.Event()
+
+    class SlowCheckDriver(FakeDriver):
+        def execute_script(self, script):
+            if script == "return 1":
+                gate.wait(5)
+            return super().execute_script(script)
+
+    pool = BrowserPool(SlowCheckDriver, size=1)
+    try:
+        caller = asyncio.ensure_future(pool.run(load, page_url))
+        await asyncio.sleep(0.1)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        gate.set()
+        await asyncio.sleep(0.05)
+        assert pool.snapshot()["workers"] == 1 and pool.snapshot()["idle"] == 1
+
+        assert "hello" in await pool.run(load, page_url)
+    finally:
+        gate.set()
+        await pool.close()
+
+    assert pool.stats["created"] == 1
+
+
+@pytest.mark.asyncio
+async def test_waiter_starts_a_worker_when_one_is_retired(page_url):
+    """A queued caller takes over the slot of a recycled worker instead of timing out."""
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        drivers[-1].release.clear()
+        return drivers[-1]
+
+    pool = BrowserPool(factory, size=1, max_pages=1, acquire_timeout=5)
+    try:
+        busy = asyncio.ensure_future(pool.run(load, page_url))
+        await asyncio.sleep(0.1)
+        queued = asyncio.ensure_future(pool.run(load, page_url))
+        await asyncio.sleep(0.05)
+        assert pool.snapshot()["waiting"] == 1
+
+        drivers[0].release.set()
+        assert "hello" in await busy
+        for _ in range(100):
+            if len(drivers) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert len(drivers) == 2
+        drivers[1].release.set()
+        assert "hello" in await asyncio.wait_for(queued, 1)
+    finally:
+        for driver in drivers:
+            driver.release.set()
+        await pool.close()
+
+    assert pool.stats["created"] == 2 and pool.stats["recycled"] == 2
+
+
+@pytest.mark.asyncio
+async def test_reset_clears_every_origins_cookies():
+    """Chrome drivers drop all cookies through CDP, not just the current origin's."""
+
+    class ChromeDriver(FakeDriver):
+        def __init__(self):
+            super().__init__()
+            self.cdp = []
+
+        def execute_cdp_cmd(self, cmd, params):
+            self.cdp.append((cmd, params))
+
+        def execute_script(self, script):
+            if script == "return window.location.origin":
+                return "https://example.com"
+            return super().execute_script(script)
+
+    driver = ChromeDriver()
+    assert BrowserPool._reset(BrowserWorker(driver=driver, worker_id=1))
+    assert driver.cdp == [
+        ("Network.clearBrowserCookies", {}),
+        ("Storage.clearDataForOrigin", {"origin": "https://example.com", "storageTypes": "all"}),
+    ]
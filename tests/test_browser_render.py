@@ -0,0 +1,109 @@
+"""Tests for the lightweight browser render mode."""
+
+from mcp_search_server.tools.web import browser_render
+
+
+class FakeDriver:
+    """Driver stub whose page finishes loading after a few polls."""
+
+    def __init__(self, polls_until_complete=3):
+        self.cdp = []
+        self.polls = 0
+        self.polls_until_complete = polls_until_complete
+        self.visited = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+
+    def set_page_load_timeout(self, seconds):
+        self.page_load_timeout = seconds
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script):
+        if "readyState" in script:
+            self.polls += 1
+            done = self.polls >= self.polls_until_complete
+            return ["complete" if done else "interactive", 4 if done else self.polls]
+        if "navigation" in script:
+            return {
+                "bytes": 12000,
+                "requests": 4,
+                "empty": [
+                    "https://cdn.example/hero.jpg?w=800",
+                    "https://example.com/app.js",
+                    "https://www.google-analytics.com/analytics.js",
+                ],
+            }
+        return None
+
+
+def test_blocked_patterns_cover_query_strings_and_hosts():
+    patterns = browser_render.blocked_url_patterns(["image", "font", "tracker"])
+
+    assert "*.png" in patterns and "*.png?*" in patterns and "*.woff2" in patterns
+    assert "*://fonts.gstatic.com/*" in patterns and "*://*.doubleclick.net/*" in patterns
+    assert not any(p.startswith("*.css") for p in patterns)
+    assert browser_render.blocked_kind("https://ad.doubleclick.net/x", ["tracker"]) == "tracker"
+    assert browser_render.blocked_kind("https://notdoubleclick.net/x", ["tracker"]) is None
+
+
+def test_lightweight_render_blocks_waits_and_records(monkeypatch):
+    """Resources are blocked, readiness is polled and metrics are recorded."""
+    monkeypatch.setattr(
+        browser_render,
+        "get_browser_render_config",
+        lambda: {
+            "lightweight": True,
+            "block": ["image", "tracker"],
+            "max_render_seconds": 5.0,
+            "quiet_seconds": 0.0,
+        },
+    )
+    monkeypatch.setattr(browser_render, "POLL_INTERVAL", 0.001)
+    browser_render.reset_render_stats()
+    driver = FakeDriver()
+
+    assert browser_render.prepare(driver)
+    browser_render.load(driver, "https://example.com/", "TEST")
+    metrics = browser_render.record(driver, "selenium", True, 0.25)
+
+    assert driver.cdp[1][0] == "Network.setBlockedURLs"
+    assert "*.jpg?*" in driver.cdp[1][1]["urls"]
+    assert driver.visited == ["https://example.com/"]
+    assert driver.polls >= driver.polls_until_complete
+    expected_saved = browser_render.TYPICAL_BYTES["image"] + browser_render.TYPICAL_BYTES["tracker"]
+    assert metrics == {
+        "bytes": 12000,
+        "requests": 4,
+        "blocked": 2,
+        "bytes_saved": expected_saved,
+        "render_ms": 250,
+    }
+    assert browser_render.chrome_prefs() == {"profile.managed_default_content_settings.images": 2}
+
+    stats = browser_render.get_render_stats()
+    assert stats["selenium:lightweight"]["avg_bytes_saved_estimate"] == expected_saved
+
+    browser_render.record(driver, "selenium", False, 1.0)
+    stats = browser_render.get_render_stats()
+    assert stats["selenium:lightweight"]["blocked_requests"] == 2
+    assert stats["selenium:lightweight"]["avg_ms_saved"] == 750
+    browser_render.reset_render_stats()
+
+
+def test_full_mode_clears_block_list(monkeypatch):
+    monkeypatch.setattr(
+        browser_render,
+        "get_browser_render_config",
+        lambda: {"lightweight": False, "block": ["image"], "max_render_seconds": 5.0},
+    )
+    driver = FakeDriver()
+
+    assert not browser_render.prepare(driver)
+    assert driver.cdp[1] == ("Network.setBlockedURLs", {"urls": []})
+    assert browser_render.chrome_prefs() == {}
@@ -0,0 +1,218 @@
+"""Tests for the disk cache store."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from mcp_search_server import cache_store
+from mcp_search_server.tools.meta.search_tools import get_upstream_status
+
+
+@pytest.fixture
+def cache_dir(isolated_cache, monkeypatch):
+    """Switch the test's cache directory to the given backend."""
+
+    def use(backend: str = "sqlite"):
+        monkeypatch.setattr(cache_store, "get_cache_backend_name", lambda: backend)
+        cache_store.reset_cache_backend()
+        return isolated_cache
+
+    return use
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "json"])
+def test_roundtrip_and_ttl(cache_dir, backend):
+    """Entries round-trip and expire according to the TTL given on read."""
+    cache_dir(backend)
+    cache_store.set_cached_json("web|q=python", [{"title": "Python", "url": "https://python.org"}])
+
+    assert cache_store.get_cached_json("web|q=python", ttl_seconds=60) == [
+        {"title": "Python", "url": "https://python.org"}
+    ]
+    assert cache_store.get_cached_json("web|q=python", ttl_seconds=-1) is None
+    assert cache_store.get_cached_json("web|q=missing", ttl_seconds=60) is None
+    assert cache_store.get_cached_json("web|q=python", ttl_seconds=60, no_cache=True) is None
+
+
+def test_sqlite_uses_single_file(cache_dir):
+    """The SQLite backend does not create one file per key."""
+    path = cache_dir("sqlite")
+    for i in range(20):
+        cache_store.set_cached_json(f"key-{i}", {"i": i})
+
+    assert not list(path.glob("*.json"))
+    assert (path / cache_store.SQLITE_FILENAME).exists()
+
+
+def test_purge_expired_uses_timestamp(cache_dir):
+    """Purging removes only entries written before the cutoff."""
+    cache_dir("sqlite")
+    backend = cache_store.get_cache_backend()
+    backend.set_many([("old", time.time() - 3600, 1, "web"), ("new", time.time(), 2, "web")])
+
+    assert cache_store.purge_expired(60) == 1
+    assert backend.get("old") is None
+    assert backend.get("new")[1] == 2
+
+
+def test_legacy_json_files_are_migrated(cache_dir):
+    """Entries from the one-file-per-key layout are imported into SQLite."""
+    path = cache_dir("json")
+    cache_store.set_cached_json("rss|q=news", ["legacy"])
+    legacy_files = list(path.glob("*.json"))
+    assert len(legacy_files) == 1
+    assert json.loads(legacy_files[0].read_text())["data"] == ["legacy"]
+
+    cache_dir("sqlite")
+    assert cache_store.get_cached_json("rss|q=news", ttl_seconds=60) == ["legacy"]
+    assert not list(path.glob("*.json"))
+
+
+@pytest.mark.parametrize("policy, survivor", [("lru", "b"), ("lfu", "a")])
+def test_evict_by_policy(cache_dir, policy, survivor):
+    """LRU drops the least recently read entry, LFU the least often read one."""
+    cache_dir("sqlite")
+    backend = cache_store.get_cache_backend()
+    now = time.time()
+    backend.set_many([("a", now, "x", "web"), ("b", now, "x", "web")])
+    for _ in range(3):
+        backend.get("a")
+    time.sleep(0.01)
+    backend.get("b")
+
+    assert backend.evict("web", policy=policy, limit=1) == 1
+    assert backend.get(survivor) is not None
+    assert len([k for k in "ab" if backend.get(k) is not None]) == 1
+
+
+@pytest.mark.asyncio
+async def test_janitor_enforces_ttl_and_quota(cache_dir, monkeypatch):
+    """One janitor pass purges expired entries and trims kinds over quota."""
+    cache_dir("sqlite")
+    monkeypatch.setattr(cache_store, "get_cache_quota_bytes", lambda kind: 50)
+    backend = cache_store.get_cache_backend()
+    now = time.time()
+    backend.set_many([("stale", now - 10 * 86400, "x", "rss")])
+    backend.set_many([(f"k{i}", now + i, "y" * 20, "web") for i in range(5)])
+
+    stats = await cache_store.CacheJanitor(batch_size=1).run_once()
+
+    assert stats["expired"] == 1
+    assert backend.usage_bytes("web") <= 50
+    assert backend.get("k4") is not None
+    assert backend.get("k0") is None
+
+
+def test_memory_tier_serves_hot_keys(cache_dir):
+    """Repeat reads are answered by L1; a cold L1 falls through and promotes."""
+    cache_dir("sqlite")
+    cache_store.set_cached_json("web|q=hot", ["a"], kind="web")
+
+    assert cache_store.get_cached_json("web|q=hot", ttl_seconds=60) == ["a"]
+    assert cache_store.get_cache_stats()["memory"]["hits"] == 1
+    assert cache_store.get_cache_stats()["disk"]["hits"] == 0
+
+    cache_store.get_memory_tier().clear()
+    assert cache_store.get_cached_json("web|q=hot", ttl_seconds=60) == ["a"]
+    assert cache_store.get_cached_json("web|q=hot", ttl_seconds=60) == ["a"]
+    stats = cache_store.get_cache_stats()
+    assert stats["disk"]["hits"] == 1
+    assert stats["memory"] == {"hits": 2, "misses": 1, "entries": 1, "bytes": 5}
+
+
+@pytest.mark.asyncio
+async def test_upstream_status_reports_cache_tiers(cache_dir):
+    cache_dir("sqlite")
+    cache_store.set_cached_json("web|q=hot", ["a"], kind="web")
+    cache_store.get_cached_json("web|q=hot", ttl_seconds=60)
+
+    status = await get_upstream_status()
+
+    assert status["cache"]["memory"]["hits"] == 1 and "disk" in status["cache"]
+
+
+def test_memory_tier_respects_byte_budget():
+    """The least recently used entries are dropped once the budget is exceeded."""
+    tier = cache_store.MemoryTier(max_bytes=10)
+    tier.set("a", time.time(), "a", 4)
+    tier.set("b", time.time(), "b", 4)
+    tier.get("a", 60)
+    tier.set("c", time.time(), "c", 4)
+
+    assert tier.get("b", 60) is None
+    assert tier.get("a", 60) == "a"
+    assert tier.current_bytes == 8
+    tier.set("huge", time.time(), "x", 11)
+    assert tier.get("huge", 60) is None
+
+
+@pytest.mark.asyncio
+async def test_async_api_batches_writes(cache_dir, monkeypatch):
+    """Async writes are coalesced into one backend call off the event loop."""
+    cache_dir("sqlite")
+    monkeypatch.setattr(cache_store, "get_memory_tier", lambda: None)
+    writer = cache_store.CacheWriter(delay_seconds=0.01)
+    monkeypatch.setattr(cache_store, "get_cache_writer", lambda: writer)
+    backend = cache_store.get_cache_backend()
+    calls = []
+    original = backend.set_many
+    monkeypatch.setattr(backend, "set_many", lambda items: calls.append(items) or original(items))
+
+    for i in range(5):
+        await cache_store.aset_cached_json(f"web|q={i}", [i], kind="web")
+    # Pending writes are already visible to readers.
+    assert await cache_store.aget_cached_json("web|q=3", ttl_seconds=60) == [3]
+
+    await writer.flush()
+    assert len(calls) == 1 and len(calls[0]) == 5
+    assert await cache_store.aget_cached_json("web|q=4", ttl_seconds=60) == [4]
+    assert cache_store.get_cache_stats()["disk"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reset_discards_unflushed_writes(cache_dir):
+    """A reset backend starts empty: queued writes are neither served nor flushed into it."""
+    cache_dir("sqlite")
+    await cache_store.aset_cached_json("web|q=old", ["old"], kind="web", memory=False)
+    cache_store.reset_cache_backend()
+
+    assert await cache_store.aget_cached_json("web|q=old", ttl_seconds=60) is None
+    await cache_store.get_cache_writer().flush()
+    await asyncio.sleep(0.05)
+    assert cache_store.get_cache_backend().get(cache_store._key_hash("web|q=old")) is None
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_window(cache_dir):
+    """Entries past TTL are served as stale within the grace window only."""
+    cache_dir("sqlite")
+    backend = cache_store.get_cache_backend()
+    backend.set_many([(cache_store._key_hash("web|q=old"), time.time() - 120, ["old"], "web")])
+
+    assert await cache_store.aget_cached_json("web|q=old", ttl_seconds=60) is None
+    assert await cache_store.aget_cached_json_swr("web|q=old", 60, 300) == (["old"], True)
+    assert await cache_store.aget_cached_json_swr("web|q=old", 60, 30) == (None, False)
+    assert await cache_store.aget_cached_json_swr("web|q=old", 600, 0) == (["old"], False)
+
+
+def test_compact_encoding_roundtrip_and_legacy_rows(cache_dir):
+    """Values are stored compressed behind a version header; plain JSON rows still load."""
+    results = [
+        {"title": f"Ergebnis {i} – Überblick", "url": f"https://example.org/{i}"} for i in range(20)
+    ]
+    encoded = cache_store.encode_value(results, "zlib")
+    assert encoded[:3] == cache_store.ENCODING_MAGIC
+    assert len(encoded) < len(json.dumps(results, ensure_ascii=False, indent=2).encode())
+    assert cache_store.decode_value(encoded) == results
+    assert cache_store.decode_value(cache_store.encode_value("tiny", "zlib")) == "tiny"
+
+    cache_dir("sqlite")
+    backend = cache_store.get_cache_backend()
+    with backend._lock:
+        backend._conn.execute(
+            "INSERT INTO entries (key, ts, value) VALUES (?, ?, ?)",
+            ("legacy", time.time(), json.dumps(results, ensure_ascii=False)),
+        )
+    assert backend.get("legacy")[1] == results
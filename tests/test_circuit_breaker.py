@@ -0,0 +1,114 @@
+"""Tests for per-upstream circuit breakers."""
+
+import asyncio
+import time
+
+import pytest
+
+from mcp_search_server.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+def test_opens_on_error_rate_and_recovers_through_probe():
+    """The circuit opens past the error rate, fails fast, then closes after a good probe."""
+    breaker = CircuitBreaker("ddg", failure_rate=0.5, min_calls=4, open_seconds=0.05)
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED  # fewer than min_calls outcomes
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    assert breaker.is_open()
+
+    time.sleep(0.06)
+    assert not breaker.is_open()
+    assert breaker.allow()  # the single probe
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["opened"] == 1
+
+
+def test_failed_probe_reopens():
+    """A failing half-open probe opens the circuit for another period."""
+    breaker = CircuitBreaker("reddit", min_calls=1, open_seconds=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.snapshot()["opened"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_fails_fast_when_open(monkeypatch):
+    """rate_limit() raises for an upstream whose breaker opened on 5xx responses."""
+    from mcp_search_server import circuit_breaker, utils
+
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    for _ in range(5):
+        utils.rate_feedback("https://down.example.com/x", 500)
+
+    with pytest.raises(CircuitOpenError):
+        await utils.rate_limit("web_parser", "https://down.example.com/y")
+    states = circuit_breaker.get_circuit_breaker_states()
+    assert states["down.example.com"]["state"] == OPEN
+
+
+def test_timeouts_from_the_callers_deadline_do_not_count(monkeypatch):
+    """Only timeouts the upstream caused count against its breaker."""
+    from mcp_search_server import circuit_breaker, deadline, utils
+
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    with deadline.deadline_scope(0):
+        utils.upstream_error("https://slow.example.com/x", asyncio.TimeoutError())
+    breaker = circuit_breaker.get_circuit_breaker("slow.example.com")
+    assert breaker.snapshot()["recent_failures"] == 0
+
+    utils.upstream_error("https://slow.example.com/x", asyncio.TimeoutError())
+    assert breaker.snapshot()["recent_failures"] == 1
+
+
+def test_probe_that_never_reports_is_reclaimed():
+    """A silent half-open probe frees its slot after open_seconds."""
+    breaker = CircuitBreaker("silent", min_calls=1, open_seconds=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()  # the probe goes out and is never heard from again
+    assert breaker.is_open() and not breaker.allow()
+    assert 0 < breaker.retry_in() <= 0.05
+
+    time.sleep(0.06)
+    assert not breaker.is_open()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_probe_of_finished_task_is_reclaimed():
+    """A probe whose task ended without an outcome (e.g. cancelled) is freed at once."""
+    breaker = CircuitBreaker("cancelled", min_calls=1, open_seconds=0.01)
+    breaker.record_failure()
+    await asyncio.sleep(0.02)
+
+    async def probe():
+        assert breaker.allow()
+        breaker.open_seconds = 60  # only the finished task can free the slot now
+        await asyncio.sleep(10)
+
+    task = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+    assert not breaker.allow()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert breaker.allow()
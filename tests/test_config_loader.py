@@ -0,0 +1,23 @@
+"""Tests for search_config.json loading."""
+
+import json
+
+from mcp_search_server import config_loader
+
+
+def test_partial_user_sections_keep_nested_defaults(tmp_path, monkeypatch):
+    """A user section overrides only the keys it sets; other defaults survive."""
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "search_config.json").write_text(
+        json.dumps({"cache": {"ttl_seconds": {"web": 60}}, "rss_sources": ["https://a/feed"]})
+    )
+    monkeypatch.setattr(config_loader, "_project_root", lambda: tmp_path)
+    config_loader.load_search_config.cache_clear()
+    try:
+        assert config_loader.get_cache_ttl_seconds("web") == 60
+        assert config_loader.get_cache_ttl_seconds("scoreboard") == 2592000
+        assert config_loader.get_cache_stale_grace_seconds("web") > 0
+        assert config_loader.get_cache_memory_max_bytes() > 0
+        assert config_loader.load_search_config()["rss_sources"] == ["https://a/feed"]
+    finally:
+        config_loader.load_search_config.cache_clear()
@@ -0,0 +1,67 @@
+"""Tests for tool call deadline budgets."""
+
+import asyncio
+import threading
+
+import pytest
+
+from mcp_search_server import deadline
+
+
+def test_nested_scope_cannot_extend_deadline():
+    """An inner scope keeps the earlier deadline and shares partial results."""
+    assert deadline.remaining() is None and deadline.clamp(30) == 30
+
+    with deadline.deadline_scope(5) as outer:
+        with deadline.deadline_scope(60) as inner:
+            assert inner.remaining() <= 5
+            assert deadline.clamp(30) <= 5
+            deadline.add_partial("a", 1)
+        assert outer.partial == {"a": 1}
+        assert not deadline.has_time_for(10)
+
+
+@pytest.mark.asyncio
+async def test_executor_work_sees_deadline_and_cancellation():
+    """Worker threads inherit the budget and learn when their caller is cancelled."""
+    started, stopped = threading.Event(), threading.Event()
+
+    def blocking():
+        started.set()
+        try:
+            while True:
+                deadline.check("loop")
+                threading.Event().wait(0.01)
+        finally:
+            stopped.set()
+
+    with deadline.deadline_scope(30):
+        assert await deadline.run_in_executor(deadline.remaining) <= 30
+        task = asyncio.ensure_future(deadline.run_in_executor(blocking))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert await asyncio.get_running_loop().run_in_executor(None, stopped.wait, 2)
+
+
+@pytest.mark.asyncio
+async def test_call_returns_partial_results_on_timeout(monkeypatch):
+    """A tool that runs out of time returns what it offered; without partials it errors."""
+    from mcp_search_server import server
+
+    monkeypatch.setattr(server, "get_tool_timeout_seconds", lambda name: 0.05)
+
+    class SlowTool:
+        async def execute(self, offer=True):
+            if offer:
+                deadline.add_partial("https://example.com", {"content": "first part"})
+            await asyncio.sleep(10)
+
+    result = await server._execute_with_deadline(SlowTool(), "slow", {})
+    assert result["partial"] is True
+    assert result["results"] == {"https://example.com": {"content": "first part"}}
+
+    with pytest.raises(TimeoutError):
+        await server._execute_with_deadline(SlowTool(), "slow", {"offer": False})
@@ -0,0 +1,91 @@
+"""Tests for the shared, limit-aware DuckDuckGo result cache."""
+
+import hashlib
+
+import pytest
+
+from mcp_search_server import cache_store
+from mcp_search_server.tools.web import duckduckgo, unified_search
+
+
+def _results(n):
+    return [
+        {
+            "title": hashlib.md5(str(i).encode()).hexdigest(),
+            "url": f"https://site{i}.example/{i}",
+            "snippet": "",
+            "source": "duckduckgo",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def fake_ddg(monkeypatch):
+    """Route DDG calls to a fake upstream with `available` results and a fresh cache."""
+    monkeypatch.setattr(cache_store, "get_cache_backend_name", lambda: "sqlite")
+    cache_store.reset_cache_backend()
+    calls = []
+
+    async def search(query, max_results=10, timelimit=None, safesearch="moderate"):
+        calls.append(max_results)
+        return _results(min(max_results, fake_ddg_available[0]))
+
+    fake_ddg_available = [100]
+    monkeypatch.setattr(duckduckgo._ddg_tool, "search", search)
+    yield calls, fake_ddg_available
+
+
+@pytest.mark.asyncio
+async def test_smaller_requests_served_from_superset(fake_ddg):
+    """A larger cached fetch answers smaller requests from both tools."""
+    calls, _ = fake_ddg
+
+    assert len(await duckduckgo.search_duckduckgo("python", limit=10)) == 10
+    assert len(await unified_search.search_web("python", limit=5)) == 5
+    assert len(await duckduckgo.search_duckduckgo("python", limit=3)) == 3
+    assert calls == [20]
+
+    # A larger request fetches again and the entry grows.
+    assert len(await unified_search.search_web("python", limit=15)) == 15
+    assert calls == [20, 30]
+
+
+@pytest.mark.asyncio
+async def test_exhausted_upstream_is_not_refetched(fake_ddg):
+    """When DDG returns fewer than asked, larger requests reuse the entry."""
+    calls, available = fake_ddg
+    available[0] = 4
+
+    assert len(await duckduckgo.search_duckduckgo("rare", limit=5)) == 4
+    assert len(await duckduckgo.search_duckduckgo("rare", limit=50)) == 4
+    assert calls == [10]
+
+
+@pytest.mark.asyncio
+async def test_failed_refetch_does_not_mark_exhausted(fake_ddg):
+    """A larger request whose re-fetch fails keeps the entry open for a later retry."""
+    calls, available = fake_ddg
+
+    assert len(await duckduckgo.search_duckduckgo("python", limit=5)) == 5
+    available[0] = 0  # upstream error / rate limit: no results
+    assert len(await duckduckgo.search_duckduckgo("python", limit=20)) == 10
+    available[0] = 100
+    assert len(await duckduckgo.search_duckduckgo("python", limit=20)) == 20
+    assert calls == [10, 40, 40]
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_engine(fake_ddg, monkeypatch):
+    """SearchManager does not call DuckDuckGo while its circuit is open."""
+    from mcp_search_server import circuit_breaker
+    from mcp_search_server.tools.search_manager import SearchManager
+
+    calls, _ = fake_ddg
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    breaker = circuit_breaker.get_circuit_breaker("duckduckgo")
+    for _ in range(breaker.min_calls):
+        breaker.record_failure()
+
+    assert await SearchManager().search("python", max_results=5) is None
+    assert calls == []
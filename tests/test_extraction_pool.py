@@ -0,0 +1,35 @@
+"""Tests for the process/thread executor of the HTML extractors."""
+
+import pytest
+
+from mcp_search_server.tools.web import extraction_pool
+from mcp_search_server.tools.web.extraction_pool import ExtractionExecutor
+from mcp_search_server.tools.web.link_parser import FetchedPage, _parse_bs4
+
+HTML = "<html><body><article><p>Привет, мир! Это тестовая статья.</p></article></body></html>"
+
+
+def test_auto_mode_follows_core_count(monkeypatch):
+    """Small machines keep threads; larger ones get one process per spare core."""
+    monkeypatch.setattr(extraction_pool.os, "cpu_count", lambda: 2)
+    assert ExtractionExecutor("auto", process_min_cpus=4).mode == "thread"
+
+    monkeypatch.setattr(extraction_pool.os, "cpu_count", lambda: 8)
+    executor = ExtractionExecutor("auto", process_min_cpus=4)
+    assert executor.mode == "process"
+    assert executor.workers == 7
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["thread", "process"])
+async def test_extractor_gets_page_decoded_with_its_charset(mode):
+    """Raw bytes in a non-UTF-8 charset are decoded once, in the worker."""
+    page = FetchedPage(url="https://example.com/", body=HTML.encode("cp1251"), charset="cp1251")
+    executor = ExtractionExecutor(mode, workers=1)
+    try:
+        content = await executor.run(_parse_bs4, page, page.url)
+    finally:
+        executor.shutdown()
+
+    assert content == "Привет, мир! Это тестовая статья."
+    assert executor.stats[f"{mode}_jobs"] == 1
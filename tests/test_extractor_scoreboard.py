@@ -0,0 +1,138 @@
+"""Tests for the per-domain extractor scoreboard."""
+
+import pytest
+
+from mcp_search_server import cache_store
+from mcp_search_server.tools.web import extractor_scoreboard, link_parser
+from mcp_search_server.tools.web.extraction_pool import ExtractionExecutor
+from mcp_search_server.tools.web.extractor_scoreboard import ExtractorScoreboard, domain_of
+
+METHODS = ["trafilatura", "readability", "newspaper", "bs4"]
+
+
+def test_order_follows_learned_success_and_decays(monkeypatch):
+    """A method that keeps winning moves first; the lead fades with age."""
+    board = ExtractorScoreboard(half_life_seconds=3600, min_samples=3)
+    now = [1_000_000.0]
+    monkeypatch.setattr(extractor_scoreboard.time, "time", lambda: now[0])
+
+    assert board.order("example.com", METHODS) == METHODS
+    for _ in range(4):
+        board.record("example.com", "trafilatura", False, 50, 0)
+        board.record("example.com", "readability", False, 40, 0)
+        board.record("example.com", "bs4", True, 10, 900)
+
+    assert board.order("example.com", METHODS) == ["bs4", "newspaper", "readability", "trafilatura"]
+    assert board.snapshot("https://www.example.com/x")["example.com"]["methods"]["bs4"] == {
+        "samples": 4.0,
+        "success_rate": 1.0,
+        "avg_latency_ms": 10,
+        "avg_chars": 900,
+    }
+
+    # Two half-lives later the samples fall below min_samples: back to the prior
+    now[0] += 2 * 3600
+    assert board.order("example.com", METHODS) == METHODS
+
+
+def test_blocked_domains_go_browser_first():
+    board = ExtractorScoreboard(min_samples=3, block_threshold=0.8)
+    for _ in range(2):
+        board.record_blocked("shop.example", True)
+    assert not board.browser_first("shop.example")
+
+    board.record_blocked("shop.example", True)
+    assert board.browser_first("shop.example")
+
+    board.record_blocked("shop.example", False)
+    assert not board.browser_first("shop.example")
+
+
+@pytest.mark.asyncio
+async def test_scores_persist_across_restarts():
+    board = ExtractorScoreboard(min_samples=1)
+    await board.load("example.com")
+    board.record("example.com", "newspaper", True, 30, 1200)
+    await board.save("example.com")
+    await cache_store.get_cache_writer().flush()
+
+    restarted = ExtractorScoreboard(min_samples=1)
+    await restarted.load("example.com")
+
+    assert restarted.order("example.com", METHODS)[0] == "newspaper"
+
+
+@pytest.mark.asyncio
+async def test_load_keeps_outcomes_recorded_while_reading(monkeypatch):
+    board = ExtractorScoreboard(min_samples=1)
+    await board.load("example.com")
+    board.record("example.com", "bs4", True, 10, 500)
+    await board.save("example.com")
+    await cache_store.get_cache_writer().flush()
+
+    restarted = ExtractorScoreboard(min_samples=1)
+    read = extractor_scoreboard.aget_cached_json
+
+    async def slow_read(*args, **kwargs):
+        data = await read(*args, **kwargs)
+        restarted.record("example.com", "newspaper", True, 20, 800)
+        return data
+
+    monkeypatch.setattr(extractor_scoreboard, "aget_cached_json", slow_read)
+    await restarted.load("example.com")
+
+    assert set(restarted.snapshot("example.com")["example.com"]["methods"]) == {"bs4", "newspaper"}
+
+
+@pytest.mark.asyncio
+async def test_save_after_eviction_keeps_persisted_history(monkeypatch):
+    """A domain dropped from memory mid-chain does not overwrite its history on disk."""
+    monkeypatch.setattr(extractor_scoreboard, "MAX_DOMAINS", 1)
+    board = ExtractorScoreboard(min_samples=1)
+    await board.load("example.com")
+    board.record("example.com", "bs4", True, 10, 500)
+    await board.save("example.com")
+
+    await board.load("other.example")  # Evicts example.com
+    board.record("example.com", "newspaper", True, 20, 800)
+    await board.save("example.com")
+    await cache_store.get_cache_writer().flush()
+
+    restarted = ExtractorScoreboard(min_samples=1)
+    await restarted.load("example.com")
+
+    assert set(restarted.snapshot("example.com")["example.com"]["methods"]) == {"bs4", "newspaper"}
+
+
+@pytest.mark.asyncio
+async def test_chain_runs_methods_in_learned_order(monkeypatch):
+    """The extraction chain asks the scoreboard for its order and records outcomes."""
+    board = ExtractorScoreboard(min_samples=1)
+    board.record("news.example", "newspaper", True, 20, 800)
+    monkeypatch.setattr(link_parser, "get_extractor_scoreboard", lambda: board)
+    monkeypatch.setattr(board, "load", _no_load)
+    monkeypatch.setattr(
+        link_parser, "get_extraction_executor", lambda: ExtractionExecutor(executor="thread")
+    )
+    calls = []
+
+    def fake_parser(name):
+        def parse(document, url):
+            calls.append(name)
+            return "x" * 600 if name == "newspaper" else "Error: nothing"
+
+        return parse
+
+    for name in link_parser.HTML_PARSERS:
+        monkeypatch.setitem(link_parser.HTML_PARSERS, name, fake_parser(name))
+    page = link_parser.FetchedPage(url="https://news.example/a", body=b"<html></html>")
+
+    content, method = await link_parser._run_extraction_chain(page.url, page, None, {})
+
+    assert method == "newspaper" and calls == ["newspaper"]
+    assert board.snapshot("news.example")["news.example"]["methods"]["newspaper"]["samples"] == 2
+    assert domain_of("https://WWW.News.Example/a") == "news.example"
+
+
+async def _no_load(domain):
+    return None
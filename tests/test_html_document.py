@@ -0,0 +1,69 @@
+"""Tests for the shared lxml document used by the HTML extractors."""
+
+from mcp_search_server.tools.web.html_document import HtmlDocument
+from mcp_search_server.tools.web.link_parser import (
+    FetchedPage,
+    _newspaper_parse_html,
+    _parse_bs4,
+    _readability_parse,
+    _trafilatura_parse,
+)
+
+ARTICLE = (
+    "<html><head><title>Shared</title><script>var tracking = 1;</script></head><body>"
+    "<nav><p>Home and other navigation links</p></nav><article>"
+    + "".join(
+        f"<p>Paragraph {i} of an article that is long enough for every extractor to keep it.</p>"
+        for i in range(12)
+    )
+    + "</article></body></html>"
+)
+
+
+def test_tree_uses_charset_and_survives_invalid_bytes():
+    """The charset is the encoding hint; bytes invalid in it do not truncate the page."""
+    cp1251 = HtmlDocument("<p>Привет, мир</p>".encode("cp1251"), "cp1251")
+    assert cp1251.tree.findtext(".//p") == "Привет, мир"
+
+    broken = HtmlDocument(b"<p>before \xff\xfe</p><p>after</p>", "utf-8")
+    assert [p.text_content() for p in broken.tree.iter("p")][-1] == "after"
+
+    unknown = HtmlDocument("<p>héllo</p>".encode("utf-8"), "x-no-such-charset")
+    assert unknown.tree.findtext(".//p") == "héllo"
+
+    assert HtmlDocument(b"").tree.tag == "html"
+
+
+def test_extractors_share_one_tree_without_modifying_it():
+    """Every extractor reads the page's single parse; the shared tree stays intact."""
+    page = FetchedPage(url="https://example.com/a", body=ARTICLE.encode("utf-8"), charset="utf-8")
+    document = page.document
+    tree = document.tree
+
+    outputs = [
+        _trafilatura_parse(document, page.url)[0],
+        _readability_parse(document),
+        _newspaper_parse_html(document, page.url),
+        _parse_bs4(document, page.url),
+    ]
+
+    assert page.document is document and document.tree is tree
+    assert all("Paragraph 11 of an article" in output for output in outputs)
+    assert "navigation" not in outputs[-1]
+    assert tree.findtext(".//script") == "var tracking = 1;"
+    assert tree.find(".//nav") is not None
+
+
+def test_newspaper_parses_fragments_itself():
+    """Only the page comes from the shared tree; the cleaner's fragments are parsed."""
+    body = (
+        "<html><body><article><div>Loose text before the first paragraph of this story. "
+        f"<p>{'A first real paragraph of the article with plenty of words in it. ' * 3}</p>"
+        "more text between <a href='/x'>a link</a> and the next paragraph."
+        f"<p>{'The second paragraph of the story also has many words for the scorer. ' * 3}</p>"
+        "</div></article></body></html>"
+    )
+
+    content = _newspaper_parse_html(HtmlDocument(body.encode("utf-8")), "https://example.com/a")
+
+    assert "second paragraph of the story" in content
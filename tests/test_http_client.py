@@ -0,0 +1,69 @@
+"""Tests for the shared pooled HTTP client."""
+
+import aiohttp
+import pytest
+
+from mcp_search_server.http_client import HttpClientManager, get_ssl_context
+
+
+def test_ssl_context_is_shared():
+    """The certifi bundle is loaded once per process."""
+    assert get_ssl_context() is get_ssl_context()
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_until_closed():
+    """Callers share one pooled session; close() releases it."""
+    client = HttpClientManager(limit=5, limit_per_host=2)
+
+    first = await client.get_session()
+    second = await client.get_session()
+
+    assert first is second
+    assert client.started
+    assert first.connector.limit_per_host == 2
+    assert isinstance(first.cookie_jar, aiohttp.DummyCookieJar)
+
+    await client.close()
+    assert first.closed
+    assert not client.started
+
+    third = await client.get_session()
+    assert third is not first
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_revalidates_with_etag():
+    """A stored body is revalidated with If-None-Match and reused on 304."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    from mcp_search_server import http_client
+
+    sent = []
+
+    async def feed(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            sent.append(0)
+            return web.Response(status=304)
+        body = "<rss>hello</rss>"
+        sent.append(len(body))
+        return web.Response(text=body, content_type="application/rss+xml", headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/feed", feed)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    try:
+        url = str(server.make_url("/feed"))
+        first = await http_client.conditional_get(url)
+        second = await http_client.conditional_get(url)
+        third = await http_client.conditional_get(url, max_age=60)
+    finally:
+        await server.close()
+        await http_client.get_http_client().close()
+
+    assert first.text() == second.text() == third.text() == "<rss>hello</rss>"
+    assert not first.from_cache and second.from_cache and third.from_cache
+    assert sent == [16, 0]
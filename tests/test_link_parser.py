@@ -0,0 +1,211 @@
+"""Tests for the link parser extraction pipeline."""
+
+import contextlib
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from mcp_search_server import cache_store, deadline
+from mcp_search_server.tools.web import link_parser
+from mcp_search_server.tools.web.extraction_pool import ExtractionExecutor
+
+ARTICLE_HTML = """<html><head><meta charset="utf-8"><title>Test page</title></head>
+<body><nav>Menu</nav><article>
+<p>This paragraph is long enough to be kept by every extractor in the chain.</p>
+<p>Short.</p>
+</article></body></html>"""
+
+
+@contextlib.asynccontextmanager
+async def page_server():
+    """Local HTTP server that counts how many times each page is downloaded."""
+    hits = {"count": 0}
+
+    async def article(request):
+        hits["count"] += 1
+        return web.Response(text=ARTICLE_HTML, content_type="text/html", charset="utf-8")
+
+    async def missing(request):
+        hits["count"] += 1
+        return web.Response(status=404, text="gone")
+
+    app = web.Application()
+    app.router.add_get("/article", article)
+    app.router.add_get("/missing", missing)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    try:
+        yield server, hits
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_keeps_bytes_headers_and_charset():
+    """A fetched page exposes raw bytes, headers and a decoded view."""
+    async with page_server() as (server, _):
+        page, error = await link_parser.fetch_page_for_extraction(str(server.make_url("/article")))
+
+    assert error is None
+    assert page.body == ARTICLE_HTML.encode("utf-8")
+    assert page.charset == "utf-8"
+    assert "text/html" in page.content_type
+    assert "long enough" in page.text
+
+
+@pytest.mark.asyncio
+async def test_throttled_response_is_reported_once(monkeypatch):
+    """A 429 reaches the rate control and circuit breaker once, not twice."""
+    reported = []
+    monkeypatch.setattr(
+        link_parser, "rate_feedback", lambda url, status, *a, **kw: reported.append(status)
+    )
+    statuses = [429, 200]
+
+    async def flaky(request):
+        status = statuses.pop(0)
+        return web.Response(status=status, text=ARTICLE_HTML, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/flaky", flaky)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    try:
+        page, error = await link_parser.fetch_page_for_extraction(str(server.make_url("/flaky")))
+    finally:
+        await server.close()
+
+    assert error is None and page.status == 200
+    assert reported == [429, 200]
+
+
+@pytest.mark.asyncio
+async def test_compare_methods_downloads_once(monkeypatch):
+    """The whole extractor chain runs from a single download, in one extraction job."""
+    jobs = []
+
+    class CountingExecutor(ExtractionExecutor):
+        async def run(self, fn, page, *args):
+            jobs.append(fn.__name__)
+            return await super().run(fn, page, *args)
+
+    executor = CountingExecutor(executor="thread")
+    monkeypatch.setattr(link_parser, "get_extraction_executor", lambda: executor)
+    timings = {}
+    async with page_server() as (server, hits):
+        content, method = await link_parser.compare_methods_async(
+            str(server.make_url("/article")), timings=timings
+        )
+
+    assert hits["count"] == 1
+    assert jobs == ["_run_html_chain"]
+    assert "long enough" in content
+    assert method != "failed"
+    assert "fetch" in timings
+    assert "readability" in timings
+
+
+@pytest.mark.asyncio
+async def test_failed_extraction_is_negatively_cached():
+    """A 404 is remembered, so a repeat request does no network work."""
+    assert (
+        link_parser.classify_failure("Error after 3 attempts: HTTP 404: Not Found") == "not_found"
+    )
+    assert link_parser.classify_failure("Error after 3 attempts: Timeout") == "timeout"
+    assert link_parser.classify_failure("Error: parser crashed") is None
+
+    async with page_server() as (server, hits):
+        url = str(server.make_url("/missing"))
+        first = await link_parser.extract_content_from_url(url)
+        second = await link_parser.extract_content_from_url(url)
+
+    assert first.startswith("Error") and "404" in first
+    assert second == first
+    assert hits["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_from_the_callers_deadline_is_not_cached():
+    """A fetch cut short by the call's own budget does not mark the URL as timing out."""
+    error = "Error after 3 attempts: Timeout"
+    with deadline.deadline_scope(0):
+        await link_parser._remember_failure("https://a/short", error)
+    await link_parser._remember_failure("https://a/slow", error)
+
+    assert await link_parser.get_cached_failure("https://a/short") is None
+    assert await link_parser.get_cached_failure("https://a/slow") == error
+
+
+@pytest.mark.asyncio
+async def test_article_cache_is_bounded_and_persistent(monkeypatch):
+    """Articles are kept within the byte budget and reloaded from disk after eviction."""
+    monkeypatch.setattr(link_parser, "_content_cache", cache_store.MemoryTier(max_bytes=3000))
+    for i in range(3):
+        article = link_parser.ArticleMetadata(content="x" * 1200, url=f"https://a/{i}", title="T")
+        await link_parser._set_cache(article.url, article)
+    assert link_parser._content_cache.current_bytes <= 3000
+    assert len(link_parser._content_cache) == 2
+
+    # Simulate a restart: empty memory, entries come back from disk.
+    await cache_store.get_cache_writer().flush()
+    link_parser._content_cache.clear()
+    restored = await link_parser._get_from_cache("https://a/0")
+
+    assert restored == link_parser.ArticleMetadata(content="x" * 1200, url="https://a/0", title="T")
+    assert link_parser._content_cache.get(link_parser._get_cache_key("https://a/0"), 60)
+
+
+@pytest.mark.asyncio
+async def test_batch_extraction_limits_hosts_and_reports_progress(monkeypatch):
+    """Batch results carry method, timing and error, and each completion is reported."""
+    monkeypatch.setattr(
+        link_parser,
+        "get_batch_extraction_config",
+        lambda: {"max_urls": 3, "concurrency": 4, "per_host": 1},
+    )
+    progress = []
+
+    async def fake_progress(done, total, message=""):
+        progress.append((done, total, message))
+        return True
+
+    monkeypatch.setattr(link_parser, "report_progress", fake_progress)
+    async with page_server() as (server, hits):
+        urls = [
+            str(server.make_url("/article?a=1")),
+            str(server.make_url("/missing")),
+            str(server.make_url("/article?a=1")),
+            str(server.make_url("/article?a=2")),
+            str(server.make_url("/article?a=3")),
+        ]
+        batch = await link_parser.extract_contents_from_urls(urls)
+
+    assert batch["total"] == 3 and batch["succeeded"] == 2 and batch["failed"] == 1
+    assert batch["skipped"] == [urls[4]]
+    by_url = {entry["url"]: entry for entry in batch["results"]}
+    assert "long enough" in by_url[urls[0]]["content"]
+    assert by_url[urls[0]]["method"] != "failed" and by_url[urls[0]]["error"] is None
+    assert "404" in by_url[urls[1]]["error"] and by_url[urls[1]]["content"] is None
+    assert all(entry["elapsed_ms"] >= 0 for entry in batch["results"])
+    assert [done for done, _, _ in progress] == [1, 2, 3]
+    assert all(total == 3 for _, total, _ in progress)
+
+
+@pytest.mark.asyncio
+async def test_batch_extraction_keeps_results_when_one_url_raises(monkeypatch):
+    async def fake_extract(url):
+        if url.endswith("/bad"):
+            raise RuntimeError("extractor crashed")
+        return "x" * 600, "trafilatura"
+
+    monkeypatch.setattr(link_parser, "_extract_with_method", fake_extract)
+    urls = ["https://a.example/bad", "https://b.example/good"]
+
+    batch = await link_parser.extract_contents_from_urls(urls)
+
+    by_url = {entry["url"]: entry for entry in batch["results"]}
+    assert batch["succeeded"] == 1 and batch["failed"] == 1
+    assert by_url[urls[0]]["error"] == "extractor crashed"
+    assert by_url[urls[0]]["method"] == "failed" and by_url[urls[0]]["elapsed_ms"] >= 0
+    assert by_url[urls[1]]["content"] == "x" * 600
@@ -0,0 +1,63 @@
+"""Tests for the streaming page preview used by result enrichment."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from mcp_search_server import http_client
+from mcp_search_server.tools.web.page_preview import PreviewParser, fetch_preview
+
+LEAD = "The opening paragraph explains what this long article is about in detail."
+
+PAGE = (
+    "<html><head><title>Long article</title>"
+    '<meta name="description" content="A short summary of the article.">'
+    "</head><body><nav><p>Home | About | Contact | Subscribe to the newsletter today</p></nav>"
+    f"<p>{LEAD}</p>"
+    + "".join(
+        f"<p>Paragraph {i} of the body that nobody needs for a preview.</p>" for i in range(5000)
+    )
+    + "</body></html>"
+)
+
+
+def test_parser_collects_metadata_and_lead():
+    """Navigation text is skipped and the parser is done after the lead."""
+    parser = PreviewParser(max_chars=600)
+    parser.feed(PAGE[:4096])
+    preview = parser.preview("https://example.com/a", 4096)
+
+    assert parser.done
+    assert preview.title == "Long article"
+    assert preview.description == "A short summary of the article."
+    assert preview.paragraphs[0] == LEAD
+    assert preview.text(600).startswith(f"A short summary of the article.\n\n{LEAD}")
+    assert preview.text(20) == "A short summary of t..."
+
+
+@pytest.mark.asyncio
+async def test_fetch_preview_stops_reading_early():
+    """Only the start of a large page is downloaded; non-HTML is rejected."""
+
+    async def article(request):
+        return web.Response(text=PAGE, content_type="text/html")
+
+    async def data(request):
+        return web.Response(text='{"a": 1}', content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/article", article)
+    app.router.add_get("/data", data)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    try:
+        preview, error = await fetch_preview(str(server.make_url("/article")), max_chars=300)
+        missing, reason = await fetch_preview(str(server.make_url("/data")))
+    finally:
+        await server.close()
+        await http_client.get_http_client().close()
+
+    assert error is None
+    assert LEAD in preview.text(300)
+    assert preview.bytes_read < len(PAGE) // 10
+    assert missing is None and reason.startswith("Non-HTML content")
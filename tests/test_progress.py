@@ -0,0 +1,46 @@
+"""Tests for MCP progress notifications."""
+
+from types import SimpleNamespace
+
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+
+from mcp_search_server.progress import report_progress
+
+
+class OldSession:
+    """A session from an mcp release without `message`/`related_request_id`."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_progress_notification(self, progress_token, progress, total=None):
+        self.sent.append((progress_token, progress, total))
+
+
+class NewSession:
+    def __init__(self):
+        self.sent = []
+
+    async def send_progress_notification(
+        self, progress_token, progress, total=None, message=None, related_request_id=None
+    ):
+        self.sent.append((progress_token, progress, total, message, related_request_id))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "session_type, expected",
+    [(OldSession, ("tok", 1, 3)), (NewSession, ("tok", 1, 3, "one done", "7"))],
+)
+async def test_progress_matches_the_session_signature(session_type, expected):
+    """Older sessions get only the arguments they accept; newer ones also get the message."""
+    session = session_type()
+    ctx = SimpleNamespace(meta=SimpleNamespace(progressToken="tok"), session=session, request_id=7)
+    reset = request_ctx.set(ctx)
+    try:
+        assert await report_progress(1, 3, "one done")
+    finally:
+        request_ctx.reset(reset)
+
+    assert session.sent == [expected]
@@ -0,0 +1,29 @@
+"""Tests for RSS feed parsing."""
+
+import pytest
+from multidict import CIMultiDict
+
+from mcp_search_server.http_client import HttpResponse
+from mcp_search_server.tools.web.rss_tool import _parse_feed_cached
+
+
+@pytest.mark.asyncio
+async def test_feed_encoding_comes_from_the_xml_prolog():
+    """A windows-1251 feed without an HTTP charset is decoded by its prolog."""
+    feed = (
+        '<?xml version="1.0" encoding="windows-1251"?>'
+        "<rss version='2.0'><channel><title>Новости</title>"
+        "<item><title>Привет, мир</title><link>https://example.com/1</link></item>"
+        "</channel></rss>"
+    ).encode("windows-1251")
+    resp = HttpResponse(
+        url="https://example.com/feed",
+        status=200,
+        body=feed,
+        headers=CIMultiDict({"Content-Type": "application/rss+xml"}),
+    )
+
+    parsed = await _parse_feed_cached(resp.url, resp)
+
+    assert parsed.feed.title == "Новости"
+    assert parsed.entries[0].title == "Привет, мир"
@@ -0,0 +1,102 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from mcp_search_server import deadline
+from mcp_search_server.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    """Identical concurrent keys run the factory once; other keys run separately."""
+    flight = SingleFlight("test")
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return [key]
+
+    results = await asyncio.gather(
+        *[flight.do("a", lambda: fetch("a")) for _ in range(5)],
+        flight.do("b", lambda: fetch("b")),
+    )
+
+    assert calls == ["a", "b"]
+    assert results == [["a"]] * 5 + [["b"]]
+    assert flight.stats == {"leaders": 2, "shared": 4, "refreshes": 0}
+    assert not flight.in_flight("a")
+
+    await flight.do("a", lambda: fetch("a"))
+    assert calls == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_and_cancellation_is_isolated():
+    """Every waiter sees the failure; cancelling one waiter leaves the call running."""
+    flight = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def fail():
+        await release.wait()
+        raise RuntimeError("upstream down")
+
+    first = asyncio.create_task(flight.do("k", fail))
+    second = asyncio.create_task(flight.do("k", fail))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    with pytest.raises(RuntimeError, match="upstream down"):
+        await second
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_refresh_runs_in_background_once():
+    """A refresh does not block the caller and joins an in-flight call."""
+    flight = SingleFlight("test")
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return "fresh"
+
+    flight.refresh("k", fetch)
+    flight.refresh("k", fetch)
+    waiter = asyncio.create_task(flight.do("k", fetch))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == "fresh"
+    assert len(calls) == 1
+    assert flight.stats["refreshes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_call_does_not_inherit_the_leaders_deadline():
+    """A short-deadline leader does not cut the shared call short for other callers."""
+    flight = SingleFlight("test")
+    budgets = []
+
+    async def fetch():
+        budgets.append(deadline.remaining())
+        await asyncio.sleep(0.1)
+        return "full"
+
+    async def call(seconds):
+        with deadline.deadline_scope(seconds):
+            return await flight.do("a", fetch)
+
+    leader = asyncio.ensure_future(call(0.02))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(call(5))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await leader
+    assert await follower == "full"
+    assert budgets == [None]
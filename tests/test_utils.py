@@ -10,3 +10,94 @@ async def test_run_parallel_searches():
     # This is a placeholder test
     # In a real scenario, you would mock the actual search functions
     assert callable(run_parallel_searches)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_concurrent_callers():
+    """Concurrent callers share one bucket: the burst goes at once, the rest are spaced."""
+    import asyncio
+
+    from mcp_search_server.utils import RateLimiter
+
+    limiter = RateLimiter(calls_per_second=20.0, burst=2)
+    order = []
+
+    async def call(i):
+        await limiter.acquire("example.com")
+        order.append(i)
+
+    await asyncio.gather(*(call(i) for i in range(6)))
+
+    assert order == list(range(6))
+    stats = limiter.stats()["example.com"]
+    assert stats["calls"] == 6 and stats["waited"] == 4
+    assert stats["wait_max"] == pytest.approx(0.2, abs=0.02)
+    assert limiter.reserve("other.org") == 0.0
+
+
+def test_rate_limiters_are_shared_per_service():
+    """Unknown services get one registered limiter from the default limits."""
+    from mcp_search_server.utils import get_rate_limit_stats, get_rate_limiter
+
+    assert get_rate_limiter("some-new-api") is get_rate_limiter("some-new-api")
+    assert get_rate_limiter("nominatim").calls_per_second == 1.0
+    assert "some-new-api" in get_rate_limit_stats()
+
+
+@pytest.mark.asyncio
+async def test_adaptive_rate_control_backs_off_and_recovers(monkeypatch):
+    """429s halve a host's rate for every service; successes add it back step by step."""
+    from mcp_search_server import utils
+
+    control = utils.AdaptiveRateControl(decrease_factor=0.5, increase_step=0.25)
+    monkeypatch.setattr(utils, "_rate_control", control)
+    monkeypatch.setattr(utils, "rate_limiters", {})
+
+    utils.rate_feedback("https://api.example.com/a", 429, {"Retry-After": "0.1"})
+    utils.rate_feedback("https://api.example.com/b", 503)
+    assert control.factor("api.example.com") == 0.25
+    assert 0 < control.pause_remaining("api.example.com") <= 0.1
+
+    waited = await utils.rate_limit("wikipedia", "https://api.example.com/c")
+    assert waited == pytest.approx(0.1, abs=0.03)
+    # A scaled-down bucket allows no burst
+    github = utils.get_rate_limiter("github")
+    assert github.reserve("api.example.com", control.factor("api.example.com")) == 0.0
+    assert github.reserve("api.example.com", control.factor("api.example.com")) > 0
+
+    for _ in range(3):
+        utils.rate_feedback("https://api.example.com/d", 200)
+    assert control.factor("api.example.com") == 1.0
+    assert utils.get_rate_limit_stats()["adaptive"]["api.example.com"]["throttles"] == 2
+    assert utils.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_paces_to_advertised_budget(monkeypatch):
+    """X-RateLimit-* headers slow a host only once its budget runs low, and pause it at zero."""
+    import time
+
+    from multidict import CIMultiDict
+
+    from mcp_search_server import utils
+
+    control = utils.AdaptiveRateControl()
+    monkeypatch.setattr(utils, "_rate_control", control)
+    monkeypatch.setattr(utils, "rate_limiters", {})
+    reset = str(int(time.time()) + 60)
+
+    utils.rate_feedback(
+        "https://api.github.com/x",
+        200,
+        {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": reset},
+    )
+    assert await utils.rate_limit("github", "https://api.github.com/y") == 0.0
+
+    utils.rate_feedback(
+        "https://api.github.com/x", 200, {"X-RateLimit-Remaining": "6", "X-RateLimit-Reset": reset}
+    )
+    assert control.quota_rate("api.github.com") == pytest.approx(0.1, rel=0.05)
+
+    reddit_headers = CIMultiDict({"X-Ratelimit-Remaining": "0.0", "X-Ratelimit-Reset": "42"})
+    utils.rate_feedback("https://www.reddit.com/r", 200, reddit_headers)
+    assert 41 < control.pause_remaining("www.reddit.com") <= 42